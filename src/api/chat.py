@@ -12,17 +12,8 @@ from typing import Any
 from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field
 
-from src.hael import (
-    Brain,
-    Channel,
-    RuleBasedExtractor,
-    build_hael_command,
-    route_command,
-)
-from src.brains.ops import handle_ops_command
-from src.brains.core import handle_core_command
-from src.brains.revenue import handle_revenue_command
-from src.brains.people import handle_people_command
+from src.hael import Brain, Channel, RuleBasedExtractor
+from src.brains.dispatch import run_hael
 from src.utils.request_id import generate_request_id
 
 logger = logging.getLogger(__name__)
@@ -397,43 +388,19 @@ Please take over this chat conversation.
         extractor = RuleBasedExtractor()
         extraction = extractor.extract(request.user_text)
 
-        # Route to brain
-        routing = route_command(extraction)
-
-        # Build command
-        command = build_hael_command(
-            request_id=request.request_id,
+        # Route, build the command, and run it through its brain
+        command, result = await run_hael(
+            extraction,
             channel=Channel.CHAT,
             raw_text=request.user_text,
-            extraction=extraction,
-            routing=routing,
+            request_id=request.request_id,
             metadata={
                 "session_id": request.session_id,
                 **request.metadata,
             },
         )
 
-        # Route to brain handler
-        if routing.brain == Brain.OPS:
-            result = await handle_ops_command(command)
-            reply = result.message
-            action = "completed" if result.status.value == "success" else "needs_human"
-            data = result.data
-
-        elif routing.brain == Brain.CORE:
-            result = handle_core_command(command)
-            reply = result.message
-            action = "completed" if result.status.value == "success" else "needs_human"
-            data = result.data
-
-        elif routing.brain == Brain.REVENUE:
-            result = handle_revenue_command(command)
-            reply = result.message
-            action = "completed" if result.status.value == "success" else "needs_human"
-            data = result.data
-
-        elif routing.brain == Brain.PEOPLE:
-            result = handle_people_command(command)
+        if result is not None:
             reply = result.message
             action = "completed" if result.status.value == "success" else "needs_human"
             data = result.data
@@ -542,7 +509,7 @@ Please take over this chat conversation.
         # Send lead notification if lead was created (for chat leads)
         if result is not None and action == "completed":
             # Check if lead was created (from OPS brain typically)
-            if routing.brain == Brain.OPS and hasattr(result, "work_order") and result.work_order:
+            if command.brain == Brain.OPS and hasattr(result, "work_order") and result.work_order:
                 try:
                     from src.integrations.email_notifications import send_new_lead_notification
                     from src.config.settings import get_settings
@@ -17,37 +17,50 @@ Key behavior:
 """
 
 import asyncio
-import json
+import hashlib
 import logging
 import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import lru_cache
+from itertools import product
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Request, HTTPException
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException, Response
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.hael import (
-    Brain,
-    Channel,
-    RuleBasedExtractor,
-    build_hael_command,
-    route_command,
-)
-from src.hael.schema import Intent, UrgencyLevel
-from src.brains.ops import handle_ops_command
-from src.brains.core import handle_core_command
+from src.hael import Channel, RuleBasedExtractor
+from src.hael.schema import Entity, HaelExtractionResult, Intent, UrgencyLevel
+from src.brains.dispatch import run_hael
+from src.brains.ops.schema import OpsStatus
+from src.brains.core import CoreStatus
 from src.brains.core.handlers import calculate_service_pricing
-from src.brains.revenue import handle_revenue_command
-from src.brains.people import handle_people_command
+from src.brains.revenue.schema import RevenueStatus
+from src.brains.people.schema import PeopleStatus
 from src.utils.request_id import generate_request_id
 from src.utils.idempotency import IdempotencyChecker, generate_key_hash
-from src.utils.audit import log_vapi_tool_call, log_vapi_webhook
+from src.utils.audit import log_event_nowait, log_vapi_tool_call, log_vapi_webhook
+from src.utils.caller_identification import (
+    CallerIdentity,
+    CallerRole,
+    get_permissions_for_role,
+    identify_caller,
+)
 from src.db.session import get_session_factory
 from src.config.settings import get_settings
+from src.integrations.email_notifications import send_emergency_staff_notification
+from src.integrations.odoo_appointments import create_appointment_service
+from src.integrations.odoo_leads import create_lead_service, upsert_lead_for_call
+from src.integrations.twilio_sms import send_emergency_sms, send_incomplete_call_sms
 
 # Import tool registration to ensure tools are registered
 import src.vapi.tools.register_tools  # noqa: F401
+from src.vapi.tools import get_tool_handler
+from src.vapi.tools.base import BaseToolHandler, ConversationSignal, handle_tool_call_with_base
 
 # Idempotency scope for Vapi tool calls
 VAPI_TOOL_SCOPE = "vapi_tool"
@@ -56,10 +69,45 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/vapi", tags=["vapi-server"])
 
+# Settings are cached for the process lifetime (get_settings is lru_cached),
+# so resolve hot-path feature flags once at import
+_SETTINGS = get_settings()
+_FEATURE_EMERGENCY_SMS = _SETTINGS.FEATURE_EMERGENCY_SMS
+
+# Session factory (and its pooled engine) is likewise cached; bind it once
+_SESSION_FACTORY = get_session_factory()
+
+# Identity used when the caller has no phone or identification fails.
+# Permissions are shared, never mutated; copies override only the phone.
+_DEFAULT_CUSTOMER_IDENTITY = CallerIdentity(
+    phone="",
+    role=CallerRole.CUSTOMER,
+    is_active=True,
+    permissions=get_permissions_for_role(CallerRole.CUSTOMER),
+)
+
+# VAPI_WEB_TEST_ROLE setting value -> role used for web call test identity
+_WEB_TEST_ROLE_MAP = {
+    "technician": CallerRole.TECHNICIAN,
+    "hr": CallerRole.HR,
+    "billing": CallerRole.BILLING,
+    "manager": CallerRole.MANAGER,
+    "dispatch": CallerRole.DISPATCH,
+    "executive": CallerRole.EXECUTIVE,
+    "admin": CallerRole.ADMIN,
+}
+
 # Business hours configuration
 BUSINESS_TZ = ZoneInfo("America/Chicago")
 BUSINESS_HOURS_START = 8  # 8 AM
 BUSINESS_HOURS_END = 17   # 5 PM (17:00)
+
+# Business-hours flag indexed by local weekday * 24 + hour (Monday 00:00 first)
+_BUSINESS_HOURS_MASK = bytes(
+    weekday < 5 and BUSINESS_HOURS_START <= hour < BUSINESS_HOURS_END
+    for weekday in range(7)
+    for hour in range(24)
+)
 TRANSFER_NUMBER = "+19729271800"
 
 
@@ -85,6 +133,8 @@ class VapiToolCallsResponse(BaseModel):
 
 class TransferDestinationNumber(BaseModel):
     """Phone number transfer destination."""
+    model_config = ConfigDict(frozen=True)
+    
     type: str = "number"
     number: str
     message: str = ""
@@ -92,6 +142,8 @@ class TransferDestinationNumber(BaseModel):
 
 class VapiTransferResponse(BaseModel):
     """Response for transfer-destination-request message type."""
+    model_config = ConfigDict(frozen=True)
+    
     destination: TransferDestinationNumber | None = None
     message: dict[str, Any] | None = None
     error: str | None = None
@@ -108,14 +160,8 @@ def is_business_hours() -> bool:
     Business hours: 8 AM - 5 PM America/Chicago, Monday-Friday.
     Returns False on weekends.
     """
-    now = datetime.now(BUSINESS_TZ)
-    
-    # Check weekday (0=Monday, 6=Sunday)
-    if now.weekday() >= 5:  # Saturday or Sunday
-        return False
-    
-    # Check time
-    return BUSINESS_HOURS_START <= now.hour < BUSINESS_HOURS_END
+    weekday, hour = _local_weekday_hour_at(int(time.time()) // 3600)
+    return bool(_BUSINESS_HOURS_MASK[weekday * 24 + hour])
 
 
 def is_after_hours_or_weekend() -> tuple[bool, bool]:
@@ -125,16 +171,56 @@ def is_after_hours_or_weekend() -> tuple[bool, bool]:
     Returns:
         Tuple of (is_after_hours, is_weekend)
     """
-    now = datetime.now(BUSINESS_TZ)
+    return _after_hours_or_weekend_at(int(time.time()))
+
+
+@lru_cache(maxsize=4)
+def _local_weekday_hour_at(epoch_hour: int) -> tuple[int, int]:
+    """
+    Compute the America/Chicago (weekday, hour) for a whole UTC hour.
+    
+    Chicago offsets are whole hours, so local hours start on UTC hour
+    boundaries and the timezone conversion runs once per hour.
+    """
+    now = datetime.fromtimestamp(epoch_hour * 3600, BUSINESS_TZ)
+    return now.weekday(), now.hour
+
+
+def _after_hours_or_weekend_at(epoch_second: int) -> tuple[bool, bool]:
+    """Compute (is_after_hours, is_weekend) for a whole second."""
+    weekday, hour = _local_weekday_hour_at(epoch_second // 3600)
     
-    is_weekend = now.weekday() >= 5  # Saturday or Sunday
+    is_weekend = weekday >= 5  # Saturday or Sunday
     
     # After hours: before 8 AM or 6 PM or later (we use 6 PM for after-hours premium)
-    is_after_hours = now.hour < BUSINESS_HOURS_START or now.hour >= 18  # 6 PM
+    is_after_hours = hour < BUSINESS_HOURS_START or hour >= 18  # 6 PM
     
     return is_after_hours, is_weekend
 
 
+# Transfer destinations are fixed per business-hours state, so both are
+# validated once at import and shared (the models are frozen)
+_TRANSFER_OPEN = VapiTransferResponse(
+    destination=TransferDestinationNumber(
+        type="number",
+        number=TRANSFER_NUMBER,
+        message="Please hold while I connect you with one of our team members."
+    )
+)
+_TRANSFER_CLOSED = VapiTransferResponse(
+    error="after_hours",
+    message={
+        "type": "request-complete",
+        "content": (
+            "Our office is currently closed. Our business hours are 8 AM to 5 PM "
+            "Central Time, Monday through Friday. I can collect your information "
+            "and have someone call you back first thing in the morning. "
+            "May I have your name and callback number?"
+        )
+    }
+)
+
+
 def get_transfer_destination() -> VapiTransferResponse:
     """
     Get transfer destination based on business hours.
@@ -142,33 +228,30 @@ def get_transfer_destination() -> VapiTransferResponse:
     During business hours: Return phone number for transfer.
     After hours: Return error with callback message.
     """
-    if is_business_hours():
-        return VapiTransferResponse(
-            destination=TransferDestinationNumber(
-                type="number",
-                number=TRANSFER_NUMBER,
-                message="Please hold while I connect you with one of our team members."
-            )
-        )
-    else:
-        return VapiTransferResponse(
-            error="after_hours",
-            message={
-                "type": "request-complete",
-                "content": (
-                    "Our office is currently closed. Our business hours are 8 AM to 5 PM "
-                    "Central Time, Monday through Friday. I can collect your information "
-                    "and have someone call you back first thing in the morning. "
-                    "May I have your name and callback number?"
-                )
-            }
-        )
+    return _TRANSFER_OPEN if is_business_hours() else _TRANSFER_CLOSED
+
+
+def _transfer_destination_body(response: VapiTransferResponse) -> bytes:
+    """Serialize a transfer destination in the shape Vapi expects."""
+    if response.destination:
+        return orjson.dumps({"destination": response.destination.model_dump()})
+    return orjson.dumps({"error": response.error, "message": response.message})
+
+
+# Business-hours state -> pre-serialized transfer-destination body
+_TRANSFER_DESTINATION_BODIES = {
+    True: _transfer_destination_body(_TRANSFER_OPEN),
+    False: _transfer_destination_body(_TRANSFER_CLOSED),
+}
 
 
 # ============================================================================
 # Tool Execution
 # ============================================================================
 
+# RuleBasedExtractor holds no per-call state, so one instance is shared across requests
+_EXTRACTOR = RuleBasedExtractor()
+
 # Urgency string to UrgencyLevel mapping
 URGENCY_MAP = {
     "emergency": UrgencyLevel.EMERGENCY,
@@ -189,12 +272,197 @@ REQUEST_TYPE_INTENT_MAP = {
     "general_inquiry": Intent.UNKNOWN,
 }
 
+# (request_type, urgency) -> (Intent, UrgencyLevel, confidence), precomputed so
+# both structured fields are canonicalized with a single lookup per call
+_CANONICAL: dict[tuple[str, str], tuple[Intent, UrgencyLevel, float]] = {
+    (request_type, urgency): (intent, urgency_level, 0.9)
+    for (request_type, intent), (urgency, urgency_level) in product(
+        REQUEST_TYPE_INTENT_MAP.items(), URGENCY_MAP.items()
+    )
+}
+
+
+def _canonicalize_request(
+    request_type: str,
+    urgency: str,
+) -> tuple[Intent | None, UrgencyLevel, float | None]:
+    """
+    Map structured request_type/urgency strings to (intent, urgency_level, confidence).
+
+    Intent and confidence are None when request_type is not recognized, in which
+    case the extracted intent should be kept. Unknown urgency maps to MEDIUM.
+    """
+    canonical = _CANONICAL.get((request_type, urgency))
+    if canonical is not None:
+        return canonical
+    intent = REQUEST_TYPE_INTENT_MAP.get(request_type)
+    return (
+        intent,
+        URGENCY_MAP.get(urgency, UrgencyLevel.MEDIUM),
+        0.9 if intent is not None else None,
+    )
+
+
+# Deletion table for phone normalization: drop every ASCII char except digits and "+"
+_PHONE_DELETE_TABLE = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not (chr(i).isdigit() or chr(i) == "+"))
+)
+
+
+def _normalize_phone(phone: str) -> str:
+    """Strip everything but digits and "+" from a phone number."""
+    if phone.isascii():
+        return phone.translate(_PHONE_DELETE_TABLE)
+    # Rare non-ASCII input: keep Unicode digits as well
+    return "".join(c for c in phone if c.isdigit() or c == "+")
+
+
+def _mask_phone(phone: str | None) -> str:
+    """Mask a caller phone for logging, keeping the first five characters."""
+    return f"{phone[:5]}***" if phone else "N/A"
+
+
+@lru_cache(maxsize=1024)
+def _extract_cached(text: str) -> HaelExtractionResult:
+    """Run the rule-based extractor once per distinct hael_route text."""
+    return _EXTRACTOR.extract(text)
+
+
+def _extract(text: str) -> HaelExtractionResult:
+    """
+    Extract intent and entities, reusing the result for repeated text.
+    
+    execute_hael_route overwrites extraction and entity fields with the
+    structured params, so callers get their own copies of both models.
+    """
+    cached = _extract_cached(text)
+    return cached.model_copy(update={"entities": cached.entities.model_copy()})
+
+
+def _coerce_int(value: Any) -> int | None:
+    """Coerce a structured numeric param to int, or None if missing/invalid."""
+    # Fast path: Vapi usually sends JSON numbers, so no exception frame is needed
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Brain result data merged into the structured params sent with the Odoo lead
+_LEAD_ENRICHMENT_KEYS = ("assigned_technician", "pricing", "eta_window_hours_min")
+
+# Brain result statuses that complete a hael_route call
+_SUCCESS_STATUSES = frozenset({
+    OpsStatus.SUCCESS,
+    CoreStatus.SUCCESS,
+    RevenueStatus.SUCCESS,
+    PeopleStatus.SUCCESS,
+})
+
 # Intents that should create/update a CRM lead in Odoo
-LEAD_CREATING_INTENTS = {
+LEAD_CREATING_INTENTS = frozenset({
     Intent.SERVICE_REQUEST,
     Intent.QUOTE_REQUEST,
     Intent.SCHEDULE_APPOINTMENT,
-}
+})
+
+# Intents whose brain results carry appointment details
+APPOINTMENT_INTENTS = frozenset({
+    Intent.SCHEDULE_APPOINTMENT,
+    Intent.RESCHEDULE_APPOINTMENT,
+    Intent.CANCEL_APPOINTMENT,
+})
+
+# Intents whose hael_route result depends only on the structured params: no
+# lead, appointment, notification, or clock-dependent pricing side effects
+ROUTE_CACHEABLE_INTENTS = frozenset({
+    Intent.PAYMENT_TERMS_INQUIRY,
+    Intent.HIRING_INQUIRY,
+})
+
+# Bump when routing or brain rules change so stale cached responses miss
+ROUTE_CACHE_VERSION = 1
+ROUTE_CACHE_MAXSIZE = 1024
+ROUTE_CACHE_TTL_SECONDS = 300.0
+_route_cache: OrderedDict[str, tuple[float, str, str, dict[str, Any]]] = OrderedDict()
+
+
+# Params that never change a cacheable reply: per-turn conversation context and
+# the caller annotations process_tool_call adds ("_caller_*", "_returning_customer")
+_ROUTE_CACHE_IGNORED_PARAMS = frozenset({"conversation_context"})
+
+
+def _route_cache_key(parameters: dict[str, Any]) -> str:
+    """Hash the reply-relevant hael_route params (order-insensitive) with the cache version."""
+    relevant = {
+        key: value
+        for key, value in parameters.items()
+        if not key.startswith("_") and key not in _ROUTE_CACHE_IGNORED_PARAMS
+    }
+    payload = orjson.dumps([ROUTE_CACHE_VERSION, relevant], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _get_cached_route(key: str) -> tuple[str, str, dict[str, Any]] | None:
+    """Return a cached (speak, action, data) triple, evicting it if expired."""
+    entry = _route_cache.get(key)
+    if entry is None:
+        return None
+    
+    expires_at, speak, action, data = entry
+    if expires_at <= time.monotonic():
+        del _route_cache[key]
+        return None
+    
+    _route_cache.move_to_end(key)
+    return speak, action, data
+
+
+def _cache_route(key: str, speak: str, action: str, data: dict[str, Any]) -> None:
+    """Cache a completed hael_route response, dropping the least recently used overflow."""
+    _route_cache[key] = (time.monotonic() + ROUTE_CACHE_TTL_SECONDS, speak, action, data)
+    _route_cache.move_to_end(key)
+    while len(_route_cache) > ROUTE_CACHE_MAXSIZE:
+        _route_cache.popitem(last=False)
+
+
+# Speak message for completed emergency service requests
+_EMERGENCY_SPEAK_TEMPLATE = (
+    "{base}{tech_clause} We can have a technician there within {eta_min} to {eta_max} hours. "
+    "The base diagnostic fee for today will be ${fee:.2f}, which includes any applicable "
+    "premiums. Final repair costs will depend on the issue."
+)
+
+
+# Speak text when the hael_route pipeline raises
+_HAEL_ROUTE_ERROR_SPEAK = "I'm sorry, I encountered an error. Let me connect you with a representative."
+
+
+@dataclass(slots=True)
+class _RouteResponse:
+    """hael_route response staged across the pipeline and materialized once."""
+    speak: str
+    action: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def escalate(self, speak: str) -> None:
+        """Downgrade a completed response to needs_human with a follow-up message."""
+        if self.action == "completed":
+            self.action = "needs_human"
+            self.speak = speak
+
+    def to_dict(self, request_id: str) -> dict[str, Any]:
+        """Build the tool result dict returned to Vapi."""
+        return {
+            "speak": self.speak,
+            "action": self.action,
+            "data": self.data,
+            "request_id": request_id,
+        }
 
 
 async def execute_hael_route(
@@ -247,51 +515,55 @@ async def execute_hael_route(
         user_text = parameters.get("user_text", "")
         conversation_context = parameters.get("conversation_context", "")
         
-        logger.info(f"hael_route params: type={request_type}, name={customer_name}, phone={phone}, address={address}, system={system_type}, indoor_temp={indoor_temperature_f}")
+        logger.info(
+            "hael_route params: type=%s, name=%s, phone=%s, address=%s, system=%s, indoor_temp=%s",
+            request_type, customer_name, phone, address, system_type, indoor_temperature_f,
+        )
         
         # Build a rich text representation for the extractor
-        text_parts = []
-        
-        if issue_description:
-            text_parts.append(issue_description)
-        if user_text:
-            text_parts.append(user_text)
-        if customer_name:
-            text_parts.append(f"Customer: {customer_name}")
-        if phone:
-            text_parts.append(f"Phone: {phone}")
-        if email:
-            text_parts.append(f"Email: {email}")
-        if address:
-            text_parts.append(f"Address: {address}")
-        if urgency:
-            text_parts.append(f"Urgency: {urgency}")
-        if property_type:
-            text_parts.append(f"Property: {property_type}")
-        if square_footage:
-            text_parts.append(f"Square footage: {square_footage} square feet")
-        if system_age_years:
-            text_parts.append(f"System age: {system_age_years} years old")
-        if budget_range:
-            text_parts.append(f"Budget: {budget_range}")
-        if timeline:
-            text_parts.append(f"Timeline: {timeline}")
-        if conversation_context:
-            text_parts.append(f"Context: {conversation_context}")
+        text_fields = (
+            ("{}", issue_description),
+            ("{}", user_text),
+            ("Customer: {}", customer_name),
+            ("Phone: {}", phone),
+            ("Email: {}", email),
+            ("Address: {}", address),
+            ("Urgency: {}", urgency),
+            ("Property: {}", property_type),
+            ("Square footage: {} square feet", square_footage),
+            ("System age: {} years old", system_age_years),
+            ("Budget: {}", budget_range),
+            ("Timeline: {}", timeline),
+            ("Context: {}", conversation_context),
+        )
+        text_parts = [template.format(value) for template, value in text_fields if value]
         
         full_text = ". ".join(text_parts) if text_parts else "general inquiry"
         
-        # Extract intent and entities
-        extractor = RuleBasedExtractor()
-        extraction = extractor.extract(full_text)
+        # Map urgency to UrgencyLevel and request_type to Intent in one lookup
+        intent, urgency_level, confidence = _canonicalize_request(request_type, urgency)
+        temperature = _coerce_int(indoor_temperature_f)
+        sqft = _coerce_int(square_footage)
+        age = _coerce_int(system_age_years)
+        
+        # Extract intent and entities. With an explicit intent and no free text to
+        # mine, everything the extractor could find is overridden by structured
+        # params below, so the extraction pass is skipped.
+        has_free_text = bool(
+            issue_description or user_text or conversation_context or budget_range or timeline
+        )
+        unparsed_numbers = (square_footage and sqft is None) or (system_age_years and age is None)
+        if intent is not None and not has_free_text and not unparsed_numbers:
+            extraction = HaelExtractionResult(intent=intent, entities=Entity(), confidence=confidence)
+        else:
+            extraction = _extract(full_text)
         
         # Override entities with structured data (more reliable than extraction)
         if customer_name:
             extraction.entities.full_name = customer_name
         if phone:
             # Normalize phone format
-            clean_phone = "".join(c for c in phone if c.isdigit() or c == "+")
-            extraction.entities.phone = clean_phone
+            extraction.entities.phone = _normalize_phone(phone)
         if email:
             extraction.entities.email = email
         if address:
@@ -310,47 +582,40 @@ async def execute_hael_route(
             extraction.entities.property_type = property_type
         if system_type:
             extraction.entities.system_type = system_type
-        if indoor_temperature_f is not None:
-            # Ensure it's an integer
-            try:
-                extraction.entities.temperature_mentioned = int(indoor_temperature_f)
-            except (ValueError, TypeError):
-                pass
+        if temperature is not None:
+            extraction.entities.temperature_mentioned = temperature
         # Quote-specific fields
-        if square_footage is not None:
-            try:
-                extraction.entities.square_footage = int(square_footage)
-            except (ValueError, TypeError):
-                pass
-        if system_age_years is not None:
-            try:
-                extraction.entities.system_age_years = int(system_age_years)
-            except (ValueError, TypeError):
-                pass
+        if sqft is not None:
+            extraction.entities.square_footage = sqft
+        if age is not None:
+            extraction.entities.system_age_years = age
         if budget_range:
             extraction.entities.budget_range = budget_range
         if timeline:
             extraction.entities.timeline = timeline
         
-        # Map urgency to UrgencyLevel
-        extraction.entities.urgency_level = URGENCY_MAP.get(urgency, UrgencyLevel.MEDIUM)
-        
-        # Map request_type to Intent if not already determined
-        if request_type in REQUEST_TYPE_INTENT_MAP:
-            extraction.intent = REQUEST_TYPE_INTENT_MAP[request_type]
+        extraction.entities.urgency_level = urgency_level
+        if intent is not None:
             # When intent is explicitly provided via request_type, set high confidence
-            extraction.confidence = 0.9
+            extraction.intent = intent
+            extraction.confidence = confidence
         
-        # Route to brain
-        routing = route_command(extraction)
+        # Repeated informational questions skip routing and dispatch. Only
+        # cacheable intents pay for the key, and only reply-relevant params feed it.
+        cache_key = None
+        if extraction.intent in ROUTE_CACHEABLE_INTENTS:
+            cache_key = _route_cache_key(parameters)
+            cached = _get_cached_route(cache_key)
+            if cached is not None:
+                speak, action, data = cached
+                return _RouteResponse(speak=speak, action=action, data=dict(data)).to_dict(request_id)
         
-        # Build command
-        command = build_hael_command(
-            request_id=request_id,
+        # Route, build the command, and run it through its brain
+        _, result = await run_hael(
+            extraction,
             channel=Channel.VOICE,
             raw_text=full_text,
-            extraction=extraction,
-            routing=routing,
+            request_id=request_id,
             metadata={
                 "call_id": call_id,
                 "tool_call_id": tool_call_id,
@@ -358,26 +623,21 @@ async def execute_hael_route(
             },
         )
         
-        # Route to brain handler
-        result = None
-        if routing.brain == Brain.OPS:
-            result = await handle_ops_command(command)
-        elif routing.brain == Brain.CORE:
-            result = handle_core_command(command)
-        elif routing.brain == Brain.REVENUE:
-            result = handle_revenue_command(command)
-        elif routing.brain == Brain.PEOPLE:
-            result = handle_people_command(command)
-        
         # Determine response from brain result
         if result is not None:
-            speak = result.message
-            action = "completed" if result.status.value == "success" else "needs_human"
-            data = result.data.copy() if result.data else {}
+            # Brain results are built per call with a fresh `data` dict (the
+            # Pydantic result models also copy it on validation), so the dict
+            # is already owned by this request
+            response = _RouteResponse(
+                speak=result.message,
+                action="completed" if result.status in _SUCCESS_STATUSES else "needs_human",
+                data=result.data,
+            )
+            data = response.data
             
             # Add missing fields if needs human
-            if action == "needs_human" and hasattr(result, "missing_fields") and result.missing_fields:
-                speak += f" I'll need the following information: {', '.join(result.missing_fields)}."
+            if response.action == "needs_human" and hasattr(result, "missing_fields") and result.missing_fields:
+                response.speak += f" I'll need the following information: {', '.join(result.missing_fields)}."
                 data["missing_fields"] = result.missing_fields
             
             is_emergency = data.get("is_emergency", False)
@@ -386,7 +646,7 @@ async def execute_hael_route(
             # ---------------------------------------------------------------------
             # Compute pricing for service requests (especially emergencies)
             # ---------------------------------------------------------------------
-            if extraction.intent == Intent.SERVICE_REQUEST and action == "completed":
+            if extraction.intent == Intent.SERVICE_REQUEST and response.action == "completed":
                 is_after_hours, is_weekend = is_after_hours_or_weekend()
                 
                 pricing = calculate_service_pricing(
@@ -404,7 +664,7 @@ async def execute_hael_route(
                     "after_hours_premium": pricing.after_hours_premium,
                     "weekend_premium": pricing.weekend_premium,
                     "total_base_fee": pricing.total_base_fee,
-                    "notes": pricing.notes,
+                    "notes": list(pricing.notes),
                 }
                 
                 # Add ETA + pricing info to speak for emergencies
@@ -415,28 +675,19 @@ async def execute_hael_route(
                     if data.get("assigned_technician"):
                         tech_name = data["assigned_technician"].get("name")
                     
-                    # Build enhanced speak message
-                    speak_parts = [speak]
-                    
-                    # Add tech assignment
-                    if tech_name:
-                        speak_parts.append(f"Technician {tech_name} has been assigned.")
-                    
-                    # Add ETA
-                    speak_parts.append(f"We can have a technician there within {eta_min} to {eta_max} hours.")
-                    
-                    # Add pricing disclaimer
-                    speak_parts.append(
-                        f"The base diagnostic fee for today will be ${pricing.total_base_fee:.2f}, "
-                        f"which includes any applicable premiums. Final repair costs will depend on the issue."
+                    # Build enhanced speak message (tech assignment, ETA, pricing disclaimer)
+                    response.speak = _EMERGENCY_SPEAK_TEMPLATE.format(
+                        base=response.speak,
+                        tech_clause=f" Technician {tech_name} has been assigned." if tech_name else "",
+                        eta_min=eta_min,
+                        eta_max=eta_max,
+                        fee=pricing.total_base_fee,
                     )
-                    
-                    speak = " ".join(speak_parts)
             
             # ---------------------------------------------------------------------
             # Handle appointment scheduling/rescheduling/cancellation results
             # ---------------------------------------------------------------------
-            if extraction.intent in (Intent.SCHEDULE_APPOINTMENT, Intent.RESCHEDULE_APPOINTMENT, Intent.CANCEL_APPOINTMENT) and action == "completed":
+            if extraction.intent in APPOINTMENT_INTENTS and response.action == "completed":
                 # Appointment operations already include appointment details in data
                 appointment_id = data.get("appointment_id")
                 scheduled_time = data.get("scheduled_time")
@@ -452,20 +703,18 @@ async def execute_hael_route(
                         "scheduled_time_end": data.get("scheduled_time_end"),
                         "technician_name": technician_name,
                     }
-                
-                # If appointment was created/rescheduled, try to link to lead if one exists
-                if appointment_id and extraction.intent in (Intent.SCHEDULE_APPOINTMENT, Intent.RESCHEDULE_APPOINTMENT):
-                    # Check if we'll create a lead below
-                    # Link will be handled after lead creation
-                    pass
+                # Linking a scheduled appointment to its lead happens after lead creation below
         else:
             # Unknown brain - needs human
-            speak = (
-                "I'm not sure how to help with that specific request. "
-                "Let me connect you with a representative who can assist."
+            response = _RouteResponse(
+                speak=(
+                    "I'm not sure how to help with that specific request. "
+                    "Let me connect you with a representative who can assist."
+                ),
+                action="needs_human",
+                data={"reason": "unknown_intent"},
             )
-            action = "needs_human"
-            data = {"reason": "unknown_intent"}
+            data = response.data
             is_emergency = False
             emergency_reason = None
         
@@ -477,19 +726,13 @@ async def execute_hael_route(
         
         if lead_ref_id and extraction.intent in LEAD_CREATING_INTENTS:
             try:
-                from src.integrations.odoo_leads import upsert_lead_for_call
-                
-                logger.info(f"Creating Odoo lead for ref={lead_ref_id}, intent={extraction.intent}")
+                logger.info("Creating Odoo lead for ref=%s, intent=%s", lead_ref_id, extraction.intent.value)
                 
                 # Merge original params with enriched data (tech assignment, pricing, ETA)
-                enriched_params = parameters.copy()
-                if data.get("assigned_technician"):
-                    enriched_params["assigned_technician"] = data["assigned_technician"]
-                if data.get("pricing"):
-                    enriched_params["pricing"] = data["pricing"]
-                if data.get("eta_window_hours_min"):
-                    enriched_params["eta_window_hours_min"] = data["eta_window_hours_min"]
-                    enriched_params["eta_window_hours_max"] = data.get("eta_window_hours_max")
+                enrichment = {key: data[key] for key in _LEAD_ENRICHMENT_KEYS if data.get(key)}
+                if "eta_window_hours_min" in enrichment:
+                    enrichment["eta_window_hours_max"] = data.get("eta_window_hours_max")
+                enriched_params = parameters | enrichment
                 
                 odoo_result = await upsert_lead_for_call(
                     call_id=lead_ref_id,  # Use call_id or tool_call_id as reference
@@ -509,912 +752,1119 @@ async def execute_hael_route(
                         "action": odoo_result.get("action"),  # created or updated
                         "partner_id": odoo_result.get("partner_id"),
                     }
-                    logger.info(f"Odoo lead {odoo_result.get('action')}: {lead_id} for ref {lead_ref_id}")
+                    logger.info("Odoo lead %s: %s for ref %s", odoo_result.get("action"), lead_id, lead_ref_id)
                     
                     # Link appointment to lead if appointment was created
                     if extraction.intent == Intent.SCHEDULE_APPOINTMENT and data.get("appointment_id"):
                         try:
-                            from src.integrations.odoo_appointments import create_appointment_service
                             appointment_service = create_appointment_service()
                             await appointment_service.link_appointment_to_lead(
                                 event_id=data["appointment_id"],
                                 lead_id=lead_id,
                             )
-                            logger.info(f"Linked appointment {data['appointment_id']} to lead {lead_id}")
+                            logger.info("Linked appointment %s to lead %s", data["appointment_id"], lead_id)
                         except Exception as link_err:
-                            logger.warning(f"Failed to link appointment to lead: {link_err}")
+                            logger.warning("Failed to link appointment to lead: %s", link_err)
                 else:
                     # Odoo failed - log but continue (fail-closed)
-                    logger.error(f"Odoo lead creation failed: {odoo_result.get('error')}")
+                    logger.error("Odoo lead creation failed: %s", odoo_result.get("error"))
                     data["odoo"] = {
                         "crm_lead_id": None,
                         "action": "failed",
                         "error": odoo_result.get("error", "Unknown error"),
                     }
                     # If action was "completed", downgrade to needs_human for follow-up
-                    if action == "completed":
-                        action = "needs_human"
-                        speak = (
-                            "I've captured your request. Our team will follow up shortly "
-                            "to confirm the details and schedule your service."
-                        )
+                    response.escalate(
+                        "I've captured your request. Our team will follow up shortly "
+                        "to confirm the details and schedule your service."
+                    )
                         
             except Exception as odoo_err:
-                logger.exception(f"Odoo lead upsert error: {odoo_err}")
+                logger.exception("Odoo lead upsert error: %s", odoo_err)
                 data["odoo"] = {
                     "crm_lead_id": None,
                     "action": "error",
                     "error": str(odoo_err),
                 }
                 # Fail-closed: still respond but flag for human
-                if action == "completed":
-                    action = "needs_human"
-                    speak = (
-                        "I've captured your request. Our team will follow up shortly "
-                        "to confirm the details."
-                    )
+                response.escalate(
+                    "I've captured your request. Our team will follow up shortly "
+                    "to confirm the details."
+                )
         else:
             if not lead_ref_id:
                 logger.warning("No call_id or tool_call_id available for lead creation")
             elif extraction.intent not in LEAD_CREATING_INTENTS:
-                logger.debug(f"Intent {extraction.intent} not in lead-creating intents, skipping Odoo")
+                logger.debug("Intent %s not in lead-creating intents, skipping Odoo", extraction.intent.value)
         
         # ---------------------------------------------------------------------
-        # Send SMS confirmation to customer (for emergencies)
+        # Emergency notifications: SMS to customer + email to Dispatch, Linda,
+        # and assigned technician. Independent services, so sent concurrently.
         # ---------------------------------------------------------------------
-        if is_emergency and extraction.entities.phone and action == "completed":
-            from src.integrations.twilio_sms import send_emergency_sms
-            from src.utils.audit import log_event
-            from src.config.settings import get_settings
+        if is_emergency and response.action == "completed":
+            tech = data.get("assigned_technician") or {}
+            tech_id = tech.get("id")
+            tech_name = tech.get("name")
+            eta_min = data.get("eta_window_hours_min", 1.5)
+            eta_max = data.get("eta_window_hours_max", 3.0)
+            total_fee = (data.get("pricing") or {}).get("total_base_fee", 0.0)
+            lead_id = (data.get("odoo") or {}).get("crm_lead_id")
             
-            settings = get_settings()
+            # (data key, log label, coroutine, audit fields) per notification
+            notifications: list[tuple[str, str, Any, dict[str, Any]]] = []
             
-            # Only send SMS if feature is enabled
-            if settings.FEATURE_EMERGENCY_SMS:
-                try:
-                    tech_name = None
-                    if data.get("assigned_technician"):
-                        tech_name = data["assigned_technician"].get("name")
-                    
-                    eta_min = data.get("eta_window_hours_min", 1.5)
-                    eta_max = data.get("eta_window_hours_max", 3.0)
-                    total_fee = 0.0
-                    if data.get("pricing"):
-                        total_fee = data["pricing"].get("total_base_fee", 0)
-                    
-                    # Send SMS and await result to include in response
-                    sms_result = await send_emergency_sms(
-                        to_phone=extraction.entities.phone,
+            if extraction.entities.phone:
+                # Only send SMS if feature is enabled
+                if _FEATURE_EMERGENCY_SMS:
+                    notifications.append((
+                        "sms",
+                        "Emergency SMS",
+                        send_emergency_sms(
+                            to_phone=extraction.entities.phone,
+                            customer_name=extraction.entities.full_name,
+                            tech_name=tech_name,
+                            eta_hours_min=eta_min,
+                            eta_hours_max=eta_max,
+                            total_fee=total_fee,
+                        ),
+                        {
+                            "channel": "sms",
+                            "intent": "emergency_confirmation",
+                            "command_json": {"to": extraction.entities.phone},
+                        },
+                    ))
+                else:
+                    logger.debug("FEATURE_EMERGENCY_SMS disabled, skipping SMS")
+                    data["sms"] = {"status": "disabled", "reason": "feature_flag_disabled"}
+            
+            if lead_id:
+                notifications.append((
+                    "staff_notifications",
+                    "Emergency staff email",
+                    send_emergency_staff_notification(
+                        lead_id=lead_id,
                         customer_name=extraction.entities.full_name,
+                        address=extraction.entities.address,
+                        phone=extraction.entities.phone,
+                        tech_id=tech_id,
                         tech_name=tech_name,
                         eta_hours_min=eta_min,
                         eta_hours_max=eta_max,
                         total_fee=total_fee,
-                    )
-                    
-                    logger.info(f"Emergency SMS result: {sms_result}")
-                    data["sms"] = sms_result
-                    
-                    # Log to audit
-                    try:
-                        log_event(
-                            request_id=request_id,
-                            channel="sms",
-                            intent="emergency_confirmation",
-                            brain="ops",
-                            command_json={"to": extraction.entities.phone},
-                            odoo_result_json=sms_result,
-                            status=sms_result.get("status", "unknown"),
-                        )
-                    except Exception as audit_err:
-                        logger.warning(f"Failed to log SMS audit: {audit_err}")
-                except Exception as sms_err:
-                    logger.error(f"Emergency SMS error: {sms_err}")
-                    data["sms"] = {"status": "error", "error": str(sms_err)}
-            else:
-                logger.debug("FEATURE_EMERGENCY_SMS disabled, skipping SMS")
-                data["sms"] = {"status": "disabled", "reason": "feature_flag_disabled"}
-        
-        # ---------------------------------------------------------------------
-        # Send email notifications to Dispatch, Linda, and assigned technician
-        # ---------------------------------------------------------------------
-        if is_emergency and action == "completed" and data.get("odoo", {}).get("crm_lead_id"):
-            from src.integrations.email_notifications import send_emergency_staff_notification
-            from src.utils.audit import log_event
+                        emergency_reason=emergency_reason,
+                    ),
+                    {
+                        "channel": "email",
+                        "intent": "emergency_staff_notification",
+                        "command_json": {"lead_id": lead_id},
+                    },
+                ))
             
-            try:
-                lead_id = data["odoo"].get("crm_lead_id")
-                tech_id = None
-                tech_name = None
-                if data.get("assigned_technician"):
-                    tech_id = data["assigned_technician"].get("id")
-                    tech_name = data["assigned_technician"].get("name")
-                
-                # Send staff notifications (await so errors are caught)
-                staff_email_result = await send_emergency_staff_notification(
-                    lead_id=lead_id,
-                    customer_name=extraction.entities.full_name,
-                    address=extraction.entities.address,
-                    phone=extraction.entities.phone,
-                    tech_id=tech_id,
-                    tech_name=tech_name,
-                    eta_hours_min=data.get("eta_window_hours_min", 1.5),
-                    eta_hours_max=data.get("eta_window_hours_max", 3.0),
-                    total_fee=data.get("pricing", {}).get("total_base_fee", 0),
-                    emergency_reason=emergency_reason,
+            if notifications:
+                outcomes = await asyncio.gather(
+                    *(coro for _, _, coro, _ in notifications),
+                    return_exceptions=True,
                 )
+                for (data_key, label, _, audit_fields), outcome in zip(notifications, outcomes):
+                    if isinstance(outcome, BaseException):
+                        logger.error("%s error: %s", label, outcome)
+                        data[data_key] = {"status": "error", "error": str(outcome)}
+                        continue
                 
-                logger.info(f"Emergency staff email notifications result: {staff_email_result}")
-                data["staff_notifications"] = staff_email_result
+                    logger.info("%s result: %s", label, outcome)
+                    data[data_key] = outcome
                 
-                # Log to audit
-                try:
-                    log_event(
+                    # Log to audit (queued, written off the response path)
+                    log_event_nowait(
                         request_id=request_id,
-                        channel="email",
-                        intent="emergency_staff_notification",
                         brain="ops",
-                        command_json={"lead_id": lead_id},
-                        odoo_result_json=staff_email_result,
-                        status=staff_email_result.get("status", "unknown"),
+                        odoo_result_json=outcome,
+                        status=outcome.get("status", "unknown"),
+                        **audit_fields,
                     )
-                except Exception as audit_err:
-                    logger.warning(f"Failed to log email audit: {audit_err}")
-            except Exception as email_err:
-                logger.error(f"Emergency staff email error: {email_err}")
-                data["staff_notifications"] = {"status": "error", "error": str(email_err)}
         
-        return {
-            "speak": speak,
-            "action": action,
-            "data": data,
-            "request_id": request_id,
-        }
+        if cache_key is not None and response.action == "completed":
+            _cache_route(cache_key, response.speak, response.action, dict(data))
+        
+        return response.to_dict(request_id)
         
     except Exception as e:
-        logger.exception(f"Error executing hael_route: {e}")
-        return {
-            "speak": "I'm sorry, I encountered an error. Let me connect you with a representative.",
-            "action": "error",
-            "data": {"error": str(e)},
-            "request_id": request_id,
-        }
+        logger.exception("Error executing hael_route: %s", e)
+        return _RouteResponse(
+            speak=_HAEL_ROUTE_ERROR_SPEAK,
+            action="error",
+            data={"error": str(e)},
+        ).to_dict(request_id)
 
 
-# ============================================================================
-# Main Server URL Endpoint
-# ============================================================================
+# Vapi endedReason values that mark a call as incomplete
+_INCOMPLETE_REASONS = frozenset({
+    "hangup",
+    "disconnected",
+    "failed",
+    "busy",
+    "no-answer",
+    "canceled",
+})
 
-@router.post("/server")
-async def vapi_server_url(request: Request) -> dict[str, Any]:
-    """
-    Vapi Server URL endpoint.
+# Partial-data patterns for incomplete end-of-call transcripts
+_NAME_RE = re.compile(
+    r"(?:name|i'm|this is|my name is)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
+    re.IGNORECASE,
+)
+_PHONE_RE = re.compile(r"(\+?1?\d{10,11})")
+_ADDR_RE = re.compile(
+    r"(\d+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+"
+    r"(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Court|Ct|Place|Pl)"
+    r"[^,]*,\s*[A-Z][a-z]+\s+[A-Z]{2}\s+\d{5})",
+    re.IGNORECASE,
+)
+
+# Acknowledgement body shared by every non-tool message type
+_STATUS_OK_BODY = orjson.dumps({"status": "ok"})
+
+# Response body for tool-calls messages that carry no tool calls
+_EMPTY_TOOL_RESULTS_BODY = orjson.dumps({"results": []})
+
+
+# Vapi tool call formats, probed in order. Each entry is
+# (container path, name paths, id paths, parameters paths); paths are key
+# tuples relative to the list item, and a format only applies when its
+# container resolves to a non-empty dict. Later formats only fill fields
+# the earlier ones left empty.
+_TOOL_CALL_FORMATS = (
+    # toolWithToolCallList: {"name": "...", "toolCall": {"id": "...", "parameters": {...}}}
+    (
+        ("toolCall",),
+        (("name",), ("toolCall", "function", "name")),
+        (("toolCall", "id"),),
+        (
+            ("toolCall", "parameters"),
+            ("toolCall", "arguments"),
+            ("toolCall", "function", "parameters"),
+            ("toolCall", "function", "arguments"),
+        ),
+    ),
+    # toolCallList: {"id": "...", "function": {"name": "...", "arguments": {...}}}
+    (
+        ("function",),
+        (("function", "name"),),
+        (("id",),),
+        (("function", "arguments"), ("function", "parameters")),
+    ),
+    # Simple: {"id": "...", "name": "...", "parameters": {...}}
+    (
+        (),
+        (("name",),),
+        (("id",),),
+        (("parameters",), ("arguments",)),
+    ),
+)
+
+
+def _dig(item: dict, path: tuple[str, ...]) -> Any:
+    """Follow a key path through nested dicts, returning None on a miss."""
+    value: Any = item
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _first_present(item: dict, paths: tuple[tuple[str, ...], ...]) -> Any:
+    """Return the first truthy value found along the given key paths."""
+    for path in paths:
+        value = _dig(item, path)
+        if value:
+            return value
+    return None
+
+
+def _extract_tool_info(item: dict) -> tuple[str, str, dict]:
+    """Extract (tool_name, tool_call_id, parameters) from various Vapi formats."""
+    tool_name = ""
+    tool_call_id = ""
+    parameters = {}
     
-    Handles all Vapi server messages:
-    - tool-calls: Execute tools and return results
-    - transfer-destination-request: Return transfer destination
-    - end-of-call-report: Log call summary
-    - status-update: Log status changes
+    for container, name_paths, id_paths, params_paths in _TOOL_CALL_FORMATS:
+        if not _dig(item, container):
+            continue
+        tool_name = tool_name or _first_present(item, name_paths) or ""
+        tool_call_id = tool_call_id or _first_present(item, id_paths) or ""
+        parameters = parameters or _first_present(item, params_paths) or {}
+        if tool_name and tool_call_id and parameters:
+            break
     
-    Signature verification is handled by WebhookVerificationMiddleware.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Extracted tool info: name=%s, id=%s, params_keys=%s",
+            tool_name, tool_call_id, list(parameters),
+        )
+    return tool_name, tool_call_id, parameters
+
+
+def _extract_tool_call_list_info(tool_call: dict) -> tuple[str, str, dict]:
+    """Extract (tool_name, tool_call_id, parameters) from a toolCallList item."""
+    # Vapi uses "arguments" not "parameters" in toolCallList
+    return (
+        tool_call.get("name", ""),
+        tool_call.get("id", ""),
+        tool_call.get("parameters", {}) or tool_call.get("arguments", {}),
+    )
+
+
+# High-volume message types that are acknowledged without decoding the body
+_ACK_ONLY_MESSAGE_TYPES = frozenset({b"transcript", b"conversation-update"})
+
+# Vapi serializes message.type as the first key of the top-level message
+# object. The fast path only trusts a type found at exactly that position, so a
+# nested "type" can never cause a message to be skipped; any other layout falls
+# through to the full parse
+_MESSAGE_TYPE_RE = re.compile(rb'\s*\{\s*"message"\s*:\s*\{\s*"type"\s*:\s*"([^"\\]*)"')
+
+
+def _peek_message_type(raw_body: bytes) -> bytes | None:
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON body")
-    
-    message = body.get("message", {})
-    message_type = message.get("type", "unknown")
+    Return message.type without decoding the body, if it leads the payload.
+
+    Args:
+        raw_body: Raw request body
+
+    Returns:
+        The type value as bytes, or None if message.type is not the leading key
+    """
+    match = _MESSAGE_TYPE_RE.match(raw_body)
+    return match.group(1) if match else None
+
+
+# Speak text for tool calls that fail or return an unusable result
+_TOOL_ERROR_SPEAK = "I encountered an error processing your request."
+
+
+def _tool_error_result(error: str) -> dict[str, Any]:
+    """Build the result returned for a failed or malformed tool call."""
+    return {"speak": _TOOL_ERROR_SPEAK, "action": "error", "data": {"error": error}}
+
+
+@lru_cache(maxsize=64)
+def _unknown_tool_result(tool_name: str) -> dict[str, Any]:
+    """
+    Build the result for a tool name with no handler.
     
-    # Extract call_id from multiple possible locations
-    # Vapi sometimes puts it in message.call.id, sometimes in message.callId
-    call_obj = message.get("call", {})
-    call_id = (
-        call_obj.get("id") or
-        message.get("callId") or
-        message.get("call_id") or
-        body.get("callId") or
-        body.get("call_id") or
-        body.get("call", {}).get("id")
-    )
+    Misconfigured assistants repeat the same unknown name on every turn, so
+    results are memoized; they are only read and serialized, never mutated.
+    """
+    return {
+        "speak": f"I don't recognize the '{tool_name}' tool. Please try again.",
+        "action": "error",
+        "data": {"error": f"Unknown tool: {tool_name}"},
+        "request_id": None,
+    }
+
+
+def _json_response(payload: dict[str, Any]) -> Response:
+    """
+    Serialize a payload with orjson and wrap it in a JSON Response.
+
+    Returning a Response directly bypasses FastAPI's jsonable_encoder
+    and response validation for the hot Vapi webhook path.
+    """
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
+def _status_ok_response() -> Response:
+    """Return the pre-serialized {"status": "ok"} acknowledgement."""
+    return Response(content=_STATUS_OK_BODY, media_type="application/json")
+
+
+# Completed tool call results keyed by idempotency key, so Vapi retries
+# resolve without a DB round trip. Per-process only; the idempotency_keys
+# table stays authoritative across workers.
+IDEMPOTENCY_CACHE_MAXSIZE = 1024
+IDEMPOTENCY_CACHE_TTL_SECONDS = 300.0
+_idempotency_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+def _get_cached_tool_result(idempotency_key: str) -> dict[str, Any] | None:
+    """Return a cached completed result, evicting it if expired."""
+    entry = _idempotency_cache.get(idempotency_key)
+    if entry is None:
+        return None
     
-    logger.info(f"Vapi server message: type={message_type}, call_id={call_id}")
+    expires_at, result = entry
+    if expires_at <= time.monotonic():
+        del _idempotency_cache[idempotency_key]
+        return None
     
-    # -------------------------------------------------------------------------
-    # Handle tool-calls
-    # -------------------------------------------------------------------------
-    if message_type == "tool-calls":
-        tool_call_list = message.get("toolCallList", [])
-        tool_with_list = message.get("toolWithToolCallList", [])
-        
-        # Debug: log the raw structure
-        logger.info(f"tool-calls payload: toolCallList={json.dumps(tool_call_list)[:500]}, toolWithToolCallList={json.dumps(tool_with_list)[:500]}")
+    _idempotency_cache.move_to_end(idempotency_key)
+    return result
+
+
+def _cache_tool_result(idempotency_key: str, result: dict[str, Any]) -> None:
+    """Cache a completed result, dropping the least recently used overflow."""
+    _idempotency_cache[idempotency_key] = (
+        time.monotonic() + IDEMPOTENCY_CACHE_TTL_SECONDS,
+        result,
+    )
+    _idempotency_cache.move_to_end(idempotency_key)
+    while len(_idempotency_cache) > IDEMPOTENCY_CACHE_MAXSIZE:
+        _idempotency_cache.popitem(last=False)
+
+
+def _claim_idempotency_key(idempotency_key: str) -> dict | None:
+    """
+    Return the cached result for a tool call, or mark it in progress.
+
+    Args:
+        idempotency_key: Hashed (call_id, tool_call_id) key
+
+    Returns:
+        Cached result if the call already completed, None otherwise
+    """
+    session = _SESSION_FACTORY()
+    try:
+        checker = IdempotencyChecker(session)
+        existing = checker.get_existing(VAPI_TOOL_SCOPE, idempotency_key)
         
-        # Helper to extract tool name and parameters from various Vapi formats
-        def extract_tool_info(item: dict) -> tuple[str, str, dict]:
-            """Extract (tool_name, tool_call_id, parameters) from various Vapi formats."""
-            tool_name = ""
-            tool_call_id = ""
-            parameters = {}
-            
-            # Format 1: toolWithToolCallList - {"name": "...", "toolCall": {"id": "...", "parameters": {...}}}
-            tool_call = item.get("toolCall", {})
-            if tool_call:
-                tool_name = item.get("name", "")
-                tool_call_id = tool_call.get("id", "")
-                parameters = tool_call.get("parameters", {}) or tool_call.get("arguments", {})
-                # Also check function nested in toolCall
-                func = tool_call.get("function", {})
-                if func:
-                    tool_name = tool_name or func.get("name", "")
-                    parameters = parameters or func.get("parameters", {}) or func.get("arguments", {})
-            
-            # Format 2: toolCallList - {"id": "...", "function": {"name": "...", "arguments": {...}}}
-            func = item.get("function", {})
-            if func:
-                tool_call_id = tool_call_id or item.get("id", "")
-                tool_name = tool_name or func.get("name", "")
-                parameters = parameters or func.get("arguments", {}) or func.get("parameters", {})
-            
-            # Format 3: Simple - {"id": "...", "name": "...", "parameters": {...}}
-            tool_call_id = tool_call_id or item.get("id", "")
-            tool_name = tool_name or item.get("name", "")
-            parameters = parameters or item.get("parameters", {}) or item.get("arguments", {})
-            
-            logger.info(f"Extracted tool info: name={tool_name}, id={tool_call_id}, params_keys={list(parameters.keys())}")
-            return tool_name, tool_call_id, parameters
+        if existing and existing.get("_idempotency_status") != "in_progress":
+            return existing
         
-        # Helper to process a single tool call with idempotency + audit
-        async def process_tool_call(
-            tool_name: str,
-            tool_call_id: str,
-            parameters: dict,
-        ) -> dict[str, Any]:
-            """Process a tool call with idempotency checking and audit logging."""
-            # Generate idempotency key
-            idempotency_key = generate_key_hash(
-                VAPI_TOOL_SCOPE,
-                [call_id or "", tool_call_id]
-            )
-            
-            # Get database session
-            session_factory = get_session_factory()
-            session = session_factory()
+        if not existing:
+            checker.start(VAPI_TOOL_SCOPE, idempotency_key)
+        return None
+    finally:
+        session.close()
+
+
+def _record_tool_call(
+    call_id: str | None,
+    tool_call_id: str,
+    idempotency_key: str,
+    parameters: dict[str, Any],
+    result: dict[str, Any],
+) -> None:
+    """Write the tool call audit row and complete its idempotency key."""
+    try:
+        session = _SESSION_FACTORY()
+    except Exception as db_err:
+        logger.warning("Failed to open session for tool call %s: %s", tool_call_id, db_err)
+        return
+    
+    try:
+        try:
+            odoo_data = result.get("data", {}).get("odoo") if result.get("data") else None
+            log_vapi_tool_call(
+                session=session,
+                request_id=result.get("request_id"),
+                call_id=call_id,
+                tool_call_id=tool_call_id,
+                intent=parameters.get("request_type"),
+                brain=None,  # Could extract from result
+                parameters=parameters,
+                result=result,
+                odoo_result=odoo_data,
+                status="processed" if result.get("action") != "error" else "error",
+                error_message=result.get("data", {}).get("error") if result.get("action") == "error" else None,
+            )
+        except Exception as audit_err:
+            logger.warning("Failed to write audit log: %s", audit_err)
+        
+        IdempotencyChecker(session).complete(VAPI_TOOL_SCOPE, idempotency_key, result)
+    except Exception as idem_err:
+        logger.warning("Failed to complete idempotency key for %s: %s", tool_call_id, idem_err)
+    finally:
+        session.close()
+
+
+def _record_webhook_event(**fields: Any) -> None:
+    """Write a Vapi webhook audit row; failures are logged, never raised."""
+    try:
+        session = _SESSION_FACTORY()
+        try:
+            log_vapi_webhook(session=session, **fields)
+        finally:
+            session.close()
+    except Exception as audit_err:
+        logger.warning("Failed to audit Vapi %s: %s", fields.get("event_type"), audit_err)
+
+
+async def _handle_incomplete_call(
+    message: dict[str, Any],
+    call_id: str | None,
+    summary: str,
+    duration: float,
+    ended_reason: str,
+    transcript: str,
+) -> None:
+    """
+    Create a partial "Incomplete" lead and send the SMS fallback.
+
+    Runs as a background task after the end-of-call report is acknowledged.
+    """
+    try:
+        # Extract phone number from call data
+        call_data = message.get("call", {})
+        customer_phone = call_data.get("customer", {}).get("number") or call_data.get("from")
+        
+        if customer_phone:
+            # Extract partial data from transcript/summary
+            partial_data = {
+                "call_id": call_id,
+                "duration": duration,
+                "ended_reason": ended_reason,
+                "transcript": transcript[:500] if transcript else "",
+                "summary": summary[:500] if summary else "",
+            }
             
+            # Try to extract customer name and other info from transcript
+            name_match = _NAME_RE.search(transcript)
+            if name_match:
+                partial_data["customer_name"] = name_match.group(1)
+            
+            phone_match = _PHONE_RE.search(transcript)
+            if phone_match and not customer_phone:
+                customer_phone = phone_match.group(1)
+            
+            address_match = _ADDR_RE.search(transcript)
+            if address_match:
+                partial_data["address"] = address_match.group(1)
+            
+            # Create partial lead with "Incomplete" status
             try:
-                # Check idempotency
-                checker = IdempotencyChecker(session)
-                existing = checker.get_existing(VAPI_TOOL_SCOPE, idempotency_key)
-                
-                if existing and existing.get("_idempotency_status") != "in_progress":
-                    logger.info(f"Idempotency hit for {tool_call_id}, returning cached result")
-                    return existing
+                lead_service = await create_lead_service()
                 
-                # Mark as in progress
-                if not existing:
-                    checker.start(VAPI_TOOL_SCOPE, idempotency_key)
-                
-                # Extract call context from Vapi message
-                # Vapi can send phone number in multiple locations depending on message type
-                call_obj = message.get("call", {})
-                call_type = (call_obj.get("type") or "").strip().lower()
-
-                # Web call test mode: use static identity when enabled (for testing internal OPS from Vapi web)
-                settings = get_settings()
-                use_web_test_identity = settings.VAPI_WEB_CALLS_USE_TEST_IDENTITY
-                is_web_call = call_type in ("webcall", "web", "vapi.websocketcall")
-                # Fallback: no phone + test mode enabled → treat as web test (e.g. Vapi web doesn't send type)
-                caller_phone_raw = (
-                    call_obj.get("customer", {}).get("number") or
-                    call_obj.get("from") or
-                    call_obj.get("customerNumber") or
-                    call_obj.get("phoneNumber") or
-                    call_obj.get("phone") or
-                    message.get("call", {}).get("customer", {}).get("number") or
-                    message.get("from") or
-                    message.get("phoneNumber") or
-                    message.get("phone")
-                )
-                use_web_test = use_web_test_identity and (is_web_call or not caller_phone_raw)
-
-                if use_web_test:
-                    from src.utils.caller_identification import (
-                        CallerIdentity,
-                        CallerRole,
-                        get_permissions_for_role,
-                    )
-                    test_role_str = settings.VAPI_WEB_TEST_ROLE
-                    _WEB_TEST_ROLE_MAP = {
-                        "technician": CallerRole.TECHNICIAN,
-                        "hr": CallerRole.HR,
-                        "billing": CallerRole.BILLING,
-                        "manager": CallerRole.MANAGER,
-                        "dispatch": CallerRole.DISPATCH,
-                        "executive": CallerRole.EXECUTIVE,
-                        "admin": CallerRole.ADMIN,
-                    }
-                    test_role = _WEB_TEST_ROLE_MAP[test_role_str]
-                    caller_identity = CallerIdentity(
-                        phone="web-test",
-                        role=test_role,
-                        employee_id="web-test",
-                        name=f"Web Test ({test_role.value})",
-                        is_active=True,
-                        permissions=get_permissions_for_role(test_role),
-                    )
-                    caller_phone = "web-test"
-                    logger.info(
-                        f"Web call using test identity: role={test_role.value} "
-                        f"(VAPI_WEB_CALLS_USE_TEST_IDENTITY=true, VAPI_WEB_TEST_ROLE={test_role_str})"
-                    )
-                else:
-                    caller_phone = caller_phone_raw
-
-                    # Log extracted phone for debugging
-                    if caller_phone:
-                        logger.info(
-                            f"Extracted caller phone from Vapi message: "
-                            f"{caller_phone[:5] if len(caller_phone) > 5 else caller_phone}***"
-                        )
-                    else:
-                        logger.warning(
-                            f"No caller phone found in Vapi message. "
-                            f"call.type={call_type or 'N/A'}, "
-                            f"Message keys: {list(message.keys())}, "
-                            f"Call keys: {list(call_obj.keys()) if call_obj else 'N/A'}"
-                        )
-                        if call_obj:
-                            logger.debug(f"Call object sample: {str(call_obj)[:200]}")
-
-                    # Identify caller (Layer 1: Hybrid lookup)
-                    caller_identity = None
-                    if caller_phone:
-                        try:
-                            from src.utils.caller_identification import identify_caller
-                            caller_identity = await identify_caller(caller_phone)
-
-                            logger.info(
-                                f"Caller identified: phone={caller_phone[:5] if len(caller_phone) > 5 else caller_phone}***, "
-                                f"role={caller_identity.role.value}, "
-                                f"name={caller_identity.name or 'Unknown'}, "
-                                f"employee_id={caller_identity.employee_id or 'N/A'}"
-                            )
-                        except Exception as ident_err:
-                            logger.warning(
-                                f"Caller identification failed for {caller_phone[:5] if len(caller_phone) > 5 else caller_phone}***: {ident_err}",
-                                exc_info=True
-                            )
-                            from src.utils.caller_identification import CallerIdentity, CallerRole, get_permissions_for_role
-                            caller_identity = CallerIdentity(
-                                phone=caller_phone or "",
-                                role=CallerRole.CUSTOMER,
-                                is_active=True,
-                                permissions=get_permissions_for_role(CallerRole.CUSTOMER),
-                            )
-                    else:
-                        logger.warning(
-                            "No caller phone number available in Vapi message. "
-                            "Defaulting to 'customer' role. Internal OPS tools will be denied."
-                        )
-                        from src.utils.caller_identification import CallerIdentity, CallerRole, get_permissions_for_role
-                        caller_identity = CallerIdentity(
-                            phone="",
-                            role=CallerRole.CUSTOMER,
-                            is_active=True,
-                            permissions=get_permissions_for_role(CallerRole.CUSTOMER),
-                        )
-
-                # Check access (Layer 3: Permission check)
-                from src.vapi.tools.base import BaseToolHandler
-                handler = BaseToolHandler(tool_name)
-                allowed, error_msg = handler.check_access(
-                    tool_name=tool_name,
-                    caller_role=caller_identity.role.value,
-                    caller_is_active=caller_identity.is_active,
+                # Build minimal entity for incomplete lead
+                entities = Entity(
+                    full_name=partial_data.get("customer_name"),
+                    phone=customer_phone,
+                    address=partial_data.get("address"),
+                    problem_description=f"Incomplete call - {ended_reason}. Duration: {duration}s. {summary[:200] if summary else ''}",
                 )
                 
-                if not allowed:
-                    logger.warning(
-                        f"Access denied: tool={tool_name}, "
-                        f"caller_role={caller_identity.role.value}, "
-                        f"caller_phone={caller_phone[:5] if caller_phone and len(caller_phone) > 5 else 'N/A'}***"
-                    )
-                    return {
-                        "speak": error_msg or "I'm sorry, you don't have access to this feature.",
-                        "action": "error",
-                        "data": {
-                            "error": "unauthorized",
-                            "role": caller_identity.role.value,
-                            "tool": tool_name
-                        }
-                    }
-                
-                # Add caller context to parameters (for tool handlers to use)
-                parameters["_caller_role"] = caller_identity.role.value
-                parameters["_caller_id"] = caller_identity.employee_id
-                parameters["_caller_name"] = caller_identity.name
-                parameters["_caller_phone"] = caller_identity.phone
-
-                # Returning customer: when caller is customer, look up partner by phone
-                if caller_identity.role.value == "customer" and caller_phone:
-                    try:
-                        from src.integrations.odoo_leads import create_lead_service
-                        lead_svc = await create_lead_service()
-                        returning = await lead_svc.find_partner_by_phone(caller_phone)
-                        if returning:
-                            parameters["_returning_customer"] = {
-                                "name": returning.get("name"),
-                                "partner_id": returning.get("partner_id"),
-                                "address": returning.get("address"),
-                            }
-                            logger.info(f"Returning customer context: partner_id={returning.get('partner_id')}, name={returning.get('name')}")
-                    except Exception as rc_err:
-                        logger.warning(f"Returning customer lookup failed: {rc_err}")
-                
-                # Check for wrong number and profanity/abuse detection early
-                from src.vapi.tools.base import BaseToolHandler
-                base_handler = BaseToolHandler(tool_name)
-                conversation_context = parameters.get("conversation_context") or parameters.get("user_text") or ""
-                
-                # Check for wrong number first
-                if base_handler.detect_wrong_number(
-                    conversation_context=conversation_context,
-                    user_text=parameters.get("user_text"),
-                ):
-                    # Wrong number detected - respond gracefully, do NOT create lead
-                    logger.info(f"Wrong number detected in call {call_id}")
-                    
-                    # Log as non-actionable
-                    try:
-                        log_vapi_webhook(
-                            session=session,
-                            call_id=call_id,
-                            event_type="wrong_number",
-                            summary="Wrong number/misdial detected",
-                        )
-                    except Exception:
-                        pass
-                    
-                    return {
-                        "speak": "No problem! Have a great day.",
-                        "action": "completed",
-                        "data": {
-                            "wrong_number": True,
-                            "non_actionable": True,
-                        },
-                    }
+                # Create lead with "Incomplete" tag/status
+                lead_result = await lead_service.upsert_service_lead(
+                    entities=entities,
+                    urgency_level=None,
+                    is_emergency=False,
+                    service_type=None,
+                    request_id=generate_request_id(),
+                    conversation_context=f"Incomplete call: {transcript[:500] if transcript else summary[:500]}",
+                    structured_params={
+                        "call_status": "Incomplete",
+                        "ended_reason": ended_reason,
+                        "duration_seconds": duration,
+                        "call_id": call_id,
+                    },
+                )
                 
-                # Check for profanity/abuse
-                if base_handler.detect_profanity_abuse(
-                    conversation_context=conversation_context,
-                    user_text=parameters.get("user_text"),
-                ):
-                    # Profanity/abuse detected - respond professionally, offer escalation
-                    logger.info(f"Profanity/abuse detected in call {call_id}")
+                if lead_result.get("lead_id"):
+                    logger.info("Created incomplete lead %s for call %s", lead_result["lead_id"], call_id)
                     
-                    # Log for tracking
+                    # Create callback task in Odoo (as an activity for Dispatch).
+                    # The "Call" activity type ID is cached by the lead service.
                     try:
-                        log_vapi_webhook(
-                            session=session,
-                            call_id=call_id,
-                            event_type="profanity_abuse",
-                            summary="Profanity or abusive language detected",
-                        )
-                    except Exception:
-                        pass
-                    
-                    return {
-                        "speak": (
-                            "I understand you're frustrated. Let me help resolve this. "
-                            "Would you like me to connect you with a manager who can better assist you?"
-                        ),
-                        "action": "needs_human",
-                        "data": {
-                            "profanity_abuse_detected": True,
-                            "escalation_offered": True,
-                            "professional_response": True,
-                        },
-                    }
-                
-                # Check for unclear speech (low confidence)
-                confidence = parameters.get("confidence") or parameters.get("speech_confidence")
-                retry_count = parameters.get("unclear_retry_count", 0)
-                if confidence is not None:
-                    unclear_response = base_handler.handle_unclear_speech(
-                        confidence=float(confidence),
-                        retry_count=int(retry_count),
-                    )
-                    if unclear_response:
-                        # Log unclear speech
-                        try:
-                            log_vapi_webhook(
-                                session=session,
-                                call_id=call_id,
-                                event_type="unclear_speech",
-                                summary=f"Unclear speech detected (confidence: {confidence})",
+                        dispatch_user_id = _SETTINGS.ODOO_DISPATCH_USER_ID
+                        if dispatch_user_id > 0:
+                            await lead_service.create_activity(
+                                lead_id=lead_result["lead_id"],
+                                user_id=dispatch_user_id,
+                                summary=f"Callback needed - Incomplete call ({ended_reason})",
+                                note=f"Call ended prematurely. Duration: {duration}s. Reason: {ended_reason}. Please call customer back.",
+                                activity_type_id=await lead_service._get_activity_type_id("Call"),
                             )
-                        except Exception:
-                            pass
-                        
-                        return {
-                            "speak": unclear_response.speak,
-                            "action": unclear_response.action,
-                            "data": unclear_response.data,
-                        }
-                
-                # Check for multiple intents (only if this is the first tool call in conversation)
-                # Skip if we're already processing a prioritized request
-                if not parameters.get("_prioritized_request"):
-                    multiple_intents = base_handler.detect_multiple_intents(
-                        conversation_context=conversation_context,
-                        user_text=parameters.get("user_text"),
-                    )
-                    if multiple_intents:
-                        logger.info(f"Multiple intents detected in call {call_id}: {multiple_intents}")
-                        multi_response = base_handler.format_multi_request_response(multiple_intents)
-                        return multi_response.to_dict()
+                        else:
+                            logger.info("ODOO_DISPATCH_USER_ID not set, skipping callback task")
+                    except Exception as task_err:
+                        logger.warning("Failed to create callback task: %s", task_err)
                 
-                # Execute tool
-                # Import tool registry and handler
-                from src.vapi.tools import get_tool_handler
-                from src.vapi.tools.base import handle_tool_call_with_base
-                
-                # Check if it's a direct tool (not hael_route)
-                tool_handler = get_tool_handler(tool_name)
-                
-                if tool_handler:
-                    # Direct tool call
-                    result = await handle_tool_call_with_base(
-                        tool_name=tool_name,
-                        tool_call_id=tool_call_id,
-                        parameters=parameters,
-                        call_id=call_id,
-                        conversation_context=parameters.get("conversation_context"),
+            except Exception as lead_err:
+                logger.warning("Failed to create incomplete lead: %s", lead_err)
+            
+            # Send SMS fallback
+            try:
+                sms_result = await send_incomplete_call_sms(to_phone=customer_phone)
+                if sms_result.get("status") == "sent":
+                    logger.info("Sent incomplete call SMS to %s", customer_phone)
+            except Exception as sms_err:
+                logger.warning("Failed to send incomplete call SMS: %s", sms_err)
+        
+    except Exception as incomplete_err:
+        logger.warning("Error handling incomplete call: %s", incomplete_err)
+
+
+# ============================================================================
+# Server Message Handlers
+# ============================================================================
+# Each handler takes (body, message, call_obj, call_id, background) so
+# vapi_server_url can dispatch on the message type with one dict lookup.
+
+async def _handle_tool_calls(
+    body: dict[str, Any],
+    message: dict[str, Any],
+    call_obj: dict[str, Any],
+    call_id: str | None,
+    background: BackgroundTasks,
+) -> Response:
+    """Execute the tool calls in a message and return their results in order."""
+    tool_call_list = message.get("toolCallList")
+    tool_with_list = message.get("toolWithToolCallList")
+    
+    # No tool calls (e.g. after a barge-in): answer with the shared empty body
+    if not tool_with_list and not tool_call_list:
+        return Response(content=_EMPTY_TOOL_RESULTS_BODY, media_type="application/json")
+    
+    # Debug: log the raw structure
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "tool-calls payload: toolCallList=%s, toolWithToolCallList=%s",
+            orjson.dumps(tool_call_list)[:500].decode(errors="replace"),
+            orjson.dumps(tool_with_list)[:500].decode(errors="replace"),
+        )
+    
+    # Helper to process a single tool call with idempotency + audit
+    async def process_tool_call(
+        tool_name: str,
+        tool_call_id: str,
+        parameters: dict,
+    ) -> dict[str, Any]:
+        """Process a tool call with idempotency checking and audit logging."""
+        # Generate idempotency key
+        idempotency_key = generate_key_hash(
+            VAPI_TOOL_SCOPE,
+            [call_id or "", tool_call_id]
+        )
+        
+        # Check idempotency: in-process cache first, then the DB
+        # (sync DB work runs off the event loop)
+        cached = _get_cached_tool_result(idempotency_key)
+        if cached is not None:
+            logger.info("Idempotency cache hit for %s, returning cached result", tool_call_id)
+            return cached
+        
+        existing = await asyncio.to_thread(_claim_idempotency_key, idempotency_key)
+        if existing is not None:
+            logger.info("Idempotency hit for %s, returning cached result", tool_call_id)
+            _cache_tool_result(idempotency_key, existing)
+            return existing
+        
+        # Extract call context from Vapi message
+        # Vapi can send phone number in multiple locations depending on message type
+        call_type = (call_obj.get("type") or "").strip().lower()
+
+        # Web call test mode: use static identity when enabled (for testing internal OPS from Vapi web)
+        settings = get_settings()
+        use_web_test_identity = settings.VAPI_WEB_CALLS_USE_TEST_IDENTITY
+        is_web_call = call_type in ("webcall", "web", "vapi.websocketcall")
+        # Fallback: no phone + test mode enabled → treat as web test (e.g. Vapi web doesn't send type)
+        caller_phone_raw = (
+            (call_obj.get("customer") or {}).get("number") or
+            call_obj.get("from") or
+            call_obj.get("customerNumber") or
+            call_obj.get("phoneNumber") or
+            call_obj.get("phone") or
+            message.get("from") or
+            message.get("phoneNumber") or
+            message.get("phone")
+        )
+        use_web_test = use_web_test_identity and (is_web_call or not caller_phone_raw)
+
+        if use_web_test:
+            test_role_str = settings.VAPI_WEB_TEST_ROLE
+            test_role = _WEB_TEST_ROLE_MAP[test_role_str]
+            caller_identity = CallerIdentity(
+                phone="web-test",
+                role=test_role,
+                employee_id="web-test",
+                name=f"Web Test ({test_role.value})",
+                is_active=True,
+                permissions=get_permissions_for_role(test_role),
+            )
+            caller_phone = "web-test"
+            masked_phone = caller_phone
+            logger.info(
+                "Web call using test identity: role=%s "
+                "(VAPI_WEB_CALLS_USE_TEST_IDENTITY=true, VAPI_WEB_TEST_ROLE=%s)",
+                test_role.value, test_role_str,
+            )
+        else:
+            caller_phone = caller_phone_raw
+            masked_phone = _mask_phone(caller_phone)
+
+            # Log extracted phone for debugging
+            if caller_phone:
+                logger.info("Extracted caller phone from Vapi message: %s", masked_phone)
+            else:
+                logger.warning(
+                    "No caller phone found in Vapi message. "
+                    "call.type=%s, Message keys: %s, Call keys: %s",
+                    call_type or "N/A",
+                    list(message),
+                    list(call_obj) if call_obj else "N/A",
+                )
+                if call_obj:
+                    logger.debug("Call object sample: %.200s", call_obj)
+
+            # Identify caller (Layer 1: Hybrid lookup)
+            caller_identity = None
+            if caller_phone:
+                try:
+                    caller_identity = await identify_caller(caller_phone)
+
+                    logger.info(
+                        "Caller identified: phone=%s, role=%s, name=%s, employee_id=%s",
+                        masked_phone,
+                        caller_identity.role.value,
+                        caller_identity.name or "Unknown",
+                        caller_identity.employee_id or "N/A",
                     )
-                elif tool_name == "hael_route":
-                    # Legacy hael_route tool (backward compatibility)
-                    result = await execute_hael_route(
-                        parameters=parameters,
-                        tool_call_id=tool_call_id,
-                        call_id=call_id,
+                except Exception as ident_err:
+                    logger.warning(
+                        "Caller identification failed for %s: %s", masked_phone, ident_err,
+                        exc_info=True,
                     )
-                else:
-                    # Unknown tool
-                    logger.warning(f"Unknown tool: {tool_name}")
-                    result = {
-                        "speak": f"I don't recognize the '{tool_name}' tool. Please try again.",
-                        "action": "error",
-                        "data": {"error": f"Unknown tool: {tool_name}"},
-                        "request_id": None,
-                    }
-                
-                # Ensure result is a dict (not ToolResponse or other type)
-                if not isinstance(result, dict):
-                    logger.warning(f"Tool {tool_name} returned non-dict result: {type(result)}")
-                    if hasattr(result, "to_dict"):
-                        result = result.to_dict()
-                    else:
-                        result = {
-                            "speak": "I encountered an error processing your request.",
-                            "action": "error",
-                            "data": {"error": f"Invalid response type: {type(result)}"},
-                        }
-                
-                # Validate result has required fields
-                if "speak" not in result:
-                    logger.error(f"Tool {tool_name} result missing 'speak' field: {result}")
-                    result = {
-                        "speak": "I encountered an error processing your request.",
-                        "action": "error",
-                        "data": {"error": "Missing 'speak' field in response"},
+                    caller_identity = replace(_DEFAULT_CUSTOMER_IDENTITY, phone=caller_phone or "")
+            else:
+                logger.warning(
+                    "No caller phone number available in Vapi message. "
+                    "Defaulting to 'customer' role. Internal OPS tools will be denied."
+                )
+                caller_identity = _DEFAULT_CUSTOMER_IDENTITY
+
+        # Check access (Layer 3: Permission check)
+        base_handler = BaseToolHandler(tool_name)
+        allowed, error_msg = base_handler.check_access(
+            tool_name=tool_name,
+            caller_role=caller_identity.role.value,
+            caller_is_active=caller_identity.is_active,
+        )
+        
+        if not allowed:
+            logger.warning(
+                "Access denied: tool=%s, caller_role=%s, caller_phone=%s",
+                tool_name, caller_identity.role.value, masked_phone,
+            )
+            return {
+                "speak": error_msg or "I'm sorry, you don't have access to this feature.",
+                "action": "error",
+                "data": {
+                    "error": "unauthorized",
+                    "role": caller_identity.role.value,
+                    "tool": tool_name
+                }
+            }
+        
+        # Add caller context to parameters (for tool handlers to use)
+        parameters["_caller_role"] = caller_identity.role.value
+        parameters["_caller_id"] = caller_identity.employee_id
+        parameters["_caller_name"] = caller_identity.name
+        parameters["_caller_phone"] = caller_identity.phone
+
+        # Returning customer: when caller is customer, look up partner by phone
+        if caller_identity.role.value == "customer" and caller_phone:
+            try:
+                lead_svc = await create_lead_service()
+                returning = await lead_svc.find_partner_by_phone(caller_phone)
+                if returning:
+                    parameters["_returning_customer"] = {
+                        "name": returning.get("name"),
+                        "partner_id": returning.get("partner_id"),
+                        "address": returning.get("address"),
                     }
-                
-                # Write audit log
-                try:
-                    odoo_data = result.get("data", {}).get("odoo") if result.get("data") else None
-                    log_vapi_tool_call(
-                        session=session,
-                        request_id=result.get("request_id"),
-                        call_id=call_id,
-                        tool_call_id=tool_call_id,
-                        intent=parameters.get("request_type"),
-                        brain=None,  # Could extract from result
-                        parameters=parameters,
-                        result=result,
-                        odoo_result=odoo_data,
-                        status="processed" if result.get("action") != "error" else "error",
-                        error_message=result.get("data", {}).get("error") if result.get("action") == "error" else None,
+                    logger.info(
+                        "Returning customer context: partner_id=%s, name=%s",
+                        returning.get("partner_id"), returning.get("name"),
                     )
-                except Exception as audit_err:
-                    logger.warning(f"Failed to write audit log: {audit_err}")
-                
-                # Complete idempotency
-                checker.complete(VAPI_TOOL_SCOPE, idempotency_key, result)
-                
-                return result
-                
-            finally:
-                session.close()
+            except Exception as rc_err:
+                logger.warning("Returning customer lookup failed: %s", rc_err)
         
-        # Prefer toolWithToolCallList if available
-        if tool_with_list:
-            results = []
-            for item in tool_with_list:
-                tool_name, tool_call_id, parameters = extract_tool_info(item)
-                
-                logger.info(f"Processing tool: name={tool_name}, id={tool_call_id}")
-                
-                result = await process_tool_call(tool_name, tool_call_id, parameters)
-                
-                results.append(ToolCallResult(
-                    toolCallId=tool_call_id,
-                    result=json.dumps(result),
-                ))
-            
-            return {"results": [r.model_dump() for r in results]}
+        # Conversation checks (wrong number, profanity/abuse, unclear speech,
+        # multiple intents) run as one pass over the conversation text.
+        # Multiple intents are skipped for an already prioritized request.
+        raw_context = parameters.get("conversation_context")
+        user_text = parameters.get("user_text")
+        conversation_context = raw_context or user_text or ""
+        confidence = parameters.get("confidence") or parameters.get("speech_confidence")
+        signal, signal_detail = base_handler.analyze_conversation(
+            conversation_context=conversation_context,
+            user_text=user_text,
+            confidence=confidence,
+            retry_count=parameters.get("unclear_retry_count", 0),
+            check_multiple_intents=not parameters.get("_prioritized_request"),
+        )
         
-        # Fallback to toolCallList
-        elif tool_call_list:
-            results = []
-            for tool_call in tool_call_list:
-                tool_call_id = tool_call.get("id", "")
-                tool_name = tool_call.get("name", "")
-                # Vapi uses "arguments" not "parameters" in toolCallList
-                parameters = tool_call.get("parameters", {}) or tool_call.get("arguments", {})
-                
-                logger.info(f"Processing tool (from toolCallList): name={tool_name}, id={tool_call_id}")
-                
-                result = await process_tool_call(tool_name, tool_call_id, parameters)
-                
-                results.append(ToolCallResult(
-                    toolCallId=tool_call_id,
-                    result=json.dumps(result),
-                ))
+        if signal is ConversationSignal.WRONG_NUMBER:
+            # Wrong number detected - respond gracefully, do NOT create lead
+            logger.info("Wrong number detected in call %s", call_id)
+            
+            # Log as non-actionable
+            background.add_task(
+                _record_webhook_event,
+                call_id=call_id,
+                event_type="wrong_number",
+                summary="Wrong number/misdial detected",
+            )
             
-            return {"results": [r.model_dump() for r in results]}
-        
-        # No tool calls found
-        return {"results": []}
-    
-    # -------------------------------------------------------------------------
-    # Handle transfer-destination-request
-    # -------------------------------------------------------------------------
-    elif message_type in ["transfer-destination-request", "handoff-destination-request"]:
-        response = get_transfer_destination()
-        
-        if response.destination:
             return {
-                "destination": response.destination.model_dump(),
+                "speak": "No problem! Have a great day.",
+                "action": "completed",
+                "data": {
+                    "wrong_number": True,
+                    "non_actionable": True,
+                },
             }
-        else:
+        
+        if signal is ConversationSignal.PROFANITY:
+            # Profanity/abuse detected - respond professionally, offer escalation
+            logger.info("Profanity/abuse detected in call %s", call_id)
+            
+            # Log for tracking
+            background.add_task(
+                _record_webhook_event,
+                call_id=call_id,
+                event_type="profanity_abuse",
+                summary="Profanity or abusive language detected",
+            )
+            
             return {
-                "error": response.error,
-                "message": response.message,
+                "speak": (
+                    "I understand you're frustrated. Let me help resolve this. "
+                    "Would you like me to connect you with a manager who can better assist you?"
+                ),
+                "action": "needs_human",
+                "data": {
+                    "profanity_abuse_detected": True,
+                    "escalation_offered": True,
+                    "professional_response": True,
+                },
             }
-    
-    # -------------------------------------------------------------------------
-    # Handle end-of-call-report
-    # -------------------------------------------------------------------------
-    elif message_type == "end-of-call-report":
-        # Log call summary for analytics
-        summary = message.get("summary", "")
-        duration = message.get("durationSeconds", 0)
-        ended_reason = message.get("endedReason", "")
-        transcript = message.get("transcript", "")
         
-        logger.info(
-            f"Call ended: call_id={call_id}, duration={duration}s, "
-            f"reason={ended_reason}, summary={summary[:100]}..."
+        if signal is ConversationSignal.UNCLEAR:
+            # Log unclear speech
+            background.add_task(
+                _record_webhook_event,
+                call_id=call_id,
+                event_type="unclear_speech",
+                summary=f"Unclear speech detected (confidence: {confidence})",
+            )
+            
+            return signal_detail.to_dict()
+        
+        if signal is ConversationSignal.MULTI_INTENT:
+            logger.info("Multiple intents detected in call %s: %s", call_id, signal_detail)
+            return base_handler.format_multi_request_response(signal_detail).to_dict()
+        
+        # Execute tool
+        # Check if it's a direct tool (not hael_route)
+        tool_handler = get_tool_handler(tool_name)
+        
+        if tool_handler:
+            # Direct tool call
+            result = await handle_tool_call_with_base(
+                tool_name=tool_name,
+                tool_call_id=tool_call_id,
+                parameters=parameters,
+                call_id=call_id,
+                conversation_context=raw_context,
+            )
+        elif tool_name == "hael_route":
+            # Legacy hael_route tool (backward compatibility)
+            result = await execute_hael_route(
+                parameters=parameters,
+                tool_call_id=tool_call_id,
+                call_id=call_id,
+            )
+        else:
+            # Unknown tool
+            logger.warning("Unknown tool: %s", tool_name)
+            result = _unknown_tool_result(tool_name)
+        
+        # Ensure result is a dict (not ToolResponse or other type)
+        if not isinstance(result, dict):
+            logger.warning("Tool %s returned non-dict result: %s", tool_name, type(result))
+            if hasattr(result, "to_dict"):
+                result = result.to_dict()
+            else:
+                result = _tool_error_result(f"Invalid response type: {type(result)}")
+        
+        # Validate result has required fields
+        if "speak" not in result:
+            logger.error("Tool %s result missing 'speak' field: %s", tool_name, result)
+            result = _tool_error_result("Missing 'speak' field in response")
+        
+        _cache_tool_result(idempotency_key, result)
+        
+        # Audit log and idempotency completion run after the response is sent
+        background.add_task(
+            _record_tool_call,
+            call_id=call_id,
+            tool_call_id=tool_call_id,
+            idempotency_key=idempotency_key,
+            parameters=parameters,
+            result=result,
         )
         
-        # Store in audit_log for KPI reporting
-        try:
-            session_factory = get_session_factory()
-            session = session_factory()
-            try:
-                log_vapi_webhook(
-                    session=session,
-                    call_id=call_id,
-                    event_type="end-of-call-report",
-                    summary=summary,
-                    duration_seconds=duration,
-                    ended_reason=ended_reason,
+        return result
+    
+    async def run_tool_calls(calls: list[tuple[str, str, dict]]) -> Response:
+        """Run tool calls concurrently and return their results in order."""
+        outcomes = await asyncio.gather(
+            *(process_tool_call(*call) for call in calls),
+            return_exceptions=True,
+        )
+        
+        results = []
+        for (tool_name, tool_call_id, _), result in zip(calls, outcomes):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Tool %s (%s) failed: %s", tool_name, tool_call_id, result,
+                    exc_info=result,
                 )
-            finally:
-                session.close()
-        except Exception as audit_err:
-            logger.warning(f"Failed to audit end-of-call: {audit_err}")
+                result = _tool_error_result(str(result))
+            # Plain dicts in the ToolCallResult shape; Vapi expects the
+            # result as a JSON string, encoded once here
+            results.append({
+                "toolCallId": tool_call_id,
+                "result": orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode(),
+            })
         
-        # ── Post-call structured output processing ──
-        # Route to the correct processor based on output names:
-        #   - OPS outputs (e.g., "FSM Subtask Request") → OpsPostCallProcessor
-        #   - Customer inbound outputs → PostCallProcessor
-        # Runs as a background task so we return 200 to VAPI immediately.
-        try:
-            artifact = message.get("artifact", {})
-            structured_outputs = artifact.get("structuredOutputs", [])
-
-            # Extract recording URL (new VAPI format, with legacy fallback)
-            _recording = artifact.get("recording", {})
-            recording_url = (
-                _recording.get("url") if isinstance(_recording, dict) else None
-            ) or message.get("recordingUrl")
-            if recording_url:
-                logger.info("Recording URL available for call %s", call_id)
-
-            if structured_outputs:
-                # Extract output names for routing
-                _raw_outputs = list(structured_outputs.values()) if isinstance(structured_outputs, dict) else structured_outputs
-                _output_names = {
-                    o.get("name", "") for o in _raw_outputs
-                    if isinstance(o, dict) and o.get("name")
-                }
+        return _json_response({"results": results})
+    
+    # Prefer toolWithToolCallList if available, else fall back to toolCallList
+    if tool_with_list:
+        items, extract_info, source = tool_with_list, _extract_tool_info, "toolWithToolCallList"
+    else:
+        items, extract_info, source = tool_call_list, _extract_tool_call_list_info, "toolCallList"
+    
+    calls = []
+    for item in items:
+        tool_name, tool_call_id, parameters = extract_info(item)
+        logger.info("Processing tool (from %s): name=%s, id=%s", source, tool_name, tool_call_id)
+        calls.append((tool_name, tool_call_id, parameters))
+    
+    return await run_tool_calls(calls)
 
-                # OPS outputs → OpsPostCallProcessor (separate infrastructure)
-                _OPS_OUTPUT_NAMES = {"FSM Subtask Request"}
-                if _output_names & _OPS_OUTPUT_NAMES:
-                    from src.api.ops_post_call_processor import OpsPostCallProcessor
 
-                    ops_processor = OpsPostCallProcessor()
-                    asyncio.create_task(
-                        ops_processor.process(call_id, body, recording_url=recording_url)
-                    )
-                    logger.info(
-                        "Launched OPS post-call processor for call %s (outputs: %s)",
-                        call_id, _output_names & _OPS_OUTPUT_NAMES,
-                    )
-                else:
-                    # Customer inbound outputs → PostCallProcessor
-                    from src.api.post_call_processor import PostCallProcessor
+async def _handle_transfer_destination(
+    body: dict[str, Any],
+    message: dict[str, Any],
+    call_obj: dict[str, Any],
+    call_id: str | None,
+    background: BackgroundTasks,
+) -> Response:
+    """Return the transfer destination for the current business-hours state."""
+    return Response(
+        content=_TRANSFER_DESTINATION_BODIES[is_business_hours()],
+        media_type="application/json",
+    )
 
-                    processor = PostCallProcessor()
-                    asyncio.create_task(
-                        processor.process(call_id, body, recording_url=recording_url)
-                    )
-                    logger.info(
-                        "Launched post-call processor for call %s (%d structured outputs)",
-                        call_id, len(structured_outputs),
-                    )
-        except Exception as proc_err:
-            logger.warning("Failed to launch post-call processor for call %s: %s", call_id, proc_err)
-
-        # Detect incomplete calls and send SMS fallback
-        incomplete_reasons = [
-            "hangup",
-            "disconnected",
-            "failed",
-            "busy",
-            "no-answer",
-            "canceled",
-        ]
-        is_incomplete = (
-            ended_reason.lower() in incomplete_reasons
-            or duration < 30  # Very short calls (< 30 seconds)
-            or (duration < 120 and not summary)  # Short calls with no summary
+
+async def _handle_end_of_call(
+    body: dict[str, Any],
+    message: dict[str, Any],
+    call_obj: dict[str, Any],
+    call_id: str | None,
+    background: BackgroundTasks,
+) -> Response:
+    """Record the call summary, launch post-call processing, and flag incomplete calls."""
+    # Log call summary for analytics
+    summary = message.get("summary", "")
+    duration = message.get("durationSeconds", 0)
+    ended_reason = message.get("endedReason", "")
+    transcript = message.get("transcript", "")
+    
+    logger.info(
+        "Call ended: call_id=%s, duration=%ss, reason=%s, summary=%.100s...",
+        call_id, duration, ended_reason, summary,
+    )
+    
+    # Store in audit_log for KPI reporting
+    background.add_task(
+        _record_webhook_event,
+        call_id=call_id,
+        event_type="end-of-call-report",
+        summary=summary,
+        duration_seconds=duration,
+        ended_reason=ended_reason,
+    )
+    
+    # ── Post-call structured output processing ──
+    # Route to the correct processor based on output names:
+    #   - OPS outputs (e.g., "FSM Subtask Request") → OpsPostCallProcessor
+    #   - Customer inbound outputs → PostCallProcessor
+    # Runs as a background task so we return 200 to VAPI immediately.
+    try:
+        artifact = message.get("artifact", {})
+        structured_outputs = artifact.get("structuredOutputs", [])
+
+        # Extract recording URL (new VAPI format, with legacy fallback)
+        _recording = artifact.get("recording", {})
+        recording_url = (
+            _recording.get("url") if isinstance(_recording, dict) else None
+        ) or message.get("recordingUrl")
+        if recording_url:
+            logger.info("Recording URL available for call %s", call_id)
+
+        if structured_outputs:
+            # Extract output names for routing
+            _raw_outputs = list(structured_outputs.values()) if isinstance(structured_outputs, dict) else structured_outputs
+            _output_names = {
+                o.get("name", "") for o in _raw_outputs
+                if isinstance(o, dict) and o.get("name")
+            }
+
+            # OPS outputs → OpsPostCallProcessor (separate infrastructure)
+            _OPS_OUTPUT_NAMES = {"FSM Subtask Request"}
+            if _output_names & _OPS_OUTPUT_NAMES:
+                from src.api.ops_post_call_processor import OpsPostCallProcessor
+
+                ops_processor = OpsPostCallProcessor()
+                asyncio.create_task(
+                    ops_processor.process(call_id, body, recording_url=recording_url)
+                )
+                logger.info(
+                    "Launched OPS post-call processor for call %s (outputs: %s)",
+                    call_id, _output_names & _OPS_OUTPUT_NAMES,
+                )
+            else:
+                # Customer inbound outputs → PostCallProcessor
+                from src.api.post_call_processor import PostCallProcessor
+
+                processor = PostCallProcessor()
+                asyncio.create_task(
+                    processor.process(call_id, body, recording_url=recording_url)
+                )
+                logger.info(
+                    "Launched post-call processor for call %s (%d structured outputs)",
+                    call_id, len(structured_outputs),
+                )
+    except Exception as proc_err:
+        logger.warning("Failed to launch post-call processor for call %s: %s", call_id, proc_err)
+
+    # Detect incomplete calls and send SMS fallback
+    is_incomplete = (
+        ended_reason.lower() in _INCOMPLETE_REASONS
+        or duration < 30  # Very short calls (< 30 seconds)
+        or (duration < 120 and not summary)  # Short calls with no summary
+    )
+    
+    if is_incomplete:
+        background.add_task(
+            _handle_incomplete_call,
+            message=message,
+            call_id=call_id,
+            summary=summary,
+            duration=duration,
+            ended_reason=ended_reason,
+            transcript=transcript,
         )
-        
-        if is_incomplete:
-            try:
-                # Extract phone number from call data
-                call_data = message.get("call", {})
-                customer_phone = call_data.get("customer", {}).get("number") or call_data.get("from")
-                
-                if customer_phone:
-                    # Extract partial data from transcript/summary
-                    partial_data = {
-                        "call_id": call_id,
-                        "duration": duration,
-                        "ended_reason": ended_reason,
-                        "transcript": transcript[:500] if transcript else "",
-                        "summary": summary[:500] if summary else "",
-                    }
-                    
-                    # Try to extract customer name and other info from transcript
-                    name_match = re.search(r'(?:name|i\'m|this is|my name is)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', transcript, re.IGNORECASE)
-                    if name_match:
-                        partial_data["customer_name"] = name_match.group(1)
-                    
-                    phone_match = re.search(r'(\+?1?\d{10,11})', transcript)
-                    if phone_match and not customer_phone:
-                        customer_phone = phone_match.group(1)
-                    
-                    address_match = re.search(r'(\d+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Court|Ct|Place|Pl)[^,]*,\s*[A-Z][a-z]+\s+[A-Z]{2}\s+\d{5})', transcript, re.IGNORECASE)
-                    if address_match:
-                        partial_data["address"] = address_match.group(1)
-                    
-                    # Create partial lead with "Incomplete" status
-                    try:
-                        from src.integrations.odoo_leads import create_lead_service
-                        from src.hael.schema import Entity, Intent
-                        from src.utils.request_id import generate_request_id
-                        
-                        lead_service = await create_lead_service()
-                        
-                        # Build minimal entity for incomplete lead
-                        entities = Entity(
-                            full_name=partial_data.get("customer_name"),
-                            phone=customer_phone,
-                            address=partial_data.get("address"),
-                            problem_description=f"Incomplete call - {ended_reason}. Duration: {duration}s. {summary[:200] if summary else ''}",
-                        )
-                        
-                        # Create lead with "Incomplete" tag/status
-                        lead_result = await lead_service.upsert_service_lead(
-                            entities=entities,
-                            urgency_level=None,
-                            is_emergency=False,
-                            service_type=None,
-                            request_id=generate_request_id(),
-                            conversation_context=f"Incomplete call: {transcript[:500] if transcript else summary[:500]}",
-                            structured_params={
-                                "call_status": "Incomplete",
-                                "ended_reason": ended_reason,
-                                "duration_seconds": duration,
-                                "call_id": call_id,
-                            },
-                        )
-                        
-                        if lead_result.get("lead_id"):
-                            logger.info(f"Created incomplete lead {lead_result['lead_id']} for call {call_id}")
-                            
-                            # Create callback task in Odoo (as an activity)
-                            try:
-                                await lead_service.client.create("mail.activity", {
-                                    "res_id": lead_result["lead_id"],
-                                    "res_model": "crm.lead",
-                                    "activity_type_id": await lead_service._get_activity_type_id("Call"),
-                                    "summary": f"Callback needed - Incomplete call ({ended_reason})",
-                                    "note": f"Call ended prematurely. Duration: {duration}s. Reason: {ended_reason}. Please call customer back.",
-                                    "user_id": await lead_service._get_user_id("dispatch"),
-                                })
-                            except Exception as task_err:
-                                logger.warning(f"Failed to create callback task: {task_err}")
-                        
-                    except Exception as lead_err:
-                        logger.warning(f"Failed to create incomplete lead: {lead_err}")
-                    
-                    # Send SMS fallback
-                    try:
-                        from src.integrations.twilio_sms import send_incomplete_call_sms
-                        sms_result = await send_incomplete_call_sms(to_phone=customer_phone)
-                        if sms_result.get("status") == "sent":
-                            logger.info(f"Sent incomplete call SMS to {customer_phone}")
-                    except Exception as sms_err:
-                        logger.warning(f"Failed to send incomplete call SMS: {sms_err}")
-                
-            except Exception as incomplete_err:
-                logger.warning(f"Error handling incomplete call: {incomplete_err}")
-        
-        return {"status": "ok"}
     
-    # -------------------------------------------------------------------------
-    # Handle status-update
-    # -------------------------------------------------------------------------
-    elif message_type == "status-update":
-        status = message.get("status", "")
-        logger.info(f"Call status update: call_id={call_id}, status={status}")
-        return {"status": "ok"}
+    return _status_ok_response()
+
+
+async def _handle_status_update(
+    body: dict[str, Any],
+    message: dict[str, Any],
+    call_obj: dict[str, Any],
+    call_id: str | None,
+    background: BackgroundTasks,
+) -> Response:
+    """Log a call status change."""
+    status = message.get("status", "")
+    logger.info("Call status update: call_id=%s, status=%s", call_id, status)
+    return _status_ok_response()
+
+
+async def _handle_ack(
+    body: dict[str, Any],
+    message: dict[str, Any],
+    call_obj: dict[str, Any],
+    call_id: str | None,
+    background: BackgroundTasks,
+) -> Response:
+    """Acknowledge a message that needs no processing."""
+    return _status_ok_response()
+
+
+async def _handle_unknown_message(
+    body: dict[str, Any],
+    message: dict[str, Any],
+    call_obj: dict[str, Any],
+    call_id: str | None,
+    background: BackgroundTasks,
+) -> Response:
+    """Acknowledge an unrecognized message type."""
+    logger.warning("Unknown Vapi message type: %s", message.get("type", "unknown"))
+    return _status_ok_response()
+
+
+# Vapi message type -> server message handler
+_MESSAGE_HANDLERS = {
+    "tool-calls": _handle_tool_calls,
+    "transfer-destination-request": _handle_transfer_destination,
+    "handoff-destination-request": _handle_transfer_destination,
+    "end-of-call-report": _handle_end_of_call,
+    "status-update": _handle_status_update,
+    "transcript": _handle_ack,
+    "conversation-update": _handle_ack,
+}
+
+
+# ============================================================================
+# Main Server URL Endpoint
+# ============================================================================
+
+@router.post("/server")
+async def vapi_server_url(request: Request, background: BackgroundTasks) -> Response:
+    """
+    Vapi Server URL endpoint.
     
-    # -------------------------------------------------------------------------
-    # Handle transcript updates
-    # -------------------------------------------------------------------------
-    elif message_type == "transcript":
-        # Just acknowledge - don't need to process
-        return {"status": "ok"}
+    Handles all Vapi server messages:
+    - tool-calls: Execute tools and return results
+    - transfer-destination-request: Return transfer destination
+    - end-of-call-report: Log call summary
+    - status-update: Log status changes
+    
+    Signature verification is handled by WebhookVerificationMiddleware.
+    """
+    raw_body = await request.body()
     
-    # -------------------------------------------------------------------------
-    # Handle conversation-update
-    # -------------------------------------------------------------------------
-    elif message_type == "conversation-update":
-        # Just acknowledge
-        return {"status": "ok"}
+    # Transcript and conversation updates stream continuously during a call
+    # and are only acknowledged, so skip decoding them
+    if _peek_message_type(raw_body) in _ACK_ONLY_MESSAGE_TYPES:
+        return _status_ok_response()
     
-    # -------------------------------------------------------------------------
-    # Unknown message type
-    # -------------------------------------------------------------------------
-    else:
-        logger.warning(f"Unknown Vapi message type: {message_type}")
-        return {"status": "ok"}
+    try:
+        body = orjson.loads(raw_body)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    
+    message = body.get("message") or {}
+    message_type = message.get("type", "unknown")
+    
+    # Extract call_id from multiple possible locations
+    # Vapi sometimes puts it in message.call.id, sometimes in message.callId
+    # ("or {}" also covers an explicit null call object)
+    call_obj = message.get("call") or {}
+    body_call = body.get("call") or {}
+    call_id = (
+        call_obj.get("id") or
+        message.get("callId") or
+        message.get("call_id") or
+        body.get("callId") or
+        body.get("call_id") or
+        body_call.get("id")
+    )
+    
+    logger.info("Vapi server message: type=%s, call_id=%s", message_type, call_id)
+    
+    # A malformed (unhashable) type is acknowledged like any unknown type
+    handler = (
+        _MESSAGE_HANDLERS.get(message_type, _handle_unknown_message)
+        if isinstance(message_type, str)
+        else _handle_unknown_message
+    )
+    return await handler(body, message, call_obj, call_id, background)
 
 
 @router.get("/server/health")
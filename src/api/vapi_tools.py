@@ -11,23 +11,17 @@ from typing import Any
 from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field
 
-from src.hael import (
-    Brain,
-    Channel,
-    RuleBasedExtractor,
-    build_hael_command,
-    route_command,
-)
-from src.brains.ops import handle_ops_command
-from src.brains.core import handle_core_command
-from src.brains.revenue import handle_revenue_command
-from src.brains.people import handle_people_command
+from src.hael import Channel, RuleBasedExtractor
+from src.brains.dispatch import run_hael
 from src.utils.request_id import get_request_id, generate_request_id
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/vapi/tools", tags=["vapi"])
 
+# RuleBasedExtractor holds no per-call state, so one instance is shared across requests
+_EXTRACTOR = RuleBasedExtractor()
+
 
 class VapiToolRequest(BaseModel):
     """Request schema for Vapi tool calls."""
@@ -58,19 +52,14 @@ async def hael_route(request: VapiToolRequest) -> VapiToolResponse:
 
     try:
         # Extract intent and entities
-        extractor = RuleBasedExtractor()
-        extraction = extractor.extract(request.user_text)
-
-        # Route to brain
-        routing = route_command(extraction)
+        extraction = _EXTRACTOR.extract(request.user_text)
 
-        # Build command
-        command = build_hael_command(
-            request_id=request.request_id,
+        # Route, build the command, and run it through its brain
+        _, result = await run_hael(
+            extraction,
             channel=Channel.VOICE,
             raw_text=request.user_text,
-            extraction=extraction,
-            routing=routing,
+            request_id=request.request_id,
             metadata={
                 "call_id": request.call_id,
                 "tool_call_id": request.tool_call_id,
@@ -78,27 +67,7 @@ async def hael_route(request: VapiToolRequest) -> VapiToolResponse:
             },
         )
 
-        # Route to brain handler
-        if routing.brain == Brain.OPS:
-            result = await handle_ops_command(command)
-            speak = result.message
-            action = "completed" if result.status.value == "success" else "needs_human"
-            data = result.data
-
-        elif routing.brain == Brain.CORE:
-            result = handle_core_command(command)
-            speak = result.message
-            action = "completed" if result.status.value == "success" else "needs_human"
-            data = result.data
-
-        elif routing.brain == Brain.REVENUE:
-            result = handle_revenue_command(command)
-            speak = result.message
-            action = "completed" if result.status.value == "success" else "needs_human"
-            data = result.data
-
-        elif routing.brain == Brain.PEOPLE:
-            result = handle_people_command(command)
+        if result is not None:
             speak = result.message
             action = "completed" if result.status.value == "success" else "needs_human"
             data = result.data
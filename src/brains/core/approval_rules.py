@@ -4,6 +4,7 @@ HAES HVAC - CORE Brain Approval Rules
 Deterministic approval thresholds from RDD Section 3.
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from enum import Enum
 
@@ -126,6 +127,32 @@ DISCOUNT_APPROVALS = [
 ]
 
 
+def _index_thresholds(
+    thresholds: list[ApprovalThreshold],
+) -> tuple[tuple[float, ...], tuple[ApprovalThreshold, ...]]:
+    """
+    Index an ascending threshold list by its inclusive upper bounds.
+    
+    The first threshold whose max_amount covers an amount is the only one that
+    can match it, so lookups bisect on max_amount (None = unlimited) and then
+    check min_amount. Amounts in the gaps between ranges still fall through.
+    """
+    maxes = tuple(
+        float("inf") if threshold.max_amount is None else threshold.max_amount
+        for threshold in thresholds
+    )
+    return maxes, tuple(thresholds)
+
+
+# Approval type -> (upper bounds, thresholds), indexed once at import
+_THRESHOLD_INDEX = {
+    ApprovalType.QUOTE: _index_thresholds(QUOTE_APPROVALS),
+    ApprovalType.PURCHASE_ORDER: _index_thresholds(PO_APPROVALS),
+    ApprovalType.REFUND: _index_thresholds(REFUND_APPROVALS),
+    ApprovalType.DISCOUNT: _index_thresholds(DISCOUNT_APPROVALS),
+}
+
+
 def get_approval_decision(
     approval_type: ApprovalType,
     amount: float,
@@ -142,25 +169,22 @@ def get_approval_decision(
     Returns:
         ApprovalDecision with approver and rule info
     """
-    # Select threshold list
-    if approval_type == ApprovalType.QUOTE:
-        thresholds = QUOTE_APPROVALS
-    elif approval_type == ApprovalType.PURCHASE_ORDER:
-        thresholds = PO_APPROVALS
-        # Check capital equipment override
-        if is_capital_equipment and amount > CAPITAL_EQUIPMENT_THRESHOLD:
-            return ApprovalDecision(
-                approval_required=True,
-                approver=CAPITAL_EQUIPMENT_APPROVER,
-                threshold_rule_id="po_capital_equipment",
-                reason=f"Capital equipment over ${CAPITAL_EQUIPMENT_THRESHOLD}",
-                amount=amount,
-            )
-    elif approval_type == ApprovalType.REFUND:
-        thresholds = REFUND_APPROVALS
-    elif approval_type == ApprovalType.DISCOUNT:
-        thresholds = DISCOUNT_APPROVALS
-    else:
+    # Check capital equipment override
+    if (
+        approval_type == ApprovalType.PURCHASE_ORDER
+        and is_capital_equipment
+        and amount > CAPITAL_EQUIPMENT_THRESHOLD
+    ):
+        return ApprovalDecision(
+            approval_required=True,
+            approver=CAPITAL_EQUIPMENT_APPROVER,
+            threshold_rule_id="po_capital_equipment",
+            reason=f"Capital equipment over ${CAPITAL_EQUIPMENT_THRESHOLD}",
+            amount=amount,
+        )
+    
+    index = _THRESHOLD_INDEX.get(approval_type)
+    if index is None:
         return ApprovalDecision(
             approval_required=True,
             approver="Junior",
@@ -170,18 +194,17 @@ def get_approval_decision(
         )
     
     # Find matching threshold
-    for threshold in thresholds:
-        min_match = amount >= threshold.min_amount
-        max_match = threshold.max_amount is None or amount <= threshold.max_amount
-        
-        if min_match and max_match:
-            return ApprovalDecision(
-                approval_required=threshold.approver != "auto",
-                approver=threshold.approver if threshold.approver != "auto" else None,
-                threshold_rule_id=threshold.rule_id,
-                reason=f"Amount ${amount:.2f} falls in {threshold.rule_id} range",
-                amount=amount,
-            )
+    maxes, thresholds = index
+    position = bisect_left(maxes, amount)
+    if position < len(thresholds) and amount >= thresholds[position].min_amount:
+        threshold = thresholds[position]
+        return ApprovalDecision(
+            approval_required=threshold.approver != "auto",
+            approver=threshold.approver if threshold.approver != "auto" else None,
+            threshold_rule_id=threshold.rule_id,
+            reason=f"Amount ${amount:.2f} falls in {threshold.rule_id} range",
+            amount=amount,
+        )
     
     # Default to owner approval if no threshold matched
     return ApprovalDecision(
@@ -191,4 +214,3 @@ def get_approval_decision(
         reason="No matching threshold - defaults to owner approval",
         amount=amount,
     )
-
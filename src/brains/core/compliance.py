@@ -4,6 +4,8 @@ HAES HVAC - CORE Brain Compliance
 Required disclosures, license info, and warranty terms from RDD.
 """
 
+import re
+
 from src.brains.core.schema import ComplianceDisclosure
 
 
@@ -44,6 +46,22 @@ WARRANTY_TERMS_TEXT = (
     "Warranty work must be scheduled through HAES to remain valid."
 )
 
+# Disclosures are built from constants only, so they are assembled once and
+# shared (ComplianceDisclosure is frozen)
+_REQUIRED_DISCLOSURES = ComplianceDisclosure(
+    license_number=TDLR_LICENSE_NUMBER,
+    regulatory_body=TDLR_REGULATORY_BODY,
+    disclosure_text=TDLR_DISCLOSURE_TEXT,
+    warranty_terms=WARRANTY_TERMS_TEXT,
+)
+
+# Invoice footer text
+_INVOICE_DISCLOSURES = (
+    f"License: {TDLR_LICENSE_NUMBER}\n"
+    f"{TDLR_DISCLOSURE_TEXT}\n\n"
+    f"Warranty: {WARRANTY_TERMS_TEXT}"
+)
+
 
 def get_required_disclosures() -> ComplianceDisclosure:
     """
@@ -52,12 +70,12 @@ def get_required_disclosures() -> ComplianceDisclosure:
     Returns:
         ComplianceDisclosure with all required information
     """
-    return ComplianceDisclosure(
-        license_number=TDLR_LICENSE_NUMBER,
-        regulatory_body=TDLR_REGULATORY_BODY,
-        disclosure_text=TDLR_DISCLOSURE_TEXT,
-        warranty_terms=WARRANTY_TERMS_TEXT,
-    )
+    return _REQUIRED_DISCLOSURES
+
+
+# Service types covered by the equipment labor warranty; everything else
+# gets the repair labor warranty
+_EQUIPMENT_SERVICE_RE = re.compile(r"install|replacement", re.IGNORECASE)
 
 
 def get_warranty_for_service_type(service_type: str) -> dict:
@@ -70,12 +88,9 @@ def get_warranty_for_service_type(service_type: str) -> dict:
     Returns:
         Warranty details dictionary
     """
-    if "install" in service_type.lower() or "replacement" in service_type.lower():
+    if _EQUIPMENT_SERVICE_RE.search(service_type):
         return WARRANTY_TERMS["labor_equipment"]
-    elif "repair" in service_type.lower():
-        return WARRANTY_TERMS["labor_repair"]
-    else:
-        return WARRANTY_TERMS["labor_repair"]
+    return WARRANTY_TERMS["labor_repair"]
 
 
 def format_invoice_disclosures() -> str:
@@ -85,9 +100,5 @@ def format_invoice_disclosures() -> str:
     Returns:
         Formatted disclosure text for invoice footer
     """
-    return (
-        f"License: {TDLR_LICENSE_NUMBER}\n"
-        f"{TDLR_DISCLOSURE_TEXT}\n\n"
-        f"Warranty: {WARRANTY_TERMS_TEXT}"
-    )
+    return _INVOICE_DISCLOSURES
 
@@ -6,7 +6,9 @@ Handles pricing, billing, approvals, and compliance.
 """
 
 import logging
+from collections.abc import Callable
 from datetime import datetime
+from itertools import product
 
 from src.hael.schema import HaelCommand, Intent
 from src.brains.core.schema import (
@@ -23,14 +25,21 @@ from src.brains.core.compliance import get_required_disclosures
 
 logger = logging.getLogger(__name__)
 
-# Supported CORE intents
-CORE_INTENTS = {
-    Intent.BILLING_INQUIRY,
-    Intent.PAYMENT_TERMS_INQUIRY,
-    Intent.INVOICE_REQUEST,
-    Intent.INVENTORY_INQUIRY,
-    Intent.PURCHASE_REQUEST,
-}
+# Fixed handler messages
+_MSG_NEED_CONTACT_BILLING = "Need contact information to look up billing details"
+_MSG_BILLING = "I can help you with billing information. Let me look up your account."
+_MSG_NEED_CONTACT_INVOICE = "Need contact information to send invoice"
+_MSG_INVOICE_TO_EMAIL_ON_FILE = (
+    "I'll look up your invoice and send it to the email address we have on file. "
+    "If you'd like it sent to a different email, please provide it."
+)
+_MSG_INVOICE_DEFAULT = "I'll send a copy of your invoice to your email on file."
+_MSG_NEED_CONTACT_PURCHASE = "Need contact information to process purchase request"
+_MSG_PURCHASE = (
+    "I can help with your purchase request. "
+    "A representative will follow up with pricing and availability."
+)
+_MSG_INVENTORY = "I can check on parts availability. What specific part or equipment are you looking for?"
 
 
 def handle_core_command(command: HaelCommand) -> CoreResult:
@@ -45,10 +54,11 @@ def handle_core_command(command: HaelCommand) -> CoreResult:
     Returns:
         CoreResult with operation outcome
     """
-    logger.info(f"CORE brain handling command: {command.intent.value}")
+    logger.info("CORE brain handling command: %s", command.intent.value)
     
     # Check if intent is supported
-    if command.intent not in CORE_INTENTS:
+    handler = _INTENT_DISPATCH.get(command.intent)
+    if handler is None:
         return CoreResult(
             status=CoreStatus.UNSUPPORTED_INTENT,
             message=f"Intent '{command.intent.value}' is not handled by CORE brain",
@@ -66,24 +76,9 @@ def handle_core_command(command: HaelCommand) -> CoreResult:
     
     # Route to specific handler
     try:
-        if command.intent == Intent.BILLING_INQUIRY:
-            return _handle_billing_inquiry(command)
-        elif command.intent == Intent.PAYMENT_TERMS_INQUIRY:
-            return _handle_payment_terms_inquiry(command)
-        elif command.intent == Intent.INVOICE_REQUEST:
-            return _handle_invoice_request(command)
-        elif command.intent == Intent.INVENTORY_INQUIRY:
-            return _handle_inventory_inquiry(command)
-        elif command.intent == Intent.PURCHASE_REQUEST:
-            return _handle_purchase_request(command)
-        else:
-            return CoreResult(
-                status=CoreStatus.ERROR,
-                message=f"Unhandled intent: {command.intent.value}",
-                requires_human=True,
-            )
+        return handler(command)
     except Exception as e:
-        logger.exception(f"Error handling CORE command: {e}")
+        logger.exception("Error handling CORE command: %s", e)
         return CoreResult(
             status=CoreStatus.ERROR,
             message=f"Internal error: {str(e)}",
@@ -94,12 +89,14 @@ def handle_core_command(command: HaelCommand) -> CoreResult:
 def _handle_billing_inquiry(command: HaelCommand) -> CoreResult:
     """Handle billing inquiry."""
     entities = command.entities
+    phone = entities.phone
+    email = entities.email
     
     # Need identity to lookup billing info
-    if not (entities.phone or entities.email):
+    if not (phone or email):
         return CoreResult(
             status=CoreStatus.NEEDS_HUMAN,
-            message="Need contact information to look up billing details",
+            message=_MSG_NEED_CONTACT_BILLING,
             requires_human=True,
             missing_fields=["phone or email"],
         )
@@ -109,12 +106,12 @@ def _handle_billing_inquiry(command: HaelCommand) -> CoreResult:
     
     return CoreResult(
         status=CoreStatus.SUCCESS,
-        message="I can help you with billing information. Let me look up your account.",
+        message=_MSG_BILLING,
         requires_human=False,
         compliance=compliance,
         data={
-            "contact_phone": entities.phone,
-            "contact_email": entities.email,
+            "contact_phone": phone,
+            "contact_email": email,
             "action": "lookup_billing",
         },
     )
@@ -125,12 +122,13 @@ def _handle_payment_terms_inquiry(command: HaelCommand) -> CoreResult:
     entities = command.entities
     
     # Determine customer segment (if known)
+    property_type = entities.property_type
     segment = None
-    if entities.property_type == "commercial":
+    if property_type == "commercial":
         segment = "commercial"
-    elif entities.property_type == "residential":
+    elif property_type == "residential":
         segment = "residential"
-    elif entities.property_type == "property_management":
+    elif property_type == "property_management":
         segment = "property_management"
     
     # Get payment terms
@@ -151,31 +149,33 @@ def _handle_payment_terms_inquiry(command: HaelCommand) -> CoreResult:
 def _handle_invoice_request(command: HaelCommand) -> CoreResult:
     """Handle invoice request."""
     entities = command.entities
+    phone = entities.phone
+    email = entities.email
     
     # Need identity to send invoice
-    if not (entities.phone or entities.email):
+    if not (phone or email):
         return CoreResult(
             status=CoreStatus.NEEDS_HUMAN,
-            message="Need contact information to send invoice",
+            message=_MSG_NEED_CONTACT_INVOICE,
             requires_human=True,
             missing_fields=["phone or email"],
         )
     
     # Build appropriate message based on available contact info
-    if entities.email:
-        message = f"I'll send a copy of your invoice to {entities.email}."
-    elif entities.phone:
-        message = "I'll look up your invoice and send it to the email address we have on file. If you'd like it sent to a different email, please provide it."
+    if email:
+        message = f"I'll send a copy of your invoice to {email}."
+    elif phone:
+        message = _MSG_INVOICE_TO_EMAIL_ON_FILE
     else:
-        message = "I'll send a copy of your invoice to your email on file."
+        message = _MSG_INVOICE_DEFAULT
     
     return CoreResult(
         status=CoreStatus.SUCCESS,
         message=message,
         requires_human=False,
         data={
-            "contact_email": entities.email,
-            "contact_phone": entities.phone,
+            "contact_email": email,
+            "contact_phone": phone,
             "action": "send_invoice",
         },
     )
@@ -186,7 +186,7 @@ def _handle_inventory_inquiry(command: HaelCommand) -> CoreResult:
     # General inquiry - doesn't require identity
     return CoreResult(
         status=CoreStatus.SUCCESS,
-        message="I can check on parts availability. What specific part or equipment are you looking for?",
+        message=_MSG_INVENTORY,
         requires_human=False,
         data={
             "action": "inventory_lookup",
@@ -197,52 +197,53 @@ def _handle_inventory_inquiry(command: HaelCommand) -> CoreResult:
 def _handle_purchase_request(command: HaelCommand) -> CoreResult:
     """Handle purchase request."""
     entities = command.entities
+    phone = entities.phone
+    email = entities.email
     
     # Need identity for PO creation
-    if not (entities.phone or entities.email):
+    if not (phone or email):
         return CoreResult(
             status=CoreStatus.NEEDS_HUMAN,
-            message="Need contact information to process purchase request",
+            message=_MSG_NEED_CONTACT_PURCHASE,
             requires_human=True,
             missing_fields=["phone or email"],
         )
     
     return CoreResult(
         status=CoreStatus.SUCCESS,
-        message="I can help with your purchase request. A representative will follow up with pricing and availability.",
+        message=_MSG_PURCHASE,
         requires_human=False,
         data={
-            "contact_phone": entities.phone,
-            "contact_email": entities.email,
+            "contact_phone": phone,
+            "contact_email": email,
             "action": "purchase_request",
         },
     )
 
 
+# Supported CORE intents -> handler
+_INTENT_DISPATCH: dict[Intent, Callable[[HaelCommand], CoreResult]] = {
+    Intent.BILLING_INQUIRY: _handle_billing_inquiry,
+    Intent.PAYMENT_TERMS_INQUIRY: _handle_payment_terms_inquiry,
+    Intent.INVOICE_REQUEST: _handle_invoice_request,
+    Intent.INVENTORY_INQUIRY: _handle_inventory_inquiry,
+    Intent.PURCHASE_REQUEST: _handle_purchase_request,
+}
+CORE_INTENTS: frozenset[Intent] = frozenset(_INTENT_DISPATCH)
+
+
 # =============================================================================
 # Pricing Engine Functions
 # =============================================================================
 
 
-def calculate_service_pricing(
-    tier: PricingTier | None = None,
-    is_emergency: bool = False,
-    is_after_hours: bool = False,
-    is_weekend: bool = False,
+def _price_service(
+    tier: PricingTier,
+    is_emergency: bool,
+    is_after_hours: bool,
+    is_weekend: bool,
 ) -> PricingResult:
-    """
-    Calculate service call pricing.
-    
-    Args:
-        tier: Customer pricing tier (defaults to Retail)
-        is_emergency: Emergency service flag
-        is_after_hours: After-hours service flag
-        is_weekend: Weekend service flag
-        
-    Returns:
-        PricingResult with fee breakdown
-    """
-    tier = tier or get_default_tier()
+    """Build the fee breakdown for one tier and set of premium flags."""
     tier_pricing = get_tier_pricing(tier)
     
     # Calculate fees
@@ -274,6 +275,42 @@ def calculate_service_pricing(
     )
 
 
+# (tier, is_emergency, is_after_hours, is_weekend) -> PricingResult. The
+# catalog is fixed, so every combination is priced once at import and the
+# frozen results are shared; copy `notes` before exposing it in a response.
+_PRICING_RESULTS: dict[tuple[PricingTier, bool, bool, bool], PricingResult] = {
+    (tier, *flags): _price_service(tier, *flags)
+    for tier in PRICING_CATALOG
+    for flags in product((False, True), repeat=3)
+}
+
+
+def calculate_service_pricing(
+    tier: PricingTier | None = None,
+    is_emergency: bool = False,
+    is_after_hours: bool = False,
+    is_weekend: bool = False,
+) -> PricingResult:
+    """
+    Calculate service call pricing.
+    
+    Args:
+        tier: Customer pricing tier (defaults to Retail)
+        is_emergency: Emergency service flag
+        is_after_hours: After-hours service flag
+        is_weekend: Weekend service flag
+        
+    Returns:
+        PricingResult with fee breakdown
+    """
+    return _PRICING_RESULTS[(
+        tier or get_default_tier(),
+        bool(is_emergency),
+        bool(is_after_hours),
+        bool(is_weekend),
+    )]
+
+
 def should_generate_invoice(
     work_order_status: str,
     payment_status: str,
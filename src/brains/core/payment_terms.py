@@ -4,10 +4,13 @@ HAES HVAC - CORE Brain Payment Terms
 Payment terms and late fee rules from RDD Section 3.
 """
 
+from collections.abc import Iterable
+
 from src.brains.core.schema import PaymentTerms
 
 
-# Payment terms by segment from RDD
+# Payment terms by segment from RDD. The instances are shared, so copy
+# `accepted_methods` before exposing it in a response.
 PAYMENT_TERMS_BY_SEGMENT = {
     "residential": PaymentTerms(
         segment="residential",
@@ -43,6 +46,20 @@ DEFAULT_PAYMENT_TERMS = PaymentTerms(
     accepted_methods=["cash", "card", "check"],
 )
 
+# Segment spellings -> payment terms, covering the common casings and
+# separators so most lookups skip normalization
+_PAYMENT_TERMS_LOOKUP = {
+    variant: terms
+    for key, terms in PAYMENT_TERMS_BY_SEGMENT.items()
+    for variant in (
+        key,
+        key.replace("_", " "),
+        key.replace("_", "-"),
+        key.replace("_", " ").title(),
+        key.upper(),
+    )
+}
+
 
 def get_payment_terms(segment: str | None) -> PaymentTerms:
     """
@@ -57,10 +74,24 @@ def get_payment_terms(segment: str | None) -> PaymentTerms:
     if not segment:
         return DEFAULT_PAYMENT_TERMS
     
+    terms = _PAYMENT_TERMS_LOOKUP.get(segment)
+    if terms is not None:
+        return terms
+    
     segment_lower = segment.lower().replace(" ", "_").replace("-", "_")
     return PAYMENT_TERMS_BY_SEGMENT.get(segment_lower, DEFAULT_PAYMENT_TERMS)
 
 
+def _late_fee(invoice_amount: float, days_overdue: int, fee_rate: float) -> float:
+    """Apply the RDD late-fee rule for one invoice at a resolved fee rate."""
+    if days_overdue <= 0:
+        return 0.0
+    
+    # 1% per period (monthly)
+    periods = (days_overdue + 29) // 30  # Round up to nearest month
+    return invoice_amount * fee_rate * periods
+
+
 def calculate_late_fee(
     invoice_amount: float,
     days_overdue: int,
@@ -79,30 +110,37 @@ def calculate_late_fee(
     Returns:
         Late fee amount
     """
-    if days_overdue <= 0:
-        return 0.0
-    
-    terms = get_payment_terms(segment)
-    
-    # 1% per period (monthly)
-    periods = (days_overdue + 29) // 30  # Round up to nearest month
-    fee_rate = terms.late_fee_percent / 100
-    
-    return invoice_amount * fee_rate * periods
+    fee_rate = get_payment_terms(segment).late_fee_percent / 100
+    return _late_fee(invoice_amount, days_overdue, fee_rate)
 
 
-def format_payment_terms_text(segment: str | None) -> str:
+def calculate_late_fees_batch(
+    invoices: Iterable[tuple[float, int]],
+    segment: str | None = None,
+) -> list[float]:
     """
-    Format payment terms for customer communication.
+    Calculate late fees for many overdue invoices of one segment.
+    
+    Same result per invoice as calculate_late_fee, with the segment's fee
+    rate resolved once for the whole batch.
     
     Args:
+        invoices: (invoice_amount, days_overdue) pairs
         segment: Customer segment
         
     Returns:
-        Human-readable payment terms
+        Late fee amounts, in input order
     """
-    terms = get_payment_terms(segment)
+    fee_rate = get_payment_terms(segment).late_fee_percent / 100
     
+    return [
+        _late_fee(invoice_amount, days_overdue, fee_rate)
+        for invoice_amount, days_overdue in invoices
+    ]
+
+
+def _format_terms(terms: PaymentTerms) -> str:
+    """Render payment terms as customer-facing text."""
     if terms.due_days == 0:
         due_text = "Due upon receipt"
     else:
@@ -116,3 +154,22 @@ def format_payment_terms_text(segment: str | None) -> str:
         f"Accepted Methods: {methods_text}"
     )
 
+
+# Segment -> formatted payment terms, rendered once from the fixed tables
+_PAYMENT_TERMS_TEXT = {
+    terms.segment: _format_terms(terms)
+    for terms in (*PAYMENT_TERMS_BY_SEGMENT.values(), DEFAULT_PAYMENT_TERMS)
+}
+
+
+def format_payment_terms_text(segment: str | None) -> str:
+    """
+    Format payment terms for customer communication.
+    
+    Args:
+        segment: Customer segment
+        
+    Returns:
+        Human-readable payment terms
+    """
+    return _PAYMENT_TERMS_TEXT[get_payment_terms(segment).segment]
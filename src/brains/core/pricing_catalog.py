@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from src.brains.core.schema import PricingTier
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TierPricing:
     """Pricing structure for a tier."""
     tier: PricingTier
@@ -1,15 +1,17 @@
 """
 HAES HVAC - CORE Brain Schema
 
-Pydantic models for CORE brain operations (pricing, approvals, compliance).
+Models for CORE brain operations (pricing, approvals, compliance).
+
+CORE results are built and consumed in-process from trusted values, so they
+are slotted dataclasses rather than validated Pydantic models.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 
 class CoreStatus(str, Enum):
     """Status of a CORE brain operation."""
@@ -38,7 +40,8 @@ class ApprovalType(str, Enum):
     WRITE_OFF = "write_off"
 
 
-class ApprovalDecision(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ApprovalDecision:
     """Approval decision result."""
     approval_required: bool
     approver: str | None = None
@@ -47,7 +50,8 @@ class ApprovalDecision(BaseModel):
     amount: float | None = None
 
 
-class PricingResult(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PricingResult:
     """Pricing calculation result."""
     tier: PricingTier
     diagnostic_fee: float
@@ -56,18 +60,20 @@ class PricingResult(BaseModel):
     after_hours_premium: float = 0.0
     weekend_premium: float = 0.0
     total_base_fee: float
-    notes: list[str] = Field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
 
 
-class PaymentTerms(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PaymentTerms:
     """Payment terms for a customer segment."""
     segment: str
     due_days: int
     late_fee_percent: float
-    accepted_methods: list[str] = Field(default_factory=list)
+    accepted_methods: list[str] = field(default_factory=list)
 
 
-class ComplianceDisclosure(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ComplianceDisclosure:
     """Required compliance disclosures."""
     license_number: str
     regulatory_body: str
@@ -75,7 +81,8 @@ class ComplianceDisclosure(BaseModel):
     warranty_terms: str
 
 
-class InvoicePolicy(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class InvoicePolicy:
     """Invoice generation policy result."""
     should_generate: bool
     requires_human: bool
@@ -83,17 +90,18 @@ class InvoicePolicy(BaseModel):
     trigger_condition: str | None = None
 
 
-class CoreResult(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class CoreResult:
     """Result from CORE brain operations."""
     status: CoreStatus
     message: str
     requires_human: bool = False
-    missing_fields: list[str] = Field(default_factory=list)
-    missing_capabilities: list[str] = Field(default_factory=list)
+    missing_fields: list[str] = field(default_factory=list)
+    missing_capabilities: list[str] = field(default_factory=list)
     pricing: PricingResult | None = None
     approval: ApprovalDecision | None = None
     payment_terms: PaymentTerms | None = None
     compliance: ComplianceDisclosure | None = None
     invoice_policy: InvoicePolicy | None = None
-    data: dict[str, Any] = Field(default_factory=dict)
+    data: dict[str, Any] = field(default_factory=dict)
 
@@ -0,0 +1,80 @@
+"""
+HAES HVAC - Brain Dispatch
+
+Runs an extracted HAEL request through routing, command building, and the
+target brain handler. Shared by the voice (Vapi) and chat entry points.
+"""
+
+from typing import Any
+
+from src.brains.core import handle_core_command
+from src.brains.ops import handle_ops_command
+from src.brains.people import handle_people_command
+from src.brains.revenue import handle_revenue_command
+from src.hael import (
+    Brain,
+    Channel,
+    HaelCommand,
+    HaelExtractionResult,
+    build_hael_command,
+    route_command,
+)
+
+# Brain -> (is_async, command handler). The sync brains are pure in-memory
+# policy lookups, so they are called inline rather than offloaded to a thread.
+BRAIN_HANDLERS: dict[Brain, tuple[bool, Any]] = {
+    Brain.OPS: (True, handle_ops_command),
+    Brain.CORE: (False, handle_core_command),
+    Brain.REVENUE: (False, handle_revenue_command),
+    Brain.PEOPLE: (False, handle_people_command),
+}
+
+
+async def dispatch_command(command: HaelCommand) -> Any | None:
+    """
+    Run a command through its brain handler.
+
+    Args:
+        command: HAEL command to process
+
+    Returns:
+        Brain result, or None if no brain handles the command
+    """
+    brain_handler = BRAIN_HANDLERS.get(command.brain)
+    if brain_handler is None:
+        return None
+
+    is_async, handle_command = brain_handler
+    return await handle_command(command) if is_async else handle_command(command)
+
+
+async def run_hael(
+    extraction: HaelExtractionResult,
+    channel: Channel,
+    raw_text: str,
+    request_id: str,
+    metadata: dict[str, Any] | None = None,
+) -> tuple[HaelCommand, Any | None]:
+    """
+    Route an extraction, build its command, and dispatch it to a brain.
+
+    Args:
+        extraction: Extracted intent and entities
+        channel: Source channel
+        raw_text: Original request text
+        request_id: Request ID for tracing
+        metadata: Additional command metadata
+
+    Returns:
+        Tuple of (command, brain result or None if no brain handles it)
+    """
+    routing = route_command(extraction)
+    command = build_hael_command(
+        request_id=request_id,
+        channel=channel,
+        raw_text=raw_text,
+        extraction=extraction,
+        routing=routing,
+        metadata=metadata,
+    )
+    return command, await dispatch_command(command)
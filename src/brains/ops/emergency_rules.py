@@ -4,12 +4,14 @@ HAES HVAC - OPS Brain Emergency Rules
 Deterministic emergency qualification rules from RDD.
 """
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from src.hael.schema import Entity, UrgencyLevel
 
 
-@dataclass
+@dataclass(frozen=True)
 class EmergencyResult:
     """Result of emergency qualification."""
     is_emergency: bool
@@ -17,6 +19,18 @@ class EmergencyResult:
     priority_override: int  # 1 = immediate
 
 
+# Shared results for the constant-return paths
+_NOT_EMERGENCY = EmergencyResult(
+    is_emergency=False,
+    reason="Standard service request",
+    priority_override=5,
+)
+_HAEL_EMERGENCY = EmergencyResult(
+    is_emergency=True,
+    reason="Emergency urgency level from caller context",
+    priority_override=1,
+)
+
 # Emergency keywords that always qualify
 ALWAYS_EMERGENCY_KEYWORDS = [
     "gas leak",
@@ -40,6 +54,28 @@ ALWAYS_EMERGENCY_KEYWORDS = [
     "walk-in cooler",
 ]
 
+# Phrasings that mean the heat / AC is out
+_NO_HEAT_KEYWORDS = (
+    "no heat", "heating not working", "heating is not working",
+    "heater not working", "heater is not working", "furnace not working",
+    "furnace is not working", "heat not working", "heat is not working",
+)
+_NO_AC_KEYWORDS = (
+    "no ac", "no cooling", "ac not working", "ac is not working",
+    "air conditioning not working", "air conditioning is not working",
+    "a/c not working", "a/c is not working", "air conditioner not working",
+)
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one alternation for a single-pass substring scan."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+_ALWAYS_EMERGENCY_RE = _keyword_pattern(ALWAYS_EMERGENCY_KEYWORDS)
+_NO_HEAT_RE = _keyword_pattern(_NO_HEAT_KEYWORDS)
+_NO_AC_RE = _keyword_pattern(_NO_AC_KEYWORDS)
+
 # Temperature thresholds from RDD
 NO_HEAT_TEMP_THRESHOLD = 55  # °F - below this, no heat is emergency
 NO_AC_TEMP_THRESHOLD = 85    # °F - above this, no AC is emergency
@@ -70,24 +106,32 @@ def qualify_emergency(
     Returns:
         EmergencyResult with qualification status
     """
-    desc_lower = problem_description.lower()
-    
-    # Check always-emergency keywords
-    for keyword in ALWAYS_EMERGENCY_KEYWORDS:
-        if keyword in desc_lower:
-            return EmergencyResult(
-                is_emergency=True,
-                reason=f"Emergency condition detected: {keyword}",
-                priority_override=1,
-            )
+    return _qualify_emergency(
+        problem_description.strip().lower(), urgency_level, temperature_mentioned
+    )
+
+
+@lru_cache(maxsize=4096)
+def _qualify_emergency(
+    desc_lower: str,
+    urgency_level: UrgencyLevel,
+    temperature_mentioned: int | None,
+) -> EmergencyResult:
+    """Emergency qualification on a normalized description; results are frozen."""
+    # Check always-emergency keywords; one scan rejects the common no-hit case,
+    # then the first keyword in list order is reported as before
+    if _ALWAYS_EMERGENCY_RE.search(desc_lower):
+        keyword = next(kw for kw in ALWAYS_EMERGENCY_KEYWORDS if kw in desc_lower)
+        return EmergencyResult(
+            is_emergency=True,
+            reason=f"Emergency condition detected: {keyword}",
+            priority_override=1,
+        )
     
     # Temperature-based emergency detection
     if temperature_mentioned is not None:
         # No heat emergency - match various phrasings
-        heat_keywords = ["no heat", "heating not working", "heating is not working",
-                        "heater not working", "heater is not working", "furnace not working",
-                        "furnace is not working", "heat not working", "heat is not working"]
-        if any(kw in desc_lower for kw in heat_keywords):
+        if _NO_HEAT_RE.search(desc_lower):
             if temperature_mentioned < NO_HEAT_TEMP_THRESHOLD:
                 return EmergencyResult(
                     is_emergency=True,
@@ -96,10 +140,7 @@ def qualify_emergency(
                 )
         
         # No AC emergency - match various phrasings
-        ac_keywords = ["no ac", "no cooling", "ac not working", "ac is not working",
-                      "air conditioning not working", "air conditioning is not working",
-                      "a/c not working", "a/c is not working", "air conditioner not working"]
-        if any(kw in desc_lower for kw in ac_keywords):
+        if _NO_AC_RE.search(desc_lower):
             if temperature_mentioned > NO_AC_TEMP_THRESHOLD:
                 return EmergencyResult(
                     is_emergency=True,
@@ -109,18 +150,10 @@ def qualify_emergency(
     
     # Check if HAEL already classified as emergency
     if urgency_level == UrgencyLevel.EMERGENCY:
-        return EmergencyResult(
-            is_emergency=True,
-            reason="Emergency urgency level from caller context",
-            priority_override=1,
-        )
+        return _HAEL_EMERGENCY
     
     # Not an emergency
-    return EmergencyResult(
-        is_emergency=False,
-        reason="Standard service request",
-        priority_override=5,
-    )
+    return _NOT_EMERGENCY
 
 
 def get_emergency_dispatch_instructions(result: EmergencyResult) -> str:
@@ -4,9 +4,13 @@ HAES HVAC - OPS Brain Handlers
 Main entry point for OPS brain command handling.
 """
 
+import asyncio
 import logging
 import re
-from datetime import datetime, timedelta
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 from src.hael.schema import HaelCommand, Intent, UrgencyLevel
@@ -32,18 +36,116 @@ from src.brains.ops.skill_mapping import (
     get_required_skills_for_service,
     filter_technicians_by_skills,
 )
+from src.integrations.email_notifications import (
+    create_email_service_from_settings,
+    send_new_lead_notification,
+)
+from src.integrations.odoo_leads import create_lead_service
+from src.integrations.twilio_sms import (
+    create_twilio_client_from_settings,
+    send_reschedule_confirmation_sms,
+)
+from src.utils.errors import OdooRPCError
 
 logger = logging.getLogger(__name__)
 
-# Supported OPS intents
-OPS_INTENTS = {
-    Intent.SERVICE_REQUEST,
-    Intent.SCHEDULE_APPOINTMENT,
-    Intent.RESCHEDULE_APPOINTMENT,
-    Intent.CANCEL_APPOINTMENT,
-    Intent.STATUS_UPDATE_REQUEST,
+# Replies for intents the OPS brain does not handle, formatted once
+_UNSUPPORTED_INTENT_MESSAGES = {
+    intent: f"Intent '{intent.value}' is not handled by OPS brain" for intent in Intent
 }
 
+# Strong references to background tasks, so early returns cannot leave them
+# to be garbage collected mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
+# In-flight appointment lookups keyed by (phone, email, days_back, days_ahead)
+_appointment_lookups: dict[tuple, asyncio.Future] = {}
+
+# Odoo services are shared across commands so the HTTP connection pool and
+# authenticated session are reused; they are rebuilt periodically so an
+# expired Odoo session cannot outlive the TTL
+OPS_SERVICE_TTL_SECONDS = 600.0
+_ops_services: dict[str, tuple[float, Any]] = {}
+
+# The live technician roster changes rarely, so it is reused per appointment
+# service for a few minutes instead of re-read from Odoo on every command
+TECH_ROSTER_TTL_SECONDS = 300.0
+_tech_roster: tuple[float, Any, tuple[dict[str, Any], ...]] | None = None
+
+
+@lru_cache(maxsize=2048)
+def _parse_odoo_datetime(value: str) -> datetime:
+    """Parse an Odoo/ISO timestamp, accepting a trailing "Z" for UTC."""
+    if value.endswith("Z"):
+        return datetime.fromisoformat(value[:-1] + "+00:00")
+    return datetime.fromisoformat(value)
+
+
+async def _create_appointment_service() -> Any:
+    """
+    Create an Odoo AppointmentService.
+    
+    odoo_appointments imports src.brains.ops.scheduling_rules, which loads this
+    package, so the import stays deferred to call time to avoid a cycle.
+    """
+    from src.integrations.odoo_appointments import create_appointment_service
+    
+    return await create_appointment_service()
+
+
+async def _get_shared_service(name: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the shared service for name, creating it if missing or expired."""
+    entry = _ops_services.get(name)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    
+    service = await factory()
+    _ops_services[name] = (time.monotonic() + OPS_SERVICE_TTL_SECONDS, service)
+    return service
+
+
+async def _get_appointment_service() -> Any:
+    """Return the shared Odoo AppointmentService."""
+    return await _get_shared_service("appointment", _create_appointment_service)
+
+
+async def _get_lead_service() -> Any:
+    """Return the shared Odoo LeadService."""
+    return await _get_shared_service("lead", create_lead_service)
+
+
+def reset_ops_services() -> None:
+    """Drop the shared Odoo services (tests, settings changes)."""
+    _ops_services.clear()
+    invalidate_tech_cache()
+
+
+def invalidate_tech_cache() -> None:
+    """Drop the cached technician roster (roster reloads, tests)."""
+    global _tech_roster
+    _tech_roster = None
+
+
+async def _get_live_technicians(appointment_service: Any) -> tuple[dict[str, Any], ...]:
+    """
+    Return the assignable live technicians, cached per appointment service.
+    
+    Args:
+        appointment_service: Odoo AppointmentService to read the roster from
+        
+    Returns:
+        Technicians with an integer Odoo user id
+    """
+    global _tech_roster
+    entry = _tech_roster
+    if entry is not None and entry[1] is appointment_service and entry[0] > time.monotonic():
+        return entry[2]
+    
+    users = await appointment_service.get_live_technicians()
+    roster = tuple(u for u in users if isinstance(u.get("id"), int))
+    _tech_roster = (time.monotonic() + TECH_ROSTER_TTL_SECONDS, appointment_service, roster)
+    return roster
+
 
 async def _candidate_technicians(
     appointment_service: Any,
@@ -55,8 +157,7 @@ async def _candidate_technicians(
     Return live Odoo technician candidates, optionally filtered by required_skills.
     """
     _ = zip_code, is_commercial
-    users = await appointment_service.get_live_technicians()
-    users = [u for u in users if isinstance(u.get("id"), int)]
+    users = list(await _get_live_technicians(appointment_service))
     if not required_skills:
         return users
     employee_ids = []
@@ -74,6 +175,30 @@ async def _candidate_technicians(
     return filter_technicians_by_skills(users, skills_by_emp, required_skills)
 
 
+def _tech_payloads(
+    technician: dict[str, Any] | None,
+) -> tuple[TechnicianAssignment | None, dict[str, Any] | None]:
+    """
+    Build the work order assignment and response payload for a live technician.
+    
+    Args:
+        technician: Live Odoo technician (id, name, login), or None
+        
+    Returns:
+        Tuple of (TechnicianAssignment, assigned_technician dict), or (None, None)
+    """
+    if not technician:
+        return None, None
+    
+    tech_id = str(technician.get("id"))
+    tech_name = technician.get("name")
+    assignment = TechnicianAssignment(
+        technician_id=tech_id,
+        technician_name=str(tech_name or "") or None,
+    )
+    return assignment, {"id": tech_id, "name": tech_name, "phone": None}
+
+
 async def _find_best_technician_slots(
     appointment_service: Any,
     zip_code: str | None,
@@ -195,6 +320,37 @@ def _dispatch_search_start(now: datetime, allow_same_day_after_cutoff: bool) ->
     return baseline
 
 
+async def _find_appointments_by_contact(
+    appointment_service: Any,
+    phone: str | None,
+    email: str | None,
+    now: datetime,
+    days_back: int,
+    days_ahead: int,
+) -> list[dict[str, Any]]:
+    """
+    Find a contact's appointments in the window around now.
+    
+    Concurrent lookups for the same contact and window share one in-flight
+    Odoo query; callers must treat the returned records as read-only.
+    """
+    key = (phone, email, days_back, days_ahead)
+    lookup = _appointment_lookups.get(key)
+    if lookup is None:
+        lookup = asyncio.ensure_future(
+            appointment_service.find_appointment_by_contact(
+                phone=phone,
+                email=email,
+                date_from=now - timedelta(days=days_back),
+                date_to=now + timedelta(days=days_ahead),
+            )
+        )
+        _appointment_lookups[key] = lookup
+        lookup.add_done_callback(lambda _: _appointment_lookups.pop(key, None))
+    
+    return await asyncio.shield(lookup)
+
+
 async def handle_ops_command(command: HaelCommand) -> OpsResult:
     """
     Handle an OPS brain command.
@@ -207,13 +363,15 @@ async def handle_ops_command(command: HaelCommand) -> OpsResult:
     Returns:
         OpsResult with operation outcome
     """
-    logger.info(f"OPS brain handling command: {command.intent.value}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("OPS brain handling command: %s", command.intent.value)
     
     # Check if intent is supported
-    if command.intent not in OPS_INTENTS:
+    handler = _INTENT_DISPATCH.get(command.intent)
+    if handler is None:
         return OpsResult(
             status=OpsStatus.UNSUPPORTED_INTENT,
-            message=f"Intent '{command.intent.value}' is not handled by OPS brain",
+            message=_UNSUPPORTED_INTENT_MESSAGES[command.intent],
             requires_human=False,
         )
     
@@ -228,24 +386,9 @@ async def handle_ops_command(command: HaelCommand) -> OpsResult:
     
     # Route to specific handler
     try:
-        if command.intent == Intent.SERVICE_REQUEST:
-            return await _handle_service_request(command)
-        elif command.intent == Intent.SCHEDULE_APPOINTMENT:
-            return await _handle_schedule_appointment(command)
-        elif command.intent == Intent.RESCHEDULE_APPOINTMENT:
-            return await _handle_reschedule_appointment(command)
-        elif command.intent == Intent.CANCEL_APPOINTMENT:
-            return await _handle_cancel_appointment(command)
-        elif command.intent == Intent.STATUS_UPDATE_REQUEST:
-            return await _handle_status_update(command)
-        else:
-            return OpsResult(
-                status=OpsStatus.ERROR,
-                message=f"Unhandled intent: {command.intent.value}",
-                requires_human=True,
-            )
+        return await handler(command)
     except Exception as e:
-        logger.exception(f"Error handling OPS command: {e}")
+        logger.exception("Error handling OPS command: %s", e)
         return OpsResult(
             status=OpsStatus.ERROR,
             message=f"Internal error: {str(e)}",
@@ -320,18 +463,18 @@ async def _handle_service_request(command: HaelCommand) -> OpsResult:
             # Set to high (2nd highest for normal)
             priority = ServicePriority.HIGH
         logger.info(
-            f"Warranty claim detected - priority set to {priority.value}, "
-            f"previous_service_id={previous_service_id}, "
-            f"previous_technician_id={previous_technician_id}"
+            "Warranty claim detected - priority set to %s, "
+            "previous_service_id=%s, previous_technician_id=%s",
+            priority.value,
+            previous_service_id,
+            previous_technician_id,
         )
     
     # Determine if commercial
     is_commercial = entities.property_type == "commercial"
 
     # Assign technician from live Odoo users only (no static roster mapping).
-    from src.integrations.odoo_appointments import create_appointment_service
-
-    appointment_service = await create_appointment_service()
+    appointment_service = await _get_appointment_service()
     technician: dict[str, Any] | None = None
 
     # Warranty preference: if prior technician is a live Odoo user id, keep continuity.
@@ -368,14 +511,7 @@ async def _handle_service_request(command: HaelCommand) -> OpsResult:
         if selected_tech_id and selected_tech:
             technician = selected_tech
 
-    tech_assignment = None
-    if technician:
-        tech_assignment = TechnicianAssignment(
-            technician_id=str(technician.get("id")),
-            technician_name=str(technician.get("name") or ""),
-            skill_level=None,
-            phone=None,
-        )
+    tech_assignment, tech_data = _tech_payloads(technician)
     
     # Build work order data
     work_order = WorkOrderData(
@@ -389,7 +525,7 @@ async def _handle_service_request(command: HaelCommand) -> OpsResult:
         priority=priority,
         status=WorkOrderStatus.PENDING_SCHEDULE,
         technician=tech_assignment,
-        created_at=datetime.utcnow(),
+        created_at=datetime.now(timezone.utc),
     )
     
     # Determine if we need human for technician assignment
@@ -402,16 +538,9 @@ async def _handle_service_request(command: HaelCommand) -> OpsResult:
             suggested_action="Manual technician assignment required",
         )
     
-    # Build technician assignment data
-    tech_data = None
-    if technician:
-        tech_data = {
-            "id": str(technician.get("id")),
-            "name": technician.get("name"),
-            "phone": None,
-            "skill_level": None,
-            "email": technician.get("login"),
-        }
+    # Service requests also report the technician's skill level and login
+    tech_data["skill_level"] = None
+    tech_data["email"] = technician.get("login")
     
     # Emergency ETA window (default: 1.5 - 3 hours for emergency, 4-8 hours for urgent)
     eta_window = None
@@ -445,7 +574,7 @@ async def _handle_service_request(command: HaelCommand) -> OpsResult:
         response_data["waive_diagnostic_fee"] = True  # Flag to waive diagnostic fee
         response_data["previous_service_id"] = previous_service_id
         response_data["previous_technician_id"] = previous_technician_id
-        if previous_technician_id and technician:
+        if previous_technician_id:
             response_data["same_technician_assigned"] = (
                 str(previous_technician_id).strip() == str(technician.get("id"))
             )
@@ -467,10 +596,6 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
     1. Availability check: Only problem_description needed - returns next available slot
     2. Full scheduling: All fields needed - creates appointment in Odoo
     """
-    from datetime import timedelta
-    from src.integrations.odoo_appointments import create_appointment_service
-    from src.integrations.odoo_leads import create_lead_service
-    from src.brains.ops.service_catalog import infer_service_type_from_description
     
     entities = command.entities
     
@@ -487,7 +612,7 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
     if not (has_identity and has_location):
         # Availability check mode - return next available slot without creating appointment
         try:
-            appointment_service = await create_appointment_service()
+            appointment_service = await _get_appointment_service()
             
             # Find next two available slots for the best technician (offer customer a choice)
             now = datetime.now()
@@ -556,7 +681,7 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
                 },
             )
         except Exception as e:
-            logger.exception(f"Error checking availability: {e}")
+            logger.exception("Error checking availability: %s", e)
             return OpsResult(
                 status=OpsStatus.ERROR,
                 message="I had trouble checking availability. A representative will contact you.",
@@ -566,21 +691,28 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
     # Full scheduling mode - create appointment (we have identity and location)
     try:
         # Create appointment service
-        appointment_service = await create_appointment_service()
+        appointment_service = await _get_appointment_service()
         
-        # Look for existing partner (for linking); use returning customer if present
-        lead_service = await create_lead_service()
+        # Look for existing partner (for linking); use returning customer if present.
+        # The partner is only needed once the appointment is created, so it is
+        # resolved in the background while technician availability is searched
+        # (ensure_partner never raises).
+        lead_service = await _get_lead_service()
         returning = (command.metadata or {}).get("_returning_customer")
         existing_partner_id = returning.get("partner_id") if isinstance(returning, dict) else None
-        partner_id = await lead_service.ensure_partner(
-            phone=entities.phone,
-            email=entities.email,
-            name=entities.full_name,
-            address=entities.address,
-            city=entities.city,
-            zip_code=entities.zip_code,
-            existing_partner_id=existing_partner_id,
+        partner_task = asyncio.create_task(
+            lead_service.ensure_partner(
+                phone=entities.phone,
+                email=entities.email,
+                name=entities.full_name,
+                address=entities.address,
+                city=entities.city,
+                zip_code=entities.zip_code,
+                existing_partner_id=existing_partner_id,
+            )
         )
+        _background_tasks.add(partner_task)
+        partner_task.add_done_callback(_background_tasks.discard)
         
         # Try to find existing lead for linking (simplified - will be linked after appointment creation if needed)
         lead_id = None
@@ -588,9 +720,8 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
         # Determine technician assignment from real availability across candidates.
         tech = None
         tech_id = None
-        now = datetime.now()
-        # Use timezone-aware now for comparisons (avoid naive vs aware)
-        now_aware = now.astimezone() if now.tzinfo else now.replace(tzinfo=datetime.now().astimezone().tzinfo)
+        # Use timezone-aware local now for comparisons (avoid naive vs aware)
+        now_aware = datetime.now().astimezone()
         allow_same_day_after_cutoff = bool(
             (command.metadata or {}).get("allow_same_day_after_cutoff")
         )
@@ -787,6 +918,8 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
                 suggested_action="Contact customer to find suitable time",
             )
         
+        partner_id = await partner_task
+        
         # Build appointment name
         customer_name = entities.full_name or entities.phone or "Customer"
         service_name = service_type.name
@@ -831,7 +964,7 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
         )
         if lead_result.get("lead_id"):
             lead_id = lead_result["lead_id"]
-            logger.info(f"Schedule appointment: linked to lead {lead_id}")
+            logger.info("Schedule appointment: linked to lead %s", lead_id)
         
         # Create calendar event in Odoo (linked to lead when present)
         appointment_description = problem_desc
@@ -874,18 +1007,10 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
                 if od_user_id:
                     await lead_service.set_fsm_task_assignee(lead_id, od_user_id)
             except Exception as assign_err:
-                logger.warning(f"Schedule: could not set FSM task assignee for lead {lead_id}: {assign_err}")
+                logger.warning("Schedule: could not set FSM task assignee for lead %s: %s", lead_id, assign_err)
         
         # Build response
-        tech_assignment = None
-        if tech:
-            tech_name = str(tech.get("name") or "")
-            tech_assignment = TechnicianAssignment(
-                technician_id=str(tech.get("id")),
-                technician_name=tech_name or None,
-                skill_level=None,
-                phone=None,
-            )
+        _, tech_data = _tech_payloads(tech)
         
         # Format appointment time for message
         appointment_time_str = slot.start.strftime("%A, %B %d at %I:%M %p")
@@ -902,11 +1027,7 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
                 "scheduled_time_end": slot.end.isoformat(),
                 "service_type": service_type.name,
                 "duration_minutes": duration_minutes,
-                "assigned_technician": {
-                    "id": str(tech.get("id")),
-                    "name": tech.get("name"),
-                    "phone": None,
-                } if tech else None,
+                "assigned_technician": tech_data,
                 "partner_id": partner_id,
                 "lead_id": lead_id,
                 "no_pricing_account": bool(no_pricing_account),
@@ -917,7 +1038,7 @@ async def _handle_schedule_appointment(command: HaelCommand) -> OpsResult:
         )
         
     except Exception as e:
-        logger.exception(f"Error scheduling appointment: {e}")
+        logger.exception("Error scheduling appointment: %s", e)
         return OpsResult(
             status=OpsStatus.ERROR,
             message="Scheduling request received. A representative will contact you to confirm.",
@@ -1104,10 +1225,6 @@ def _parse_natural_date(text: str, base_date: datetime) -> datetime | None:
 
 async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
     """Handle appointment reschedule request."""
-    from datetime import timedelta
-    from src.integrations.odoo_appointments import create_appointment_service
-    from src.integrations.odoo_leads import create_lead_service
-    from src.utils.errors import OdooRPCError
     
     entities = command.entities
     
@@ -1121,16 +1238,17 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
         )
     
     try:
-        appointment_service = await create_appointment_service()
+        appointment_service = await _get_appointment_service()
         
         # Find existing appointment
-        from datetime import datetime, timedelta
         now = datetime.now()
-        appointments = await appointment_service.find_appointment_by_contact(
-            phone=entities.phone,
-            email=entities.email,
-            date_from=now - timedelta(days=30),
-            date_to=now + timedelta(days=90),
+        appointments = await _find_appointments_by_contact(
+            appointment_service,
+            entities.phone,
+            entities.email,
+            now,
+            days_back=30,
+            days_ahead=90,
         )
         
         if not appointments:
@@ -1144,14 +1262,13 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
                 },
             )
         
-        # Use most recent upcoming appointment
-        upcoming_appointments = [a for a in appointments if datetime.fromisoformat(a["start"].replace("Z", "+00:00")) > now]
-        if not upcoming_appointments:
-            upcoming_appointments = appointments[:1]  # Use most recent
-        
-        appointment = upcoming_appointments[0]
+        # Use most recent upcoming appointment, else the most recent one
+        appointment = next(
+            (a for a in appointments if _parse_odoo_datetime(a["start"]) > now),
+            appointments[0],
+        )
         event_id = appointment["id"]
-        lead_service = await create_lead_service()
+        lead_service = await _get_lead_service()
         lead_id: int | None = None
         if not lead_service.client.is_authenticated:
             await lead_service.client.authenticate()
@@ -1194,13 +1311,13 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
                 if lead_result and lead_result.get("lead_id"):
                     lead_id = int(lead_result["lead_id"])
             except Exception as lead_err:
-                logger.warning(f"Reschedule: could not create/update CRM lead: {lead_err}")
+                logger.warning("Reschedule: could not create/update CRM lead: %s", lead_err)
         
         # Parse existing appointment time
-        existing_start = datetime.fromisoformat(appointment["start"].replace("Z", "+00:00"))
+        existing_start = _parse_odoo_datetime(appointment["start"])
         if existing_start.tzinfo:
             existing_start = existing_start.replace(tzinfo=None)
-        existing_stop = datetime.fromisoformat(appointment["stop"].replace("Z", "+00:00"))
+        existing_stop = _parse_odoo_datetime(appointment["stop"])
         if existing_stop.tzinfo:
             existing_stop = existing_stop.replace(tzinfo=None)
         
@@ -1461,7 +1578,7 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
             try:
                 await appointment_service.link_appointment_to_lead(event_id=event_id, lead_id=lead_id)
             except Exception as link_err:
-                logger.warning(f"Reschedule: could not link appointment {event_id} to lead {lead_id}: {link_err}")
+                logger.warning("Reschedule: could not link appointment %s to lead %s: %s", event_id, lead_id, link_err)
 
             try:
                 await lead_service.client.call_kw(
@@ -1508,7 +1625,7 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
                             service_address=entities.address,
                         )
                 except Exception as fsm_err:
-                    logger.warning(f"Reschedule: could not create fallback FSM task for lead {lead_id}: {fsm_err}")
+                    logger.warning("Reschedule: could not create fallback FSM task for lead %s: %s", lead_id, fsm_err)
             else:
                 try:
                     lead_rows = await lead_service.client.read("crm.lead", [lead_id], fields=["project_task_id", "name"])
@@ -1533,7 +1650,7 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
                     if od_user_id:
                         await lead_service.set_fsm_task_assignee(lead_id, od_user_id)
                 except Exception as assign_err:
-                    logger.warning(f"Reschedule: could not set FSM task assignee for lead {lead_id}: {assign_err}")
+                    logger.warning("Reschedule: could not set FSM task assignee for lead %s: %s", lead_id, assign_err)
         
         # Get technician info for notifications from live Odoo users
         tech_email = None
@@ -1549,21 +1666,19 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
         # Send SMS confirmation to customer
         if entities.phone:
             try:
-                from src.integrations.twilio_sms import send_reschedule_confirmation_sms
                 sms_result = await send_reschedule_confirmation_sms(
                     to_phone=entities.phone,
                     customer_name=entities.full_name,
                     new_time_str=new_time_str,
                     tech_name=tech_name,
                 )
-                logger.info(f"Reschedule SMS sent: {sms_result.get('status')}")
+                logger.info("Reschedule SMS sent: %s", sms_result.get("status"))
             except Exception as sms_err:
-                logger.error(f"Failed to send reschedule SMS: {sms_err}")
+                logger.error("Failed to send reschedule SMS: %s", sms_err)
         
         # Send email notification to technician
         if tech_email and tech_name:
             try:
-                from src.integrations.email_notifications import create_email_service_from_settings
                 service = create_email_service_from_settings()
                 if service:
                     customer_name = entities.full_name or "Customer"
@@ -1592,9 +1707,9 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
                         body_html=html_body,
                         body_text=text_body,
                     )
-                    logger.info(f"Reschedule notification sent to technician {tech_name} ({tech_email}): {email_result.get('status')}")
+                    logger.info("Reschedule notification sent to technician %s (%s): %s", tech_name, tech_email, email_result.get("status"))
             except Exception as email_err:
-                logger.error(f"Failed to send technician notification: {email_err}")
+                logger.error("Failed to send technician notification: %s", email_err)
         
         # Build response message showing both old and new times
         response_message = (
@@ -1626,7 +1741,7 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
         )
         
     except Exception as e:
-        logger.exception(f"Error rescheduling appointment: {e}")
+        logger.exception("Error rescheduling appointment: %s", e)
         return OpsResult(
             status=OpsStatus.ERROR,
             message="Reschedule request received. A representative will contact you to confirm.",
@@ -1640,7 +1755,6 @@ async def _handle_reschedule_appointment(command: HaelCommand) -> OpsResult:
 
 async def _handle_cancel_appointment(command: HaelCommand) -> OpsResult:
     """Handle appointment cancellation request."""
-    from src.integrations.odoo_appointments import create_appointment_service
     
     entities = command.entities
     
@@ -1654,16 +1768,17 @@ async def _handle_cancel_appointment(command: HaelCommand) -> OpsResult:
         )
     
     try:
-        appointment_service = await create_appointment_service()
+        appointment_service = await _get_appointment_service()
         
         # Find existing appointment
-        from datetime import datetime, timedelta
         now = datetime.now()
-        appointments = await appointment_service.find_appointment_by_contact(
-            phone=entities.phone,
-            email=entities.email,
-            date_from=now - timedelta(days=30),
-            date_to=now + timedelta(days=90),
+        appointments = await _find_appointments_by_contact(
+            appointment_service,
+            entities.phone,
+            entities.email,
+            now,
+            days_back=30,
+            days_ahead=90,
         )
         
         if not appointments:
@@ -1677,12 +1792,11 @@ async def _handle_cancel_appointment(command: HaelCommand) -> OpsResult:
                 },
             )
         
-        # Use most recent upcoming appointment
-        upcoming_appointments = [a for a in appointments if datetime.fromisoformat(a["start"].replace("Z", "+00:00")) > now]
-        if not upcoming_appointments:
-            upcoming_appointments = appointments[:1]  # Use most recent
-        
-        appointment = upcoming_appointments[0]
+        # Use most recent upcoming appointment, else the most recent one
+        appointment = next(
+            (a for a in appointments if _parse_odoo_datetime(a["start"]) > now),
+            appointments[0],
+        )
         event_id = appointment["id"]
         lead_id = appointment.get("res_id") if appointment.get("res_model") == "crm.lead" else None
         
@@ -1696,11 +1810,11 @@ async def _handle_cancel_appointment(command: HaelCommand) -> OpsResult:
         appointment_datetime = None
         if appointment_start_str:
             try:
-                appointment_datetime = datetime.fromisoformat(appointment_start_str.replace("Z", "+00:00"))
+                appointment_datetime = _parse_odoo_datetime(appointment_start_str)
                 if appointment_datetime.tzinfo:
                     appointment_datetime = appointment_datetime.replace(tzinfo=None)
             except Exception as e:
-                logger.warning(f"Failed to parse appointment datetime: {e}")
+                logger.warning("Failed to parse appointment datetime: %s", e)
         
         # Check if cancellation is within 24 hours (cancellation policy applies)
         cancellation_within_24h = False
@@ -1735,7 +1849,6 @@ async def _handle_cancel_appointment(command: HaelCommand) -> OpsResult:
         # Send cancellation confirmation SMS to customer (fire-and-forget)
         if entities.phone:
             try:
-                from src.integrations.twilio_sms import create_twilio_client_from_settings
                 sms_client = create_twilio_client_from_settings()
                 if sms_client:
                     # Format appointment date/time for SMS
@@ -1747,17 +1860,14 @@ async def _handle_cancel_appointment(command: HaelCommand) -> OpsResult:
                         sms_body = f"HVACR FINEST: Your appointment has been cancelled. If you need to reschedule, please call us at (972) 372-4458."
                     
                     # Send SMS asynchronously (fire-and-forget)
-                    import asyncio
                     asyncio.create_task(sms_client.send_sms(entities.phone, sms_body))
-                    logger.info(f"Scheduled cancellation confirmation SMS to {entities.phone}")
+                    logger.info("Scheduled cancellation confirmation SMS to %s", entities.phone)
                     response_data["sms_scheduled"] = True
             except Exception as e:
-                logger.warning(f"Failed to send cancellation SMS: {e}")
+                logger.warning("Failed to send cancellation SMS: %s", e)
         
         # Send notification email to dispatch team (fire-and-forget)
         try:
-            from src.integrations.email_notifications import send_new_lead_notification
-            
             # Format appointment details for email
             service_type = f"Cancelled: {appointment_name}"
             if appointment_datetime:
@@ -1766,7 +1876,6 @@ async def _handle_cancel_appointment(command: HaelCommand) -> OpsResult:
                 service_type += f" (was scheduled for {appointment_date} at {appointment_time})"
             
             # Send notification asynchronously (fire-and-forget)
-            import asyncio
             asyncio.create_task(send_new_lead_notification(
                 customer_name=entities.full_name,
                 phone=entities.phone,
@@ -1777,25 +1886,24 @@ async def _handle_cancel_appointment(command: HaelCommand) -> OpsResult:
                 assigned_technician=None,  # Appointment cancelled, no tech assigned
                 lead_id=lead_id,
             ))
-            logger.info(f"Scheduled cancellation notification email for appointment {event_id}")
+            logger.info("Scheduled cancellation notification email for appointment %s", event_id)
             response_data["email_scheduled"] = True
         except Exception as e:
-            logger.warning(f"Failed to send cancellation notification email: {e}")
+            logger.warning("Failed to send cancellation notification email: %s", e)
         
         # Optionally update linked lead: append call summary when present
         if lead_id:
             call_summary_cancel = (command.metadata or {}).get("call_summary")
             if call_summary_cancel and isinstance(call_summary_cancel, str) and call_summary_cancel.strip():
                 try:
-                    from src.integrations.odoo_leads import create_lead_service
-                    lead_svc = await create_lead_service()
+                    lead_svc = await _get_lead_service()
                     await lead_svc.append_call_summary_to_lead(lead_id, call_summary_cancel.strip())
                 except Exception as append_err:
                     logger.warning("Cancel: could not append call summary to lead %s: %s", lead_id, append_err)
             try:
-                logger.info(f"Appointment {event_id} cancelled, linked to lead {lead_id}")
+                logger.info("Appointment %s cancelled, linked to lead %s", event_id, lead_id)
             except Exception as e:
-                logger.warning(f"Failed to update lead {lead_id} after cancellation: {e}")
+                logger.warning("Failed to update lead %s after cancellation: %s", lead_id, e)
         
         # Add cancellation policy info
         if cancellation_within_24h:
@@ -1810,7 +1918,7 @@ async def _handle_cancel_appointment(command: HaelCommand) -> OpsResult:
         )
         
     except Exception as e:
-        logger.exception(f"Error cancelling appointment: {e}")
+        logger.exception("Error cancelling appointment: %s", e)
         return OpsResult(
             status=OpsStatus.ERROR,
             message="Cancellation request received. A representative will process your cancellation.",
@@ -1834,17 +1942,16 @@ async def _handle_status_update(command: HaelCommand) -> OpsResult:
             missing_fields=["phone or email"],
         )
 
-    from src.integrations.odoo_appointments import create_appointment_service
-
     try:
-        appointment_service = await create_appointment_service()
+        appointment_service = await _get_appointment_service()
         now = datetime.now()
-        date_to = now + timedelta(days=90)
-        events = await appointment_service.find_appointment_by_contact(
-            phone=entities.phone,
-            email=entities.email,
-            date_from=now,
-            date_to=date_to,
+        events = await _find_appointments_by_contact(
+            appointment_service,
+            entities.phone,
+            entities.email,
+            now,
+            days_back=0,
+            days_ahead=90,
         )
         # Keep only future (or today) appointments, sort by start ascending, take next
         future_events = []
@@ -1853,7 +1960,7 @@ async def _handle_status_update(command: HaelCommand) -> OpsResult:
             if not start_str:
                 continue
             try:
-                start_dt = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
+                start_dt = _parse_odoo_datetime(start_str)
                 if start_dt.tzinfo:
                     start_dt = start_dt.replace(tzinfo=None)
                 if start_dt >= now:
@@ -1878,7 +1985,7 @@ async def _handle_status_update(command: HaelCommand) -> OpsResult:
         start_dt, ev = future_events[0]
         stop_str = ev.get("stop") or ""
         try:
-            end_dt = datetime.fromisoformat(stop_str.replace("Z", "+00:00")) if stop_str else start_dt + timedelta(hours=4)
+            end_dt = _parse_odoo_datetime(stop_str) if stop_str else start_dt + timedelta(hours=4)
             if end_dt.tzinfo:
                 end_dt = end_dt.replace(tzinfo=None)
         except (ValueError, TypeError):
@@ -1914,7 +2021,7 @@ async def _handle_status_update(command: HaelCommand) -> OpsResult:
             },
         )
     except Exception as e:
-        logger.exception(f"Error looking up appointment status: {e}")
+        logger.exception("Error looking up appointment status: %s", e)
         return OpsResult(
             status=OpsStatus.ERROR,
             message="I had trouble looking up your appointment. Please try again or call us directly.",
@@ -1926,3 +2033,13 @@ async def _handle_status_update(command: HaelCommand) -> OpsResult:
             },
         )
 
+
+# Supported OPS intents -> handler
+_INTENT_DISPATCH: dict[Intent, Callable[[HaelCommand], Awaitable[OpsResult]]] = {
+    Intent.SERVICE_REQUEST: _handle_service_request,
+    Intent.SCHEDULE_APPOINTMENT: _handle_schedule_appointment,
+    Intent.RESCHEDULE_APPOINTMENT: _handle_reschedule_appointment,
+    Intent.CANCEL_APPOINTMENT: _handle_cancel_appointment,
+    Intent.STATUS_UPDATE_REQUEST: _handle_status_update,
+}
+OPS_INTENTS: frozenset[Intent] = frozenset(_INTENT_DISPATCH)
@@ -6,6 +6,7 @@ Service types, durations, and priorities from RDD.
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 
 class ServiceCategory(str, Enum):
@@ -135,10 +136,15 @@ def infer_service_type_from_description(description: str) -> ServiceType:
     """
     Infer service type from problem description.
     
-    Simple keyword-based inference for MVP.
+    Simple keyword-based inference for MVP. Results are cached on the
+    normalized description, so repeated phrasings skip the keyword scan.
     """
-    desc_lower = description.lower()
-    
+    return _infer_service_type(description.strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _infer_service_type(desc_lower: str) -> ServiceType:
+    """Keyword-based service type inference on a normalized description."""
     # Emergency keywords
     if any(kw in desc_lower for kw in ["emergency", "gas leak", "no heat", "no cooling", "urgent"]):
         return SERVICE_CATALOG["emergency_service"]
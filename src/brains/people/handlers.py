@@ -36,7 +36,7 @@ def handle_people_command(command: HaelCommand) -> PeopleResult:
     Returns:
         PeopleResult with operation outcome
     """
-    logger.info(f"PEOPLE brain handling command: {command.intent.value}")
+    logger.info("PEOPLE brain handling command: %s", command.intent.value)
 
     # Check if intent is supported
     if command.intent not in PEOPLE_INTENTS:
@@ -70,7 +70,7 @@ def handle_people_command(command: HaelCommand) -> PeopleResult:
                 requires_human=True,
             )
     except Exception as e:
-        logger.exception(f"Error handling PEOPLE command: {e}")
+        logger.exception("Error handling PEOPLE command: %s", e)
         return PeopleResult(
             status=PeopleStatus.ERROR,
             message=f"Internal error: {str(e)}",
@@ -42,7 +42,7 @@ def handle_revenue_command(command: HaelCommand) -> RevenueResult:
     Returns:
         RevenueResult with operation outcome
     """
-    logger.info(f"REVENUE brain handling command: {command.intent.value}")
+    logger.info("REVENUE brain handling command: %s", command.intent.value)
     
     # Check if intent is supported
     if command.intent not in REVENUE_INTENTS:
@@ -73,7 +73,7 @@ def handle_revenue_command(command: HaelCommand) -> RevenueResult:
             )
     except Exception as e:
         import traceback
-        logger.exception(f"Error handling REVENUE command: {e}\n{traceback.format_exc()}")
+        logger.exception("Error handling REVENUE command: %s\n%s", e, traceback.format_exc())
         return RevenueResult(
             status=RevenueStatus.ERROR,
             message=f"Internal error: {str(e)}",
@@ -212,7 +212,7 @@ def _handle_quote_request(command: HaelCommand) -> RevenueResult:
             "needs_quote_creation": True,
         }
     except Exception as e:
-        logger.warning(f"Failed to prepare quote creation: {e}")
+        logger.warning("Failed to prepare quote creation: %s", e)
         # Continue without quote creation
     
     message = (
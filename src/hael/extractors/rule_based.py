@@ -186,6 +186,42 @@ HIGH_URGENCY_KEYWORDS = [
     "no heat", "no heating", "no ac", "no cooling", "no air",
 ]
 
+
+
+def _compile_keyword_trie(keywords: list[str]) -> re.Pattern[str]:
+    """
+    Compile keywords into a single trie-structured regex.
+
+    Matches wherever any keyword occurs as a substring (same semantics as
+    ``any(kw in text for kw in keywords)``) but shares common prefixes, so the
+    regex engine never re-scans a prefix for each alternative. Keywords that
+    extend a shorter keyword are pruned since the shorter one already matches.
+    """
+    trie: dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            if "" in node:
+                break
+            node = node.setdefault(char, {})
+        else:
+            node.clear()
+            node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items())]
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return re.compile(build(trie))
+
+
+EMERGENCY_KEYWORDS_PATTERN = _compile_keyword_trie(EMERGENCY_KEYWORDS)
+HIGH_URGENCY_KEYWORDS_PATTERN = _compile_keyword_trie(HIGH_URGENCY_KEYWORDS)
+
 # =============================================================================
 # Entity Extraction Patterns
 # =============================================================================
@@ -358,9 +394,8 @@ class RuleBasedExtractor(BaseExtractor):
         - Medical/refrigeration/server room failures
         """
         # Check for always-emergency keywords (safety hazards)
-        for keyword in EMERGENCY_KEYWORDS:
-            if keyword in text_lower:
-                return UrgencyLevel.EMERGENCY
+        if EMERGENCY_KEYWORDS_PATTERN.search(text_lower):
+            return UrgencyLevel.EMERGENCY
 
         # Temperature-based emergency detection
         if entities.temperature_mentioned:
@@ -377,9 +412,8 @@ class RuleBasedExtractor(BaseExtractor):
                 return UrgencyLevel.EMERGENCY
 
         # High urgency keywords
-        for keyword in HIGH_URGENCY_KEYWORDS:
-            if keyword in text_lower:
-                return UrgencyLevel.HIGH
+        if HIGH_URGENCY_KEYWORDS_PATTERN.search(text_lower):
+            return UrgencyLevel.HIGH
 
         # Default based on context
         if any(kw in text_lower for kw in ["repair", "fix", "service", "tune-up", "tune up", "maintenance"]):
@@ -6,9 +6,12 @@ Designed for idempotent upsert operations (one lead per call_id).
 """
 
 import html
+import json
 import logging
 import re
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 from src.integrations.odoo import OdooClient, create_odoo_client_from_settings
@@ -48,6 +51,43 @@ CRM_LEAD_FIELDS = [
     "priority",  # 0-3 priority
 ]
 
+# Odoo reference IDs (activity types, ir.model records) practically never
+# change, so successful lookups are cached per process for an hour
+REFERENCE_ID_CACHE_TTL_SECONDS = 3600.0
+_reference_id_cache: dict[tuple[str, str], tuple[float, int]] = {}
+
+
+def _get_cached_reference_id(model: str, key: str) -> int | None:
+    """Return a cached reference ID, or None if missing or expired."""
+    entry = _reference_id_cache.get((model, key))
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
+
+
+def _cache_reference_id(model: str, key: str, record_id: int) -> None:
+    """Cache a reference ID for REFERENCE_ID_CACHE_TTL_SECONDS."""
+    _reference_id_cache[(model, key)] = (
+        time.monotonic() + REFERENCE_ID_CACHE_TTL_SECONDS,
+        record_id,
+    )
+
+
+
+@lru_cache(maxsize=4)
+def _parse_tech_user_ids(raw_json: str) -> dict[str, int]:
+    """
+    Parse ODOO_TECH_USER_IDS_JSON (tech name -> Odoo user ID) once per value.
+    
+    The result is shared between callers and must not be mutated.
+    """
+    try:
+        return json.loads(raw_json)
+    except json.JSONDecodeError:
+        logger.warning("Failed to parse ODOO_TECH_USER_IDS_JSON")
+        return {}
+
+
 # Mapping from UrgencyLevel to Odoo priority (0=low, 1=medium, 2=high, 3=very high)
 URGENCY_TO_PRIORITY = {
     UrgencyLevel.EMERGENCY: "3",
@@ -830,15 +870,8 @@ class LeadService:
             # Get activity type ID if not provided (try to find "To Do")
             if activity_type_id is None:
                 try:
-                    types = await self.client.search_read(
-                        "mail.activity.type",
-                        [("name", "ilike", "To Do")],
-                        fields=["id"],
-                        limit=1,
-                    )
-                    if types:
-                        activity_type_id = types[0]["id"]
-                    else:
+                    activity_type_id = await self._get_activity_type_id("To Do")
+                    if activity_type_id is None:
                         # Fall back to first available type
                         types = await self.client.search_read(
                             "mail.activity.type",
@@ -879,7 +912,11 @@ class LeadService:
             return None
     
     async def _get_model_id(self, model_name: str) -> int | None:
-        """Get the ir.model ID for a model name."""
+        """Get the ir.model ID for a model name (cached)."""
+        cached = _get_cached_reference_id("ir.model", model_name)
+        if cached is not None:
+            return cached
+        
         try:
             models = await self.client.search_read(
                 "ir.model",
@@ -887,9 +924,36 @@ class LeadService:
                 fields=["id"],
                 limit=1,
             )
-            return models[0]["id"] if models else None
         except Exception:
             return None
+        
+        if not models:
+            return None
+        _cache_reference_id("ir.model", model_name, models[0]["id"])
+        return models[0]["id"]
+    
+    async def _get_activity_type_id(self, name: str) -> int | None:
+        """Get a mail.activity.type ID by (partial) name (cached)."""
+        cached = _get_cached_reference_id("mail.activity.type", name)
+        if cached is not None:
+            return cached
+        
+        try:
+            await self._ensure_authenticated()
+            types = await self.client.search_read(
+                "mail.activity.type",
+                [("name", "ilike", name)],
+                fields=["id"],
+                limit=1,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to look up activity type {name!r}: {e}")
+            return None
+        
+        if not types:
+            return None
+        _cache_reference_id("mail.activity.type", name, types[0]["id"])
+        return types[0]["id"]
     
     async def _handle_emergency_notifications(
         self,
@@ -905,7 +969,6 @@ class LeadService:
         3. Create activities for Dispatch/Linda/Tech
         """
         from src.config.settings import get_settings
-        import json
         
         settings = get_settings()
         
@@ -978,12 +1041,9 @@ class LeadService:
         
         # Assigned tech user
         if settings.ODOO_TECH_USER_IDS_JSON:
-            try:
-                tech_user_ids = json.loads(settings.ODOO_TECH_USER_IDS_JSON)
-                if tech_name and tech_name.lower() in tech_user_ids:
-                    user_ids_to_notify.append((tech_name, tech_user_ids[tech_name.lower()]))
-            except json.JSONDecodeError:
-                logger.warning("Failed to parse ODOO_TECH_USER_IDS_JSON")
+            tech_user_ids = _parse_tech_user_ids(settings.ODOO_TECH_USER_IDS_JSON)
+            if tech_name and tech_name.lower() in tech_user_ids:
+                user_ids_to_notify.append((tech_name, tech_user_ids[tech_name.lower()]))
         
         for name, user_id in user_ids_to_notify:
             await self.create_activity(
@@ -18,6 +18,7 @@ from src.config.settings import get_settings
 from src.db.engine import get_engine
 from src.monitoring.metrics import increment_errors, increment_requests
 from src.monitoring.router import router as monitoring_router
+from src.utils.audit import start_audit_worker, stop_audit_worker
 from src.utils.errors import APIError
 from src.utils.logger import get_logger, log_request, setup_logging
 from src.utils.request_id import generate_request_id, get_request_id, set_request_id
@@ -43,10 +44,14 @@ async def lifespan(app: FastAPI):
     # Log security warnings
     log_security_warnings()
 
+    # Background writer for fire-and-forget audit events
+    start_audit_worker()
+
     yield
 
     # Shutdown
     logger.info("Shutting down HAES HVAC API")
+    await stop_audit_worker()
 
 
 # Create FastAPI application
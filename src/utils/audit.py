@@ -4,6 +4,7 @@ HAES HVAC - Audit Logging Utilities
 Helpers for writing to the audit_log table for traceability and KPI computation.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any
@@ -11,9 +12,17 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from src.db.models import AuditLog
+from src.db.session import get_session_factory
 
 logger = logging.getLogger(__name__)
 
+# Bounded queue for fire-and-forget audit writes (see log_event_nowait)
+AUDIT_QUEUE_MAXSIZE = 1000
+AUDIT_DRAIN_TIMEOUT_SECONDS = 5.0
+
+_audit_queue: asyncio.Queue | None = None
+_audit_worker_task: asyncio.Task | None = None
+
 
 def log_event(
     session: Session,
@@ -67,6 +76,86 @@ def log_event(
     return record
 
 
+def log_event_nowait(**fields: Any) -> bool:
+    """
+    Queue an audit event to be written by the background audit worker.
+    
+    Never blocks or raises: audit is fail-open, so events are dropped (with a
+    warning) when the queue is full or the worker is not running.
+    
+    Args:
+        **fields: Keyword arguments for log_event (excluding session)
+        
+    Returns:
+        True if the event was queued, False if it was dropped
+    """
+    if _audit_queue is None:
+        logger.debug(f"Audit worker not running, dropping event: intent={fields.get('intent')}")
+        return False
+    
+    try:
+        _audit_queue.put_nowait(fields)
+    except asyncio.QueueFull:
+        logger.warning(f"Audit queue full, dropping event: intent={fields.get('intent')}")
+        return False
+    
+    return True
+
+
+def _write_queued_event(fields: dict[str, Any]) -> None:
+    """Write one queued audit event in its own session."""
+    session = get_session_factory()()
+    try:
+        log_event(session=session, **fields)
+    finally:
+        session.close()
+
+
+async def _audit_worker(queue: asyncio.Queue) -> None:
+    """Consume queued audit events, writing each off the event loop."""
+    while True:
+        fields = await queue.get()
+        try:
+            await asyncio.to_thread(_write_queued_event, fields)
+        except Exception as e:
+            logger.warning(f"Failed to write queued audit event: {e}")
+        finally:
+            queue.task_done()
+
+
+def start_audit_worker() -> None:
+    """Create the audit queue and start its consumer on the running event loop."""
+    global _audit_queue, _audit_worker_task
+    
+    if _audit_worker_task is not None and not _audit_worker_task.done():
+        return
+    
+    _audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+    _audit_worker_task = asyncio.create_task(_audit_worker(_audit_queue))
+
+
+async def stop_audit_worker() -> None:
+    """Drain pending audit events (bounded wait) and stop the consumer."""
+    global _audit_queue, _audit_worker_task
+    
+    queue, task = _audit_queue, _audit_worker_task
+    _audit_queue = None
+    _audit_worker_task = None
+    if queue is None or task is None:
+        return
+    
+    try:
+        await asyncio.wait_for(queue.join(), timeout=AUDIT_DRAIN_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning(f"Audit queue not drained on shutdown, {queue.qsize()} events dropped")
+    
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
 def log_vapi_tool_call(
     session: Session,
     request_id: str,
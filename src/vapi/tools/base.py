@@ -12,6 +12,8 @@ Common utilities for all Vapi tool handlers:
 
 import asyncio
 import logging
+import re
+from enum import Enum
 from typing import Any
 from datetime import datetime
 
@@ -28,6 +30,67 @@ logger = logging.getLogger(__name__)
 # Idempotency scope for Vapi tools
 VAPI_TOOL_SCOPE = "vapi_tool"
 
+# Phrases indicating the caller dialed the wrong number
+WRONG_NUMBER_PHRASES = (
+    "wrong number",
+    "sorry wrong number",
+    "misdial",
+    "wrong company",
+    "didn't mean to call",
+    "accidental call",
+    "not who i wanted",
+    "wrong business",
+)
+
+# Common profanity/abuse indicators (basic list - can be enhanced)
+PROFANITY_INDICATORS = (
+    # Profanity (common words)
+    "fuck", "shit", "damn", "hell", "asshole", "bastard", "bitch",
+    # Abusive language
+    "you're stupid", "you're dumb", "idiot", "moron", "stupid system",
+    "this is bullshit", "this sucks", "terrible service",
+    # Threatening language
+    "i'll sue", "i'll report you", "i'll complain", "lawyer",
+    # Aggressive language
+    "i'm furious", "i'm extremely angry", "worst service ever",
+)
+
+# Keywords per request type for multiple-intent detection
+INTENT_KEYWORDS = {
+    "service": ("service", "repair", "fix", "broken", "not working", "diagnostic"),
+    "appointment": ("appointment", "schedule", "book", "reschedule", "cancel"),
+    "quote": ("quote", "price", "cost", "estimate", "how much"),
+    "billing": ("bill", "invoice", "payment", "pay", "balance", "due"),
+    "complaint": ("complaint", "unhappy", "upset", "problem", "issue", "wrong"),
+    "membership": ("membership", "maintenance plan", "tune-up"),
+}
+
+
+def _compile_phrases(phrases: tuple[str, ...]) -> re.Pattern:
+    """Compile literal phrases into one alternation (substring semantics)."""
+    return re.compile("|".join(re.escape(p) for p in phrases))
+
+
+_WRONG_NUMBER_RE = _compile_phrases(WRONG_NUMBER_PHRASES)
+_PROFANITY_RE = _compile_phrases(PROFANITY_INDICATORS)
+_INTENT_RES = tuple(
+    (intent, _compile_phrases(keywords)) for intent, keywords in INTENT_KEYWORDS.items()
+)
+
+
+def _conversation_text(conversation_context: str | None, user_text: str | None) -> str:
+    """Lowercased text scanned by the conversation detectors."""
+    return f"{conversation_context or ''} {user_text or ''}".lower()
+
+
+class ConversationSignal(str, Enum):
+    """Outcome of the pre-tool conversation checks, in priority order."""
+    NONE = "none"
+    WRONG_NUMBER = "wrong_number"
+    PROFANITY = "profanity_abuse"
+    UNCLEAR = "unclear_speech"
+    MULTI_INTENT = "multiple_intents"
+
 
 class ToolResponse:
     """Standard Vapi tool response format."""
@@ -410,27 +473,7 @@ class BaseToolHandler:
         if not conversation_context and not user_text:
             return False
         
-        text = (conversation_context or "") + " " + (user_text or "")
-        text_lower = text.lower()
-        
-        # Common profanity/abuse indicators (basic list - can be enhanced)
-        profanity_indicators = [
-            # Profanity (common words)
-            "fuck", "shit", "damn", "hell", "asshole", "bastard", "bitch",
-            # Abusive language
-            "you're stupid", "you're dumb", "idiot", "moron", "stupid system",
-            "this is bullshit", "this sucks", "terrible service",
-            # Threatening language
-            "i'll sue", "i'll report you", "i'll complain", "lawyer",
-            # Aggressive language
-            "i'm furious", "i'm extremely angry", "worst service ever",
-        ]
-        
-        for indicator in profanity_indicators:
-            if indicator in text_lower:
-                return True
-        
-        return False
+        return _PROFANITY_RE.search(_conversation_text(conversation_context, user_text)) is not None
     
     def detect_wrong_number(
         self,
@@ -446,25 +489,7 @@ class BaseToolHandler:
         if not conversation_context and not user_text:
             return False
         
-        text = (conversation_context or "") + " " + (user_text or "")
-        text_lower = text.lower()
-        
-        wrong_number_phrases = [
-            "wrong number",
-            "sorry wrong number",
-            "misdial",
-            "wrong company",
-            "didn't mean to call",
-            "accidental call",
-            "not who i wanted",
-            "wrong business",
-        ]
-        
-        for phrase in wrong_number_phrases:
-            if phrase in text_lower:
-                return True
-        
-        return False
+        return _WRONG_NUMBER_RE.search(_conversation_text(conversation_context, user_text)) is not None
     
     def handle_unclear_speech(
         self,
@@ -630,31 +655,64 @@ class BaseToolHandler:
         Returns:
             List of detected intent keywords, or None if single intent
         """
-        text = (conversation_context or "") + " " + (user_text or "")
+        text = _conversation_text(conversation_context, user_text)
         if not text.strip():
             return None
         
-        text_lower = text.lower()
-        
-        # Intent keywords
-        intent_keywords = {
-            "service": ["service", "repair", "fix", "broken", "not working", "diagnostic"],
-            "appointment": ["appointment", "schedule", "book", "reschedule", "cancel"],
-            "quote": ["quote", "price", "cost", "estimate", "how much"],
-            "billing": ["bill", "invoice", "payment", "pay", "balance", "due"],
-            "complaint": ["complaint", "unhappy", "upset", "problem", "issue", "wrong"],
-            "membership": ["membership", "maintenance plan", "tune-up"],
-        }
-        
-        # Detect multiple intents
-        detected = []
-        for intent, keywords in intent_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                detected.append(intent)
+        detected = [intent for intent, pattern in _INTENT_RES if pattern.search(text)]
         
         # Return if multiple intents detected
         return detected if len(detected) > 1 else None
     
+    def analyze_conversation(
+        self,
+        conversation_context: str | None = None,
+        user_text: str | None = None,
+        confidence: Any = None,
+        retry_count: Any = 0,
+        check_multiple_intents: bool = True,
+    ) -> tuple[ConversationSignal, Any]:
+        """
+        Run the pre-tool conversation checks over a single prepared text.
+        
+        Checks run in priority order: wrong number, profanity/abuse, unclear
+        speech, then multiple intents.
+        
+        Args:
+            conversation_context: Conversation so far
+            user_text: Latest user utterance
+            confidence: Speech recognition confidence, if reported
+            retry_count: Clarification retries already attempted
+            check_multiple_intents: Whether to look for multiple requests
+        
+        Returns:
+            (signal, detail) where detail is the clarification ToolResponse for
+            UNCLEAR, the detected intents for MULTI_INTENT, and None otherwise
+        """
+        text = _conversation_text(conversation_context, user_text)
+        has_text = bool(text.strip())
+        
+        if has_text and _WRONG_NUMBER_RE.search(text):
+            return ConversationSignal.WRONG_NUMBER, None
+        
+        if has_text and _PROFANITY_RE.search(text):
+            return ConversationSignal.PROFANITY, None
+        
+        if confidence is not None:
+            unclear_response = self.handle_unclear_speech(
+                confidence=float(confidence),
+                retry_count=int(retry_count),
+            )
+            if unclear_response:
+                return ConversationSignal.UNCLEAR, unclear_response
+        
+        if check_multiple_intents and has_text:
+            detected = [intent for intent, pattern in _INTENT_RES if pattern.search(text)]
+            if len(detected) > 1:
+                return ConversationSignal.MULTI_INTENT, detected
+        
+        return ConversationSignal.NONE, None
+    
     def format_multi_request_response(
         self,
         detected_intents: list[str],
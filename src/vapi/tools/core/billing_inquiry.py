@@ -129,7 +129,7 @@ async def handle_billing_inquiry(
             "due_text": "Due upon receipt" if payment_terms.due_days == 0 else f"Net {payment_terms.due_days} days",
             "late_fee_percent": payment_terms.late_fee_percent,
             "late_fee_text": f"{payment_terms.late_fee_percent}% per month after due date",
-            "accepted_methods": payment_terms.accepted_methods,
+            "accepted_methods": list(payment_terms.accepted_methods),
             "formatted_text": payment_terms_text,
         }
         
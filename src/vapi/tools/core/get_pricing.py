@@ -141,7 +141,7 @@ async def handle_get_pricing(
                 "is_emergency": is_emergency,
                 "is_weekend": is_weekend,
                 "is_after_hours": is_after_hours,
-                "notes": pricing.notes,
+                "notes": list(pricing.notes),
             },
         )
     
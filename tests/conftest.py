@@ -44,3 +44,13 @@ def db_session():
         session.rollback()
         session.close()
 
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_ops_services():
+    """Drop shared OPS Odoo services so patched factories take effect per test."""
+    from src.brains.ops.handlers import reset_ops_services
+
+    reset_ops_services()
+    yield
+    reset_ops_services()
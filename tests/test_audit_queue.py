@@ -0,0 +1,53 @@
+"""
+HAES HVAC - Audit Queue Tests
+
+Tests for fire-and-forget audit logging via the background audit worker.
+"""
+
+from unittest.mock import patch
+
+from src.utils import audit
+
+
+class TestAuditQueue:
+    """Tests for log_event_nowait and the audit worker lifecycle."""
+
+    def test_dropped_when_worker_not_running(self):
+        """Events are dropped (not raised) when no worker is running."""
+        assert audit._audit_queue is None
+        assert audit.log_event_nowait(intent="test") is False
+
+    async def test_worker_writes_queued_events(self):
+        """Queued events are written by the worker and drained on stop."""
+        with patch("src.utils.audit._write_queued_event") as mock_write:
+            audit.start_audit_worker()
+            try:
+                assert audit.log_event_nowait(request_id="req_1", intent="emergency_confirmation") is True
+            finally:
+                await audit.stop_audit_worker()
+
+        mock_write.assert_called_once_with({"request_id": "req_1", "intent": "emergency_confirmation"})
+        assert audit._audit_queue is None
+
+    async def test_full_queue_drops_event(self):
+        """A full queue drops the event instead of blocking the caller."""
+        with patch("src.utils.audit.AUDIT_QUEUE_MAXSIZE", 1), \
+             patch("src.utils.audit._write_queued_event"):
+            audit.start_audit_worker()
+            try:
+                assert audit.log_event_nowait(intent="first") is True
+                assert audit.log_event_nowait(intent="second") is False
+            finally:
+                await audit.stop_audit_worker()
+
+    async def test_write_failure_does_not_stop_worker(self):
+        """A failing write is logged and the worker keeps consuming."""
+        with patch("src.utils.audit._write_queued_event", side_effect=[RuntimeError("db down"), None]) as mock_write:
+            audit.start_audit_worker()
+            try:
+                audit.log_event_nowait(intent="first")
+                audit.log_event_nowait(intent="second")
+            finally:
+                await audit.stop_audit_worker()
+
+        assert mock_write.call_count == 2
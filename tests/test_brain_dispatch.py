@@ -0,0 +1,46 @@
+"""
+HAES HVAC - Brain Dispatch Tests
+
+Tests for the shared HAEL route/build/dispatch pipeline.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.brains.dispatch import dispatch_command, run_hael
+from src.hael import Brain, Channel, Entity, HaelExtractionResult, Intent
+
+
+class TestRunHael:
+    """Tests for run_hael."""
+
+    async def test_routes_to_brain_handler(self):
+        """Extractions are routed and dispatched to their brain."""
+        extraction = HaelExtractionResult(
+            intent=Intent.HIRING_INQUIRY, entities=Entity(), confidence=0.9,
+        )
+        command, result = await run_hael(
+            extraction,
+            channel=Channel.CHAT,
+            raw_text="Are you hiring?",
+            request_id="req-1",
+            metadata={"session_id": "s1"},
+        )
+
+        assert command.brain == Brain.PEOPLE
+        assert command.request_id == "req-1"
+        assert command.metadata["session_id"] == "s1"
+        assert result.status.value == "success"
+
+    async def test_sync_and_async_handlers(self):
+        """Sync handlers are called inline and async handlers are awaited."""
+        sync_handler = MagicMock(return_value="core")
+        async_handler = AsyncMock(return_value="ops")
+        handlers = {Brain.CORE: (False, sync_handler), Brain.OPS: (True, async_handler)}
+
+        with patch.dict("src.brains.dispatch.BRAIN_HANDLERS", handlers):
+            assert await dispatch_command(MagicMock(brain=Brain.CORE)) == "core"
+            assert await dispatch_command(MagicMock(brain=Brain.OPS)) == "ops"
+
+    async def test_unknown_brain_returns_none(self):
+        """Commands for unknown brains are not dispatched."""
+        assert await dispatch_command(MagicMock(brain=Brain.UNKNOWN)) is None
@@ -95,3 +95,28 @@ class TestDiscountApprovals:
         assert result.approval_required is True
         assert result.approver == "Junior"
 
+
+
+class TestThresholdBoundaries:
+    """Tests for inclusive bounds and gaps between threshold ranges."""
+
+    @pytest.mark.parametrize(
+        "approval_type,amount,rule_id",
+        [
+            (ApprovalType.QUOTE, 20000, "quote_auto"),
+            (ApprovalType.QUOTE, 20000.01, "quote_linda"),
+            (ApprovalType.QUOTE, 1000000, "quote_linda"),
+            (ApprovalType.PURCHASE_ORDER, 99, "po_auto"),
+            (ApprovalType.PURCHASE_ORDER, 99.5, "default_owner"),
+            (ApprovalType.PURCHASE_ORDER, 500.5, "default_owner"),
+            (ApprovalType.REFUND, 0, "refund_tech"),
+            (ApprovalType.REFUND, 0.5, "default_owner"),
+            (ApprovalType.DISCOUNT, 10.05, "default_owner"),
+            (ApprovalType.DISCOUNT, -1, "default_owner"),
+            (ApprovalType.WRITE_OFF, 10, "unknown_type"),
+        ],
+    )
+    def test_rule_selection(self, approval_type, amount, rule_id):
+        """The first range containing the amount wins; gaps fall back to the owner."""
+        result = get_approval_decision(approval_type, amount)
+        assert result.threshold_rule_id == rule_id
@@ -31,7 +31,12 @@ from src.brains.core.handlers import (
 )
 from src.brains.core.schema import CoreStatus, PricingTier
 from src.brains.core.pricing_catalog import get_tier_pricing, get_default_tier
-from src.brains.core.payment_terms import get_payment_terms, format_payment_terms_text
+from src.brains.core.payment_terms import (
+    calculate_late_fee,
+    calculate_late_fees_batch,
+    format_payment_terms_text,
+    get_payment_terms,
+)
 from src.brains.core.approval_rules import get_approval_decision, ApprovalType
 from src.brains.core.compliance import get_required_disclosures
 
@@ -91,6 +96,10 @@ class TestCoreIntentsConfiguration:
         """CORE should handle exactly 5 intents."""
         assert len(CORE_INTENTS) == 5
 
+    def test_core_intents_is_frozen(self):
+        """CORE intents are an immutable frozenset."""
+        assert isinstance(CORE_INTENTS, frozenset)
+
 
 # =============================================================================
 # BILLING INQUIRY HANDLER TESTS
@@ -315,6 +324,16 @@ class TestInventoryInquiryHandler:
 
         assert "part" in result.message.lower() or "equipment" in result.message.lower()
 
+    def test_inventory_results_not_shared(self):
+        """Callers annotating one inventory result must not affect the next."""
+        command = create_core_command(intent=Intent.INVENTORY_INQUIRY)
+        first = handle_core_command(command)
+        first.data["hide_live_handoff"] = True
+
+        second = handle_core_command(command)
+        assert second is not first
+        assert second.data == {"action": "inventory_lookup"}
+
 
 # =============================================================================
 # PURCHASE REQUEST HANDLER TESTS
@@ -537,6 +556,34 @@ class TestPaymentTerms:
         assert len(text) > 0
         assert isinstance(text, str)
 
+    @pytest.mark.parametrize("segment,due_text", [
+        ("Property Management", "Net 30 days"),
+        ("commercial", "Net 15 days"),
+        ("unknown", "Due upon receipt"),
+        (None, "Due upon receipt"),
+    ])
+    def test_format_payment_terms_normalizes_segment(self, segment, due_text):
+        """Segments are normalized before picking the pre-rendered text."""
+        text = format_payment_terms_text(segment)
+        assert text.startswith(f"Payment Terms: {due_text}\n")
+
+    @pytest.mark.parametrize("segment", [
+        "national_account", "National Account", "national-account",
+        "NATIONAL_ACCOUNT", "National-Account", "nAtIoNaL aCcOuNt",
+    ])
+    def test_payment_terms_segment_spellings(self, segment):
+        """Common and uncommon spellings resolve to the same segment terms."""
+        assert get_payment_terms(segment) is get_payment_terms("national_account")
+
+    def test_late_fees_batch_matches_single(self):
+        """Batch late fees match calculate_late_fee invoice by invoice."""
+        invoices = [(500.0, 0), (500.0, -3), (1200.0, 1), (1200.0, 30), (99.99, 31), (250.0, 95)]
+        fees = calculate_late_fees_batch(invoices, "commercial")
+        assert fees == [
+            calculate_late_fee(amount, days, "commercial") for amount, days in invoices
+        ]
+        assert fees[:3] == [0.0, 0.0, 12.0]
+
 
 # =============================================================================
 # APPROVAL RULES TESTS
@@ -584,6 +631,28 @@ class TestComplianceDisclosures:
         # Should have required disclosure attributes
         assert hasattr(disclosures, 'license_number') or hasattr(disclosures, 'disclosure_text')
 
+    def test_disclosures_shared_and_frozen(self):
+        """Disclosures are built once and cannot be mutated by callers."""
+        from dataclasses import FrozenInstanceError
+
+        disclosures = get_required_disclosures()
+        assert get_required_disclosures() is disclosures
+        with pytest.raises(FrozenInstanceError):
+            disclosures.license_number = "changed"
+
+    @pytest.mark.parametrize("service_type,warranty_key", [
+        ("Equipment Installation", "labor_equipment"),
+        ("AC REPLACEMENT", "labor_equipment"),
+        ("repair", "labor_repair"),
+        ("maintenance", "labor_repair"),
+        ("", "labor_repair"),
+    ])
+    def test_warranty_for_service_type(self, service_type, warranty_key):
+        """Installs and replacements get the equipment warranty, all else repair."""
+        from src.brains.core.compliance import WARRANTY_TERMS, get_warranty_for_service_type
+
+        assert get_warranty_for_service_type(service_type) is WARRANTY_TERMS[warranty_key]
+
 
 # =============================================================================
 # UNSUPPORTED INTENT TESTS
@@ -663,3 +732,12 @@ class TestTierPricingCatalog:
         # Both should have valid pricing
         assert retail.diagnostic_fee >= 0
         assert default_pm.diagnostic_fee >= 0
+
+    def test_tier_pricing_is_frozen(self):
+        """Catalog entries are immutable slotted instances."""
+        from dataclasses import FrozenInstanceError
+
+        pricing = get_tier_pricing(PricingTier.RETAIL)
+        assert not hasattr(pricing, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            pricing.diagnostic_fee = 0.0
@@ -96,3 +96,13 @@ class TestPricingCalculations:
         expected = 129.0 + 75.0 + 50.0 + 50.0
         assert result.total_base_fee == expected
 
+
+    def test_results_are_shared_and_frozen(self):
+        """Each tier/flag combination is priced once and cannot be mutated."""
+        from dataclasses import FrozenInstanceError
+
+        result = calculate_service_pricing(is_emergency=True)
+        assert calculate_service_pricing(PricingTier.RETAIL, is_emergency=1) is result
+        assert result.notes == ["Emergency service premium applied"]
+        with pytest.raises(FrozenInstanceError):
+            result.total_base_fee = 0.0
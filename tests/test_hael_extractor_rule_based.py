@@ -189,3 +189,25 @@ class TestConfidenceScores:
             result = extractor.extract(text)
             assert 0.0 <= result.confidence <= 1.0
 
+
+
+class TestKeywordTrie:
+    """Tests for trie-compiled keyword patterns."""
+
+    @pytest.mark.parametrize("keywords_name", ["EMERGENCY_KEYWORDS", "HIGH_URGENCY_KEYWORDS"])
+    def test_trie_matches_substring_semantics(self, keywords_name):
+        """Trie pattern should match exactly when any keyword is a substring."""
+        from src.hael.extractors import rule_based
+
+        keywords = getattr(rule_based, keywords_name)
+        pattern = getattr(rule_based, f"{keywords_name}_PATTERN")
+        for keyword in keywords:
+            for text in (keyword, f"well {keyword} here", keyword[:-1], keyword[1:]):
+                assert bool(pattern.search(text)) == any(kw in text for kw in keywords)
+
+    def test_trie_prunes_extended_keywords(self):
+        """Keywords extending a shorter keyword are covered by the shorter one."""
+        from src.hael.extractors.rule_based import _compile_keyword_trie
+
+        pattern = _compile_keyword_trie(["fire smell", "fire", "flames"])
+        assert pattern.pattern == "f(?:ire|lames)"
@@ -122,6 +122,48 @@ class TestLeadServiceFieldCaching:
         assert fields1 == fields2
 
 
+class TestReferenceIdCaching:
+    """Tests for cached Odoo reference ID lookups."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from src.integrations.odoo_leads import _reference_id_cache
+        
+        _reference_id_cache.clear()
+        yield
+        _reference_id_cache.clear()
+    
+    @pytest.mark.asyncio
+    async def test_activity_type_id_cached_across_services(self, mock_odoo_client):
+        """Activity type lookups hit Odoo once, even across service instances."""
+        mock_odoo_client.is_authenticated = True
+        mock_odoo_client.search_read = AsyncMock(return_value=[{"id": 7}])
+        
+        assert await LeadService(mock_odoo_client)._get_activity_type_id("Call") == 7
+        assert await LeadService(mock_odoo_client)._get_activity_type_id("Call") == 7
+        
+        assert mock_odoo_client.search_read.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_missing_activity_type_not_cached(self, lead_service, mock_odoo_client):
+        """Misses are retried rather than cached."""
+        mock_odoo_client.is_authenticated = True
+        
+        assert await lead_service._get_activity_type_id("Call") is None
+        assert await lead_service._get_activity_type_id("Call") is None
+        
+        assert mock_odoo_client.search_read.call_count == 2
+    
+    def test_tech_user_ids_parsed_once(self):
+        """ODOO_TECH_USER_IDS_JSON is parsed once per distinct value."""
+        from src.integrations.odoo_leads import _parse_tech_user_ids
+        
+        raw = '{"junior": 12, "bounthon": 14}'
+        assert _parse_tech_user_ids(raw) == {"junior": 12, "bounthon": 14}
+        assert _parse_tech_user_ids(raw) is _parse_tech_user_ids(raw)
+        assert _parse_tech_user_ids("not json") == {}
+
+
 class TestEnsurePartner:
     """Tests for partner creation/lookup."""
     
@@ -10,8 +10,10 @@ Exhaustive tests for OPS brain handlers covering:
 - Missing field validation
 """
 
+import asyncio
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 from src.hael.schema import (
@@ -25,6 +27,9 @@ from src.hael.schema import (
 from src.brains.ops.handlers import (
     handle_ops_command,
     OPS_INTENTS,
+    _find_appointments_by_contact,
+    _parse_odoo_datetime,
+    _tech_payloads,
 )
 
 from src.brains.ops.schema import OpsStatus, ServicePriority
@@ -627,6 +632,168 @@ class TestCancelAppointmentHandler:
         assert result.requires_human is True
 
 
+class TestAppointmentLookupCoalescing:
+    """Tests for sharing concurrent appointment lookups."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(self):
+        """Concurrent lookups for the same contact issue one Odoo query."""
+        release = asyncio.Event()
+        events = [{"id": 7, "start": "2030-01-01 10:00:00"}]
+
+        async def find_appointment_by_contact(**kwargs):
+            await release.wait()
+            return events
+
+        service = MagicMock()
+        service.find_appointment_by_contact = AsyncMock(side_effect=find_appointment_by_contact)
+        now = datetime.now()
+        lookups = [
+            asyncio.create_task(
+                _find_appointments_by_contact(service, "5125551234", None, now, 30, 90)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*lookups) == [events] * 3
+        service.find_appointment_by_contact.assert_awaited_once()
+
+        # Completed lookups are not reused
+        await _find_appointments_by_contact(service, "5125551234", None, now, 30, 90)
+        assert service.find_appointment_by_contact.await_count == 2
+
+
+class TestOdooDatetimeParsing:
+    """Tests for parsing Odoo appointment timestamps."""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("2030-01-02 10:30:00", datetime(2030, 1, 2, 10, 30)),
+        ("2030-01-02T10:30:00Z", datetime(2030, 1, 2, 10, 30, tzinfo=timezone.utc)),
+        ("2030-01-02T10:30:00+00:00", datetime(2030, 1, 2, 10, 30, tzinfo=timezone.utc)),
+    ])
+    def test_parse_odoo_datetime(self, value, expected):
+        """Naive Odoo timestamps stay naive; a trailing Z means UTC."""
+        parsed = _parse_odoo_datetime(value)
+        assert parsed == expected
+        assert parsed.tzinfo == expected.tzinfo
+
+
+class TestTechnicianPayloads:
+    """Tests for the technician assignment payloads."""
+
+    def test_payloads_share_technician_fields(self):
+        """The work order assignment and response dict describe the same technician."""
+        assignment, data = _tech_payloads({"id": 42, "name": "Aubry", "login": "a@x.com"})
+        assert assignment.technician_id == data["id"] == "42"
+        assert assignment.technician_name == data["name"] == "Aubry"
+        assert data == {"id": "42", "name": "Aubry", "phone": None}
+
+    def test_no_technician(self):
+        """No technician yields no payloads."""
+        assert _tech_payloads(None) == (None, None)
+
+
+class TestScheduleAppointmentConcurrency:
+    """Tests for overlapping Odoo work in the schedule handler."""
+
+    @pytest.mark.asyncio
+    async def test_partner_resolved_during_slot_search(self, monkeypatch):
+        """ensure_partner runs alongside the technician lookup and feeds create_appointment."""
+        from datetime import timedelta
+        from src.brains.ops import handlers
+
+        slot_search_started = asyncio.Event()
+
+        async def ensure_partner(**kwargs):
+            await slot_search_started.wait()
+            return 42
+
+        async def get_tech_user_id(*args, **kwargs):
+            slot_search_started.set()
+            return 7
+
+        appointment_service = MagicMock()
+        appointment_service._get_tech_user_id = AsyncMock(side_effect=get_tech_user_id)
+        appointment_service.is_office_user_id = MagicMock(return_value=False)
+        appointment_service.get_live_user_by_id = AsyncMock(return_value={"id": 7, "name": "Tech"})
+        appointment_service.create_appointment = AsyncMock(return_value=99)
+        lead_service = MagicMock()
+        lead_service.ensure_partner = AsyncMock(side_effect=ensure_partner)
+        lead_service.upsert_service_lead = AsyncMock(return_value={"lead_id": 5})
+        lead_service.set_fsm_task_assignee = AsyncMock()
+        monkeypatch.setattr(handlers, "_get_appointment_service", AsyncMock(return_value=appointment_service))
+        monkeypatch.setattr(handlers, "_get_lead_service", AsyncMock(return_value=lead_service))
+
+        chosen = (datetime.now() + timedelta(days=2)).replace(hour=10, minute=0, second=0, microsecond=0)
+        command = create_ops_command(
+            intent=Intent.SCHEDULE_APPOINTMENT,
+            entities=Entity(
+                full_name="Jane Doe",
+                phone="512-555-1234",
+                address="123 Main St, Austin, TX 78701",
+                problem_description="AC is not cooling",
+            ),
+        ).model_copy(update={"metadata": {
+            "chosen_slot_start": chosen.isoformat(),
+            "chosen_slot_technician_id": "7",
+        }})
+
+        result = await asyncio.wait_for(handle_ops_command(command), timeout=5)
+
+        assert result.status == OpsStatus.SUCCESS
+        assert result.data["partner_id"] == 42
+        assert appointment_service.create_appointment.await_args.kwargs["partner_id"] == 42
+
+
+class TestSharedOdooServices:
+    """Tests for reusing Odoo services across OPS commands."""
+
+    @pytest.mark.asyncio
+    async def test_services_reused_until_expiry(self, monkeypatch):
+        """The appointment service is created once and rebuilt after the TTL."""
+        from src.brains.ops import handlers
+
+        factory = AsyncMock(side_effect=lambda: MagicMock())
+        monkeypatch.setattr(
+            "src.integrations.odoo_appointments.create_appointment_service", factory
+        )
+
+        first = await handlers._get_appointment_service()
+        assert await handlers._get_appointment_service() is first
+        assert factory.await_count == 1
+
+        monkeypatch.setattr(handlers, "OPS_SERVICE_TTL_SECONDS", 0.0)
+        handlers.reset_ops_services()
+        await handlers._get_appointment_service()
+        assert await handlers._get_appointment_service() is not first
+        assert factory.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_technician_roster_cached_per_service(self):
+        """The live roster is read once per service until invalidated."""
+        from src.brains.ops import handlers
+
+        service = MagicMock()
+        service.get_live_technicians = AsyncMock(
+            return_value=[{"id": 7, "name": "Aubry"}, {"id": None, "name": "Office"}]
+        )
+
+        first = await handlers._candidate_technicians(service, "75001", False)
+        second = await handlers._candidate_technicians(service, "75002", True)
+        assert first == second == [{"id": 7, "name": "Aubry"}]
+        assert service.get_live_technicians.await_count == 1
+
+        other = MagicMock()
+        other.get_live_technicians = AsyncMock(return_value=[])
+        assert await handlers._candidate_technicians(other, "75001", False) == []
+
+        handlers.invalidate_tech_cache()
+        await handlers._candidate_technicians(service, "75001", False)
+        assert service.get_live_technicians.await_count == 2
+
+
 # =============================================================================
 # STATUS UPDATE HANDLER TESTS
 # =============================================================================
@@ -5,6 +5,7 @@ Unit tests for OPS brain emergency and scheduling rules.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime, time, timedelta
 
 from src.hael.schema import UrgencyLevel
@@ -107,6 +108,30 @@ class TestEmergencyRules:
         )
         assert result.is_emergency is False
 
+    def test_first_listed_keyword_is_reported(self):
+        """With several keywords present, the reason names the first listed one."""
+        result = qualify_emergency(
+            problem_description="There is smoke and I smell gas near the unit",
+            urgency_level=UrgencyLevel.UNKNOWN,
+        )
+        assert result.is_emergency is True
+        assert result.reason == "Emergency condition detected: smell gas"
+
+    def test_constant_results_are_shared_and_frozen(self):
+        """Non-keyword outcomes reuse immutable module-level results."""
+        first = qualify_emergency("My AC needs a tune-up", UrgencyLevel.LOW)
+        second = qualify_emergency("Filter change", UrgencyLevel.MEDIUM)
+        assert first is second
+        with pytest.raises(FrozenInstanceError):
+            first.is_emergency = True
+
+    def test_keyword_result_cached_on_normalized_description(self):
+        """Casing/whitespace variants of a description share one cached result."""
+        first = qualify_emergency("Water DAMAGE in the attic", UrgencyLevel.UNKNOWN)
+        second = qualify_emergency("  water damage in the attic ", UrgencyLevel.UNKNOWN)
+        assert first is second
+        assert first.reason == "Emergency condition detected: water damage"
+
 
 class TestSchedulingRules:
     """Tests for scheduling rules."""
@@ -4,11 +4,13 @@ HAES HVAC - Vapi Server URL Tests
 Tests for the Vapi Server URL endpoint (/vapi/server).
 """
 
+import asyncio
 import json
 import hashlib
 import hmac
 import time
 from unittest.mock import patch
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
@@ -153,6 +155,71 @@ class TestVapiServerToolCalls:
         data = response.json()
         assert data["results"] == []
 
+    def test_tool_calls_multiple_preserve_order(self, client, mock_settings):
+        """Multiple tool calls return one result each, in request order."""
+        payload = {
+            "message": {
+                "type": "tool-calls",
+                "call": {"id": "call_multi"},
+                "toolCallList": [
+                    {"id": "tc_multi_1", "name": "unknown_tool_a", "parameters": {}},
+                    {"id": "tc_multi_2", "name": "unknown_tool_b", "parameters": {}},
+                ]
+            }
+        }
+        
+        response = client.post("/vapi/server", json=payload)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["toolCallId"] for r in data["results"]] == ["tc_multi_1", "tc_multi_2"]
+        assert "unknown_tool_b" in json.loads(data["results"][1]["result"])["data"]["error"]
+
+    def test_tool_call_exception_is_isolated(self, client, mock_settings):
+        """A failing tool call yields an error result without dropping the others."""
+        payload = {
+            "message": {
+                "type": "tool-calls",
+                "call": {"id": "call_multi_err"},
+                "toolCallList": [
+                    {"id": "tc_err_1", "name": "hael_route", "parameters": {"user_text": "AC broken"}},
+                    {"id": "tc_err_2", "name": "unknown_tool", "parameters": {}},
+                ]
+            }
+        }
+        
+        with patch("src.api.vapi_server.execute_hael_route", side_effect=RuntimeError("boom")):
+            response = client.post("/vapi/server", json=payload)
+        
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 2
+        first = json.loads(results[0]["result"])
+        assert first["action"] == "error"
+        assert first["data"]["error"] == "boom"
+        assert json.loads(results[1]["result"])["action"] == "error"
+
+    def test_cancelled_tool_call_is_isolated(self, client, mock_settings):
+        """A cancelled tool call yields an error result instead of failing the batch."""
+        payload = {
+            "message": {
+                "type": "tool-calls",
+                "call": {"id": f"call_cancel_{uuid4()}"},
+                "toolCallList": [
+                    {"id": "tc_cancel_1", "name": "hael_route", "parameters": {"user_text": "AC broken"}},
+                    {"id": "tc_cancel_2", "name": "unknown_tool", "parameters": {}},
+                ]
+            }
+        }
+        
+        with patch("src.api.vapi_server.execute_hael_route", side_effect=asyncio.CancelledError()):
+            response = client.post("/vapi/server", json=payload)
+        
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["toolCallId"] for r in results] == ["tc_cancel_1", "tc_cancel_2"]
+        assert json.loads(results[0]["result"])["action"] == "error"
+
 
 class TestVapiServerTransfer:
     """Tests for transfer-destination-request message type."""
@@ -233,6 +300,26 @@ class TestVapiServerOtherMessages:
         data = response.json()
         assert data["status"] == "ok"
 
+    def test_end_of_call_incomplete_runs_in_background(self, client, mock_settings):
+        """Incomplete calls hand lead/SMS follow-up to a background task."""
+        payload = {
+            "message": {
+                "type": "end-of-call-report",
+                "call": {"id": "call_incomplete", "customer": {"number": "+19725551234"}},
+                "summary": "",
+                "durationSeconds": 12,
+                "endedReason": "hangup"
+            }
+        }
+        
+        with patch("src.api.vapi_server._handle_incomplete_call") as mock_handle:
+            response = client.post("/vapi/server", json=payload)
+        
+        assert response.json() == {"status": "ok"}
+        mock_handle.assert_called_once()
+        assert mock_handle.call_args.kwargs["call_id"] == "call_incomplete"
+        assert mock_handle.call_args.kwargs["ended_reason"] == "hangup"
+
     def test_status_update(self, client, mock_settings):
         """Test status-update message type."""
         payload = {
@@ -280,6 +367,16 @@ class TestVapiServerOtherMessages:
         data = response.json()
         assert data["status"] == "ok"
 
+    @pytest.mark.parametrize("message_type", [["tool-calls"], {"name": "tool-calls"}])
+    def test_unhashable_message_type(self, client, mock_settings, message_type):
+        """A list or dict message type is acknowledged as unknown."""
+        payload = {"message": {"type": message_type, "call": {"id": "call_bad_type"}}}
+        
+        response = client.post("/vapi/server", json=payload)
+        
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
 
 class TestVapiServerHealth:
     """Tests for the health check endpoint."""
@@ -384,9 +481,287 @@ class TestBusinessHoursLogic:
             # This is a structural test to ensure function exists
             assert callable(is_business_hours)
 
+    @pytest.mark.parametrize("in_business_hours", [True, False])
+    def test_transfer_bodies_match_destination(self, in_business_hours):
+        """Pre-serialized transfer bodies match the live transfer destination."""
+        import orjson
+        from src.api.vapi_server import _TRANSFER_DESTINATION_BODIES, get_transfer_destination
+
+        with patch("src.api.vapi_server.is_business_hours", return_value=in_business_hours):
+            response = get_transfer_destination()
+
+        body = orjson.loads(_TRANSFER_DESTINATION_BODIES[in_business_hours])
+        if in_business_hours:
+            assert body == {"destination": response.destination.model_dump()}
+        else:
+            assert body == {"error": "after_hours", "message": response.message}
+
     def test_transfer_number_format(self):
         """Test transfer number is properly formatted."""
         from src.api.vapi_server import TRANSFER_NUMBER
         
         assert TRANSFER_NUMBER.startswith("+1")
         assert len(TRANSFER_NUMBER) == 12  # +1 + 10 digits
+
+
+class TestRequestCanonicalization:
+    """Tests for structured request_type/urgency canonicalization."""
+
+    def test_known_request_type_and_urgency(self):
+        """Known values map to intent, urgency and high confidence."""
+        from src.api.vapi_server import _canonicalize_request
+        from src.hael.schema import Intent, UrgencyLevel
+
+        assert _canonicalize_request("service_request", "emergency") == (
+            Intent.SERVICE_REQUEST, UrgencyLevel.EMERGENCY, 0.9,
+        )
+
+    def test_unknown_urgency_defaults_to_medium(self):
+        """Unknown urgency keeps the request_type intent and maps to MEDIUM."""
+        from src.api.vapi_server import _canonicalize_request
+        from src.hael.schema import Intent, UrgencyLevel
+
+        assert _canonicalize_request("quote_request", "whenever") == (
+            Intent.QUOTE_REQUEST, UrgencyLevel.MEDIUM, 0.9,
+        )
+
+    def test_unknown_request_type_keeps_extracted_intent(self):
+        """Unknown request_type returns no intent override."""
+        from src.api.vapi_server import _canonicalize_request
+        from src.hael.schema import UrgencyLevel
+
+        assert _canonicalize_request("mystery", "today") == (None, UrgencyLevel.HIGH, None)
+
+
+class TestPhoneNormalization:
+    """Tests for structured phone normalization."""
+
+    def test_strips_formatting(self):
+        """Formatting characters are removed, digits and + are kept."""
+        from src.api.vapi_server import _normalize_phone
+
+        assert _normalize_phone("+1 (972) 555-1234") == "+19725551234"
+
+    def test_non_ascii_input(self):
+        """Non-ASCII separators are removed as well."""
+        from src.api.vapi_server import _normalize_phone
+
+        assert _normalize_phone("972‑555‑1234") == "9725551234"
+
+
+class TestIntCoercion:
+    """Tests for structured numeric parameter coercion."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [(72, 72), ("72", 72), (72.9, 72), (None, None), ("warm", None), ("72.5", None), ([], None)],
+    )
+    def test_coerce_int(self, value, expected):
+        """Ints pass through, numeric strings/floats convert, anything else is None."""
+        from src.api.vapi_server import _coerce_int
+
+        assert _coerce_int(value) == expected
+
+
+class TestAfterHoursLogic:
+    """Tests for after-hours/weekend pricing flags."""
+
+    @pytest.mark.parametrize(
+        "local_time,expected",
+        [
+            ((2026, 1, 7, 10, 0), (False, False)),  # Wednesday morning
+            ((2026, 1, 7, 19, 0), (True, False)),   # Wednesday evening
+            ((2026, 1, 10, 12, 0), (False, True)),  # Saturday noon
+        ],
+    )
+    def test_after_hours_or_weekend(self, local_time, expected):
+        """Flags are derived from Chicago local time of the given second."""
+        from datetime import datetime
+        from src.api.vapi_server import BUSINESS_TZ, _after_hours_or_weekend_at
+
+        epoch = int(datetime(*local_time, tzinfo=BUSINESS_TZ).timestamp())
+        assert _after_hours_or_weekend_at(epoch) == expected
+
+    def test_uses_current_second(self):
+        """is_after_hours_or_weekend resolves the current whole second."""
+        from src.api.vapi_server import _after_hours_or_weekend_at, is_after_hours_or_weekend
+
+        with patch("src.api.vapi_server.time.time", return_value=1767801600.7):
+            assert is_after_hours_or_weekend() == _after_hours_or_weekend_at(1767801600)
+
+    @pytest.mark.parametrize(
+        "local_time,expected",
+        [
+            ((2026, 1, 7, 7, 59), False),   # Wednesday before opening
+            ((2026, 1, 7, 8, 0), True),     # Wednesday opening
+            ((2026, 1, 7, 16, 59), True),   # Wednesday last open minute
+            ((2026, 1, 7, 17, 0), False),   # Wednesday closing
+            ((2026, 1, 10, 12, 0), False),  # Saturday noon
+            ((2026, 7, 8, 10, 30), True),   # Wednesday during DST
+        ],
+    )
+    def test_is_business_hours(self, local_time, expected):
+        """Business hours follow Chicago local time, including across DST."""
+        from datetime import datetime
+        from src.api.vapi_server import BUSINESS_TZ, is_business_hours
+
+        epoch = datetime(*local_time, tzinfo=BUSINESS_TZ).timestamp()
+        with patch("src.api.vapi_server.time.time", return_value=epoch):
+            assert is_business_hours() is expected
+
+
+class TestTranscriptPatterns:
+    """Tests for the precompiled incomplete-call transcript patterns."""
+
+    def test_name_pattern(self):
+        """Names are captured after an introduction phrase."""
+        from src.api.vapi_server import _NAME_RE
+
+        match = _NAME_RE.search("Hello, my name is Jane Doe.")
+        assert match.group(1) == "Jane Doe"
+
+    def test_address_pattern(self):
+        """Street addresses with city, state and ZIP are captured."""
+        from src.api.vapi_server import _ADDR_RE
+
+        match = _ADDR_RE.search("I'm at 123 Main Street, Dallas TX 75201 today")
+        assert match.group(1) == "123 Main Street, Dallas TX 75201"
+
+    def test_phone_pattern(self):
+        """Ten or eleven digit phone numbers are captured."""
+        from src.api.vapi_server import _PHONE_RE
+
+        assert _PHONE_RE.search("call me at 19725551234").group(1) == "19725551234"
+
+
+class TestMessageTypePeek:
+    """Tests for peeking at the message type without decoding the body."""
+
+    def test_peeks_first_type(self):
+        """The message type is read from the raw payload prefix."""
+        from src.api.vapi_server import _peek_message_type
+
+        body = json.dumps({"message": {"type": "transcript", "call": {"type": "webCall"}}}).encode()
+        assert _peek_message_type(body) == b"transcript"
+
+    def test_type_not_leading_key(self):
+        """A message.type that does not lead the payload is not reported."""
+        from src.api.vapi_server import _peek_message_type
+
+        body = json.dumps({"message": {"padding": "x" * 1024, "type": "transcript"}}).encode()
+        assert _peek_message_type(body) is None
+
+    def test_nested_type_before_message_type(self):
+        """A nested "type" ahead of message.type is never taken as the message type."""
+        from src.api.vapi_server import _peek_message_type
+
+        body = json.dumps({
+            "message": {
+                "artifact": {"messages": [{"type": "transcript"}]},
+                "type": "end-of-call-report",
+            }
+        }).encode()
+        assert _peek_message_type(body) is None
+
+    def test_nested_type_message_still_processed(self, client, mock_settings):
+        """A message with a nested transcript "type" reaches its real handler."""
+        with patch("src.api.vapi_server.is_business_hours", return_value=True):
+            response = client.post(
+                "/vapi/server",
+                json={
+                    "message": {
+                        "artifact": {"messages": [{"type": "transcript"}]},
+                        "type": "transfer-destination-request",
+                        "call": {"id": "call_nested_type"},
+                    }
+                },
+            )
+
+        assert response.status_code == 200
+        assert response.json()["destination"]["type"] == "number"
+
+    def test_ack_only_skips_invalid_body(self, client, mock_settings):
+        """Acknowledged-only messages are answered without decoding the rest."""
+        response = client.post(
+            "/vapi/server",
+            content=b'{"message": {"type": "conversation-update", "messages": [',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+
+class TestToolInfoExtraction:
+    """Tests for extracting tool name, id and parameters from Vapi formats."""
+
+    @pytest.mark.parametrize(
+        "item",
+        [
+            {"name": "hael_route", "toolCall": {"id": "tc_1", "parameters": {"a": 1}}},
+            {"toolCall": {"id": "tc_1", "function": {"name": "hael_route", "arguments": {"a": 1}}}},
+            {"id": "tc_1", "function": {"name": "hael_route", "arguments": {"a": 1}}},
+            {"id": "tc_1", "name": "hael_route", "parameters": {"a": 1}},
+        ],
+    )
+    def test_formats(self, item):
+        """Every supported format resolves to the same tool info."""
+        from src.api.vapi_server import _extract_tool_info
+
+        assert _extract_tool_info(item) == ("hael_route", "tc_1", {"a": 1})
+
+    def test_falls_back_across_formats(self):
+        """Fields missing from the nested format are filled from the item."""
+        from src.api.vapi_server import _extract_tool_info
+
+        item = {"id": "tc_1", "name": "hael_route", "toolCall": {"arguments": {"a": 1}}}
+        assert _extract_tool_info(item) == ("hael_route", "tc_1", {"a": 1})
+
+    def test_empty_item(self):
+        """An empty item yields empty defaults."""
+        from src.api.vapi_server import _extract_tool_info
+
+        assert _extract_tool_info({}) == ("", "", {})
+
+    def test_tool_call_list_uses_arguments(self):
+        """toolCallList items fall back to "arguments" for their parameters."""
+        from src.api.vapi_server import _extract_tool_call_list_info
+
+        item = {"id": "tc_1", "name": "hael_route", "arguments": {"a": 1}}
+        assert _extract_tool_call_list_info(item) == ("hael_route", "tc_1", {"a": 1})
+
+
+class TestIdempotencyCache:
+    """Tests for the in-process completed tool result cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from src.api.vapi_server import _idempotency_cache
+
+        _idempotency_cache.clear()
+        yield
+        _idempotency_cache.clear()
+
+    def test_round_trip(self):
+        """Cached results are returned until they expire."""
+        from src.api.vapi_server import _cache_tool_result, _get_cached_tool_result
+
+        with patch("src.api.vapi_server.time.monotonic", return_value=100.0):
+            _cache_tool_result("key", {"speak": "ok"})
+            assert _get_cached_tool_result("key") == {"speak": "ok"}
+        with patch("src.api.vapi_server.time.monotonic", return_value=100.0 + 301):
+            assert _get_cached_tool_result("key") is None
+
+    def test_evicts_least_recently_used(self):
+        """Overflow drops the least recently used entry."""
+        from src.api.vapi_server import _cache_tool_result, _get_cached_tool_result
+
+        with patch("src.api.vapi_server.IDEMPOTENCY_CACHE_MAXSIZE", 2):
+            _cache_tool_result("a", {"speak": "a"})
+            _cache_tool_result("b", {"speak": "b"})
+            _get_cached_tool_result("a")
+            _cache_tool_result("c", {"speak": "c"})
+
+        assert _get_cached_tool_result("b") is None
+        assert _get_cached_tool_result("a") == {"speak": "a"}
+        assert _get_cached_tool_result("c") == {"speak": "c"}
@@ -13,6 +13,7 @@ import hashlib
 import hmac
 import time
 from unittest.mock import patch, MagicMock
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
@@ -711,7 +712,7 @@ class TestOdooLeadCreation:
 
     def test_service_request_includes_odoo_data(self, client, mock_settings):
         """Service request should include odoo data in response when successful."""
-        with patch("src.integrations.odoo_leads.upsert_lead_for_call") as mock_upsert:
+        with patch("src.api.vapi_server.upsert_lead_for_call") as mock_upsert:
             mock_upsert.return_value = {
                 "lead_id": 123,
                 "action": "created",
@@ -753,7 +754,7 @@ class TestOdooLeadCreation:
 
     def test_service_request_handles_odoo_failure(self, client, mock_settings):
         """Service request should handle Odoo failure gracefully."""
-        with patch("src.integrations.odoo_leads.upsert_lead_for_call") as mock_upsert:
+        with patch("src.api.vapi_server.upsert_lead_for_call") as mock_upsert:
             mock_upsert.return_value = {
                 "lead_id": None,
                 "action": "failed",
@@ -795,7 +796,7 @@ class TestOdooLeadCreation:
 
     def test_service_request_passes_correct_params_to_odoo(self, client, mock_settings):
         """Should pass correct parameters to Odoo lead upsert."""
-        with patch("src.integrations.odoo_leads.upsert_lead_for_call") as mock_upsert:
+        with patch("src.api.vapi_server.upsert_lead_for_call") as mock_upsert:
             mock_upsert.return_value = {
                 "lead_id": 789,
                 "action": "created",
@@ -834,7 +835,7 @@ class TestOdooLeadCreation:
 
     def test_quote_request_creates_lead(self, client, mock_settings):
         """Quote request should also create a lead."""
-        with patch("src.integrations.odoo_leads.upsert_lead_for_call") as mock_upsert:
+        with patch("src.api.vapi_server.upsert_lead_for_call") as mock_upsert:
             mock_upsert.return_value = {
                 "lead_id": 200,
                 "action": "created",
@@ -871,7 +872,7 @@ class TestOdooLeadCreation:
 
     def test_billing_inquiry_does_not_create_lead(self, client, mock_settings):
         """Billing inquiry should NOT create a lead."""
-        with patch("src.integrations.odoo_leads.upsert_lead_for_call") as mock_upsert:
+        with patch("src.api.vapi_server.upsert_lead_for_call") as mock_upsert:
             payload = {
                 "message": {
                     "type": "tool-calls",
@@ -1445,7 +1446,7 @@ class TestAppointmentScheduling:
     """Tests for appointment scheduling via Vapi tool calls, including CRM lead linking and technician assignment."""
 
     @patch("src.integrations.odoo_appointments.create_appointment_service")
-    @patch("src.integrations.odoo_leads.upsert_lead_for_call")
+    @patch("src.api.vapi_server.upsert_lead_for_call")
     def test_schedule_appointment_creates_calendar_event(self, mock_lead_upsert, mock_appointment_service, client, mock_settings):
         """Schedule appointment should create calendar event in Odoo and link to CRM lead."""
         from unittest.mock import AsyncMock
@@ -1496,7 +1497,8 @@ class TestAppointmentScheduling:
             }
         }
         
-        response = client.post("/vapi/server", json=payload)
+        with patch("src.api.vapi_server.create_appointment_service", mock_appointment_service):
+            response = client.post("/vapi/server", json=payload)
         
         assert response.status_code == 200
         data = response.json()
@@ -1516,7 +1518,7 @@ class TestAppointmentScheduling:
             )
 
     @patch("src.integrations.odoo_appointments.create_appointment_service")
-    @patch("src.integrations.odoo_leads.upsert_lead_for_call")
+    @patch("src.api.vapi_server.upsert_lead_for_call")
     def test_schedule_appointment_includes_appointment_details(self, mock_lead_upsert, mock_appointment_service, client, mock_settings):
         """Schedule appointment should include appointment details in response."""
         from unittest.mock import AsyncMock
@@ -1564,7 +1566,8 @@ class TestAppointmentScheduling:
             }
         }
         
-        response = client.post("/vapi/server", json=payload)
+        with patch("src.api.vapi_server.create_appointment_service", mock_appointment_service):
+            response = client.post("/vapi/server", json=payload)
         
         assert response.status_code == 200
         data = response.json()
@@ -1692,7 +1695,7 @@ class TestAppointmentScheduling:
             assert "cancel" in result["speak"].lower() or "appointment" in result["speak"].lower()
 
     @patch("src.integrations.odoo_appointments.create_appointment_service")
-    @patch("src.integrations.odoo_leads.upsert_lead_for_call")
+    @patch("src.api.vapi_server.upsert_lead_for_call")
     def test_appointment_linked_to_crm_lead(self, mock_lead_upsert, mock_appointment_service, client, mock_settings):
         """Appointment should be linked to CRM lead after lead creation."""
         from unittest.mock import AsyncMock
@@ -1740,7 +1743,8 @@ class TestAppointmentScheduling:
             }
         }
         
-        response = client.post("/vapi/server", json=payload)
+        with patch("src.api.vapi_server.create_appointment_service", mock_appointment_service):
+            response = client.post("/vapi/server", json=payload)
         
         assert response.status_code == 200
         
@@ -1754,3 +1758,232 @@ class TestAppointmentScheduling:
             assert "appointment_id" in result["data"] or "appointment" in result["data"]
             # Should have Odoo lead info
             assert "odoo" in result["data"]
+
+
+class TestEmergencyNotifications:
+    """Tests for emergency SMS + staff email fan-out in hael_route."""
+
+    @staticmethod
+    def _emergency_ops_result():
+        from src.brains.ops.schema import OpsResult, OpsStatus
+
+        return OpsResult(
+            status=OpsStatus.SUCCESS,
+            message="Emergency service request received.",
+            data={
+                "is_emergency": True,
+                "emergency_reason": "No heat below 55F",
+                "assigned_technician": {"id": "junior", "name": "Junior"},
+                "eta_window_hours_min": 1.5,
+                "eta_window_hours_max": 3.0,
+            },
+        )
+
+    async def test_emergency_sends_sms_and_staff_email(self):
+        """Both notifications are sent and their results land in the response data."""
+        from unittest.mock import AsyncMock
+        from src.api.vapi_server import execute_hael_route
+        from src.hael import Brain
+
+        with patch.dict("src.brains.dispatch.BRAIN_HANDLERS", {Brain.OPS: (True, AsyncMock(return_value=self._emergency_ops_result()))}), \
+             patch("src.api.vapi_server.upsert_lead_for_call", AsyncMock(return_value={
+                 "status": "success", "lead_id": 42, "action": "created", "partner_id": 7,
+             })), \
+             patch("src.api.vapi_server._FEATURE_EMERGENCY_SMS", True), \
+             patch("src.api.vapi_server.send_emergency_sms", AsyncMock(return_value={"status": "sent"})) as mock_sms, \
+             patch("src.api.vapi_server.send_emergency_staff_notification", AsyncMock(return_value={"status": "sent"})) as mock_email, \
+             patch("src.api.vapi_server.log_event_nowait"):
+            result = await execute_hael_route(
+                parameters={
+                    "request_type": "service_request",
+                    "customer_name": "Pat Doe",
+                    "phone": "+19725551234",
+                    "address": "123 Main St, Dallas, TX 75201",
+                    "issue_description": "No heat and it's 40 degrees inside",
+                    "urgency": "emergency",
+                },
+                tool_call_id="tc_emerg",
+                call_id="call_emerg",
+            )
+
+        assert result["action"] == "completed"
+        assert result["data"]["sms"] == {"status": "sent"}
+        assert result["data"]["staff_notifications"] == {"status": "sent"}
+        assert mock_sms.await_args.kwargs["tech_name"] == "Junior"
+        assert mock_email.await_args.kwargs["lead_id"] == 42
+
+    async def test_sms_failure_does_not_block_staff_email(self):
+        """A failing SMS is reported without losing the staff email result."""
+        from unittest.mock import AsyncMock
+        from src.api.vapi_server import execute_hael_route
+        from src.hael import Brain
+
+        with patch.dict("src.brains.dispatch.BRAIN_HANDLERS", {Brain.OPS: (True, AsyncMock(return_value=self._emergency_ops_result()))}), \
+             patch("src.api.vapi_server.upsert_lead_for_call", AsyncMock(return_value={
+                 "status": "success", "lead_id": 42, "action": "created", "partner_id": 7,
+             })), \
+             patch("src.api.vapi_server._FEATURE_EMERGENCY_SMS", True), \
+             patch("src.api.vapi_server.send_emergency_sms", AsyncMock(side_effect=RuntimeError("twilio down"))), \
+             patch("src.api.vapi_server.send_emergency_staff_notification", AsyncMock(return_value={"status": "sent"})), \
+             patch("src.api.vapi_server.log_event_nowait"):
+            result = await execute_hael_route(
+                parameters={
+                    "request_type": "service_request",
+                    "customer_name": "Pat Doe",
+                    "phone": "+19725551234",
+                    "address": "123 Main St, Dallas, TX 75201",
+                    "issue_description": "No heat",
+                    "urgency": "emergency",
+                },
+                tool_call_id="tc_emerg_fail",
+                call_id="call_emerg_fail",
+            )
+
+        assert result["data"]["sms"] == {"status": "error", "error": "twilio down"}
+        assert result["data"]["staff_notifications"] == {"status": "sent"}
+
+
+class TestStructuredExtractionFastPath:
+    """Tests for skipping free-text extraction on fully structured hael_route calls."""
+
+    async def test_structured_only_skips_extractor(self):
+        """Explicit request_type with no free text does not run the extractor."""
+        from src.api.vapi_server import execute_hael_route
+        from src.hael.schema import Intent
+
+        with patch("src.api.vapi_server._EXTRACTOR") as mock_extractor, \
+             patch("src.brains.dispatch.route_command", side_effect=RuntimeError("stop")) as mock_route:
+            await execute_hael_route(
+                parameters={
+                    "request_type": "status_check",
+                    "customer_name": "Pat Doe",
+                    "phone": "(972) 555-1234",
+                    "address": "123 Main St, Dallas, TX 75201",
+                },
+                tool_call_id="tc_fast",
+                call_id=None,
+            )
+
+        mock_extractor.extract.assert_not_called()
+        extraction = mock_route.call_args.args[0]
+        assert extraction.intent == Intent.STATUS_UPDATE_REQUEST
+        assert extraction.confidence == 0.9
+        assert extraction.entities.phone == "9725551234"
+        assert extraction.entities.zip_code == "75201"
+
+    async def test_free_text_runs_extractor(self):
+        """Issue descriptions are still mined for entities like temperature."""
+        from src.api.vapi_server import execute_hael_route
+
+        with patch("src.brains.dispatch.route_command", side_effect=RuntimeError("stop")) as mock_route:
+            await execute_hael_route(
+                parameters={
+                    "request_type": "service_request",
+                    "customer_name": "Pat Doe",
+                    "phone": "9725551234",
+                    "address": "123 Main St, Dallas, TX 75201",
+                    "issue_description": "No heat and it's 50 degrees inside",
+                },
+                tool_call_id="tc_text",
+                call_id=None,
+            )
+
+        assert mock_route.call_args.args[0].entities.temperature_mentioned == 50
+
+    def test_repeated_text_reuses_extraction(self):
+        """Identical text is extracted once and each caller gets its own copy."""
+        from src.api.vapi_server import _extract, _extract_cached
+        from src.hael import RuleBasedExtractor
+
+        _extract_cached.cache_clear()
+        with patch("src.api.vapi_server._EXTRACTOR.extract", wraps=RuleBasedExtractor().extract) as mock_extract:
+            first = _extract("No heat at 123 Main St, Dallas, TX 75201")
+            first.entities.full_name = "Pat Doe"
+            second = _extract("No heat at 123 Main St, Dallas, TX 75201")
+
+        assert mock_extract.call_count == 1
+        assert second.entities.full_name is None
+        assert second.entities.zip_code == first.entities.zip_code
+        _extract_cached.cache_clear()
+
+
+class TestRouteResponseCache:
+    """Tests for the hael_route response cache on side-effect-free intents."""
+
+    @pytest.fixture(autouse=True)
+    def clear_route_cache(self):
+        from src.api.vapi_server import _route_cache
+
+        _route_cache.clear()
+        yield
+        _route_cache.clear()
+
+    async def test_informational_intent_is_cached(self):
+        """A repeated hiring question skips routing and gets a fresh request_id."""
+        from src.api.vapi_server import execute_hael_route
+
+        parameters = {
+            "request_type": "hiring_inquiry",
+            "user_text": "Are you hiring? I want to apply for a technician job",
+        }
+        first = await execute_hael_route(parameters=parameters, tool_call_id="tc_1", call_id=None)
+
+        with patch("src.brains.dispatch.route_command", side_effect=RuntimeError("stop")) as mock_route:
+            second = await execute_hael_route(
+                parameters=dict(reversed(parameters.items())),
+                tool_call_id="tc_2",
+                call_id=None,
+            )
+
+        mock_route.assert_not_called()
+        assert first["action"] == "completed"
+        assert second["speak"] == first["speak"]
+        assert second["data"] == first["data"]
+        assert second["request_id"] != first["request_id"]
+
+    async def test_lead_creating_intent_is_not_cached(self):
+        """Service requests always run the full pipeline."""
+        from src.api.vapi_server import _route_cache, execute_hael_route
+
+        with patch("src.brains.dispatch.route_command", side_effect=RuntimeError("stop")) as mock_route:
+            for tool_call_id in ("tc_1", "tc_2"):
+                await execute_hael_route(
+                    parameters={"request_type": "service_request", "phone": "9725551234"},
+                    tool_call_id=tool_call_id,
+                    call_id=None,
+                )
+
+        assert mock_route.call_count == 2
+        assert not _route_cache
+
+    def test_cache_shared_across_callers(self, client, mock_settings):
+        """Caller annotations and per-turn context do not split the cache key."""
+        def payload(call_id, caller_phone, context):
+            return {
+                "message": {
+                    "type": "tool-calls",
+                    "call": {"id": call_id, "customer": {"number": caller_phone}},
+                    "toolCallList": [
+                        {
+                            "id": f"tc_{call_id}",
+                            "name": "hael_route",
+                            "parameters": {
+                                "request_type": "hiring_inquiry",
+                                "user_text": "Are you hiring technicians?",
+                                "conversation_context": context,
+                            },
+                        }
+                    ],
+                }
+            }
+
+        first = client.post("/vapi/server", json=payload(str(uuid4()), "+19725550101", "Turn 1"))
+
+        with patch("src.brains.dispatch.route_command", side_effect=RuntimeError("stop")) as mock_route:
+            second = client.post("/vapi/server", json=payload(str(uuid4()), "+19725550202", "Turn 7"))
+
+        mock_route.assert_not_called()
+        first_result = json.loads(first.json()["results"][0]["result"])
+        second_result = json.loads(second.json()["results"][0]["result"])
+        assert first_result["action"] == "completed"
+        assert second_result["speak"] == first_result["speak"]
@@ -0,0 +1,67 @@
+"""
+HAES HVAC - Base Tool Handler Tests
+
+Tests for the shared conversation checks on BaseToolHandler.
+"""
+
+import pytest
+
+from src.vapi.tools.base import BaseToolHandler, ConversationSignal
+
+
+@pytest.fixture
+def handler():
+    return BaseToolHandler("create_service_request")
+
+
+class TestAnalyzeConversation:
+    """Tests for the single-pass conversation analysis."""
+    
+    def test_wrong_number_takes_priority(self, handler):
+        """Wrong number wins over profanity and multiple intents."""
+        signal, detail = handler.analyze_conversation(
+            conversation_context="Oh damn, wrong number, I wanted a quote for a repair",
+        )
+        
+        assert signal is ConversationSignal.WRONG_NUMBER
+        assert detail is None
+    
+    def test_profanity(self, handler):
+        """Profanity is detected case-insensitively."""
+        signal, _ = handler.analyze_conversation(user_text="This Is Bullshit")
+        
+        assert signal is ConversationSignal.PROFANITY
+        assert handler.detect_profanity_abuse(user_text="This Is Bullshit")
+    
+    def test_unclear_speech(self, handler):
+        """Low confidence returns the clarification response."""
+        signal, detail = handler.analyze_conversation(
+            user_text="my ac",
+            confidence="0.3",
+            retry_count="1",
+        )
+        
+        assert signal is ConversationSignal.UNCLEAR
+        assert detail.data["retry_count"] == 2
+    
+    def test_multiple_intents(self, handler):
+        """Multiple request types are reported in keyword-table order."""
+        text = "I need a repair and want to know how much a membership costs"
+        signal, detail = handler.analyze_conversation(user_text=text)
+        
+        assert signal is ConversationSignal.MULTI_INTENT
+        assert detail == ["service", "quote", "membership"]
+        assert handler.detect_multiple_intents(user_text=text) == detail
+    
+    def test_multiple_intents_can_be_skipped(self, handler):
+        """Prioritized requests skip multiple-intent detection."""
+        signal, _ = handler.analyze_conversation(
+            user_text="I need a repair and a quote",
+            check_multiple_intents=False,
+        )
+        
+        assert signal is ConversationSignal.NONE
+    
+    def test_empty_conversation(self, handler):
+        """No text and no confidence yields no signal."""
+        assert handler.analyze_conversation() == (ConversationSignal.NONE, None)
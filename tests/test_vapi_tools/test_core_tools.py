@@ -141,6 +141,25 @@ class TestGetPricing:
         assert response.action == "completed"
         assert response.data.get("pricing_tier") == "com" or response.data.get("diagnostic_fee") == 250.0
         assert response.data.get("diagnostic_fee") == 250.0
+    
+    @pytest.mark.asyncio
+    async def test_get_pricing_notes_not_shared(self):
+        """Response notes are a copy, so editing them cannot change later quotes."""
+        parameters = {"property_type": "residential", "is_emergency": True}
+        
+        first = await handle_get_pricing(
+            tool_call_id="tc_pricing_notes_1",
+            parameters=parameters,
+            call_id="call_pricing_notes",
+        )
+        first.data["notes"].append("edited")
+        second = await handle_get_pricing(
+            tool_call_id="tc_pricing_notes_2",
+            parameters=parameters,
+            call_id="call_pricing_notes",
+        )
+        
+        assert "edited" not in second.data["notes"]
 
 
 class TestCreateComplaint: